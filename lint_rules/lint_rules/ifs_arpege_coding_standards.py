@@ -48,19 +48,23 @@ class MissingImplicitNoneRule(GenericRule):
         ),
     }
 
+    node_types = (ir.Intrinsic,)
+
     _regex = re.compile(r'implicit\s+none\b', re.I)
 
+    @classmethod
+    def match_implicit_none(cls, intrinsics):
+        """
+        Check if any of the given intrinsic nodes matches the regex.
+        """
+        return any(cls._regex.match(intr.text) for intr in intrinsics)
+
     @classmethod
     def check_for_implicit_none(cls, ir_):
         """
         Check for intrinsic nodes that match the regex.
         """
-        for intr in FindNodes(ir.Intrinsic).visit(ir_):
-            if cls._regex.match(intr.text):
-                break
-        else:
-            return False
-        return True
+        return cls.match_implicit_none(FindNodes(ir.Intrinsic).visit(ir_))
 
     @classmethod
     def check_module(cls, module, rule_report, config):
@@ -73,12 +77,12 @@ class MissingImplicitNoneRule(GenericRule):
             rule_report.add('No `IMPLICIT NONE` found', module)
 
     @classmethod
-    def check_subroutine(cls, subroutine, rule_report, config, **kwargs):
+    def check_nodes(cls, subroutine, nodes, rule_report, config, **kwargs):
         """
         Check for ``IMPLICIT NONE`` in the subroutine's spec or an enclosing
         :any:`Module` scope.
         """
-        found_implicit_none = cls.check_for_implicit_none(subroutine.ir)
+        found_implicit_none = cls.match_implicit_none(nodes)
 
         # Check if enclosing scopes contain implicit none
         scope = subroutine.parent
@@ -217,16 +217,17 @@ class LimitSubroutineStatementsRule(GenericRule):  # Coding standards 2.2
         ir.Deallocation, ir.Nullify, ir.CallStatement
     )
 
+    node_types = exec_nodes
+
     # Pattern for intrinsic nodes that are allowed as non-executable statements
     match_non_exec_intrinsic_node = re.compile(r'\s*(?:PRINT|FORMAT)', re.I)
 
     @classmethod
-    def check_subroutine(cls, subroutine, rule_report, config, **kwargs):
+    def check_nodes(cls, subroutine, nodes, rule_report, config, **kwargs):
         '''Count the number of nodes in the subroutine and check if they exceed
         a given maximum number.
         '''
         # Count total number of executable nodes
-        nodes = FindNodes(cls.exec_nodes).visit(subroutine.ir)
         num_nodes = len(nodes)
         # Subtract number of non-exec intrinsic nodes
         intrinsic_nodes = filter(lambda node: isinstance(node, ir.Intrinsic), nodes)
@@ -274,10 +275,12 @@ class MplCdstringRule(GenericRule):  # Coding standards 3.12
         'title': 'Calls to MPL subroutines should provide a "CDSTRING" identifying the caller.',
     }
 
+    node_types = (ir.CallStatement,)
+
     @classmethod
-    def check_subroutine(cls, subroutine, rule_report, config, **kwargs):
+    def check_nodes(cls, subroutine, nodes, rule_report, config, **kwargs):
         '''Check all calls to MPL subroutines for a CDSTRING.'''
-        for call in FindNodes(ir.CallStatement).visit(subroutine.ir):
+        for call in nodes:
             if str(call.name).upper().startswith('MPL_'):
                 for kw, _ in call.kwarguments:
                     if kw.upper() == 'CDSTRING':
@@ -296,27 +299,31 @@ class ImplicitNoneRule(GenericRule):  # Coding standards 4.4
         'title': '"IMPLICIT NONE" is mandatory in all routines.',
     }
 
+    node_types = (ir.Intrinsic,)
+
     _regex = re.compile(r'implicit\s+none\b', re.I)
 
+    @staticmethod
+    def match_implicit_none(intrinsics):
+        """
+        Check if any of the given intrinsic nodes matches the regex.
+        """
+        return any(ImplicitNoneRule._regex.match(intr.text) for intr in intrinsics)
+
     @staticmethod
     def check_for_implicit_none(ast):
         """
         Check for intrinsic nodes that match the regex.
         """
-        for intr in FindNodes(ir.Intrinsic).visit(ast):
-            if ImplicitNoneRule._regex.match(intr.text):
-                break
-        else:
-            return False
-        return True
+        return ImplicitNoneRule.match_implicit_none(FindNodes(ir.Intrinsic).visit(ast))
 
     @classmethod
-    def check_subroutine(cls, subroutine, rule_report, config, **kwargs):
+    def check_nodes(cls, subroutine, nodes, rule_report, config, **kwargs):
         """
         Check for IMPLICIT NONE in the subroutine's spec or any enclosing
         scope.
         """
-        found_implicit_none = cls.check_for_implicit_none(subroutine.ir)
+        found_implicit_none = cls.match_implicit_none(nodes)
 
         # Check if enclosing scopes contain implicit none
         scope = subroutine.parent
@@ -445,10 +452,12 @@ class BannedStatementsRule(GenericRule):  # Coding standards 4.11
                    'FORMAT', 'COMMON', 'EQUIVALENCE'],
     }
 
+    node_types = (ir.Intrinsic,)
+
     @classmethod
-    def check_subroutine(cls, subroutine, rule_report, config, **kwargs):
+    def check_nodes(cls, subroutine, nodes, rule_report, config, **kwargs):
         '''Check for banned statements in intrinsic nodes.'''
-        for intr in FindNodes(ir.Intrinsic).visit(subroutine.ir):
+        for intr in nodes:
             for keyword in config['banned']:
                 if keyword.lower() in intr.text.lower():
                     rule_report.add(f'Banned keyword "{keyword}"', intr)
@@ -5,7 +5,7 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
-from importlib.metadata import version, PackageNotFoundError
+from importlib import import_module
 
 # Import the global configuration map
 from loki.config import *  # noqa
@@ -22,20 +22,78 @@ from loki.scope import *  # noqa
 from loki.tools import *  # noqa
 from loki.logging import *  # noqa
 from loki.backend import *  # noqa
-from loki.transform import * # noqa
-from loki.build import *  # noqa  # pylint: disable=redefined-builtin
-from loki.batch import *  # noqa
-from loki.lint import *  # noqa
 from loki.pragma_utils import *  # noqa
-from loki.analyse import *  # noqa
-from loki.dimension import *  # noqa
 
 
-try:
-    __version__ = version("loki")
-except PackageNotFoundError:
-    # package is not installed
-    pass
+# The remaining subpackages are imported lazily on first access of one of
+# their public names via the module-level ``__getattr__`` (PEP 562).
+# Note that the subpackages above can not be deferred, as the frontends
+# and the IR import each other.
+_lazy_exports = {
+    'transform': (
+        'Transformation', 'convert_to_lower_case', 'replace_intrinsics', 'sanitise_imports', 'replace_selected_kind',
+        'single_variable_declaration', 'recursive_expression_map_update', 'shift_to_zero_indexing',
+        'invert_array_indices', 'resolve_vector_notation', 'normalize_range_indexing', 'promote_variables',
+        'promote_nonmatching_variables', 'promotion_dimensions_from_loop_nest', 'demote_variables', 'flatten_arrays',
+        'normalize_array_shape_and_access', 'inline_constant_parameters', 'inline_elemental_functions',
+        'inline_internal_procedures', 'inline_member_procedures', 'inline_marked_subroutines', 'InlineTransformation',
+        'loop_interchange', 'loop_fusion', 'loop_fission', 'region_hoist', 'region_to_call', 'DependencyTransformation',
+        'ModuleWrapTransformation', 'FortranCTransformation', 'FortranMaxTransformation', 'FortranPythonTransformation',
+        'FileWriteTransformation', 'HoistVariablesAnalysis', 'HoistVariablesTransformation',
+        'HoistTemporaryArraysAnalysis', 'HoistTemporaryArraysTransformationAllocatable', 'ParametriseTransformation',
+        'extract_contained_procedures', 'extract_contained_procedure', 'dead_code_elimination',
+        'DeadCodeEliminationTransformer', 'SanitiseTransformation', 'resolve_associates',
+        'ResolveAssociatesTransformer', 'transform_sequence_association', 'transform_sequence_association_append_map',
+    ),
+    'build': (
+        'Obj', 'Header', 'workqueue', 'Lib', 'Binary', 'clean', 'compile', 'compile_and_load', 'Compiler',
+        'GNUCompiler', 'EscapeGNUCompiler', 'Builder', 'wait_and_check', 'MEMORY_URL', 'DEFAULT_TIMEOUT',
+    ),
+    'batch': (
+        'SchedulerConfig', 'TransformationConfig', 'ItemConfig', 'DiscoveryIndex', 'Item', 'FileItem', 'ModuleItem',
+        'ProcedureItem', 'TypeDefItem', 'InterfaceItem', 'ProcedureBindingItem', 'ExternalItem', 'ItemFactory',
+        'Scheduler', 'SFilter', 'SGraph',
+    ),
+    'lint': (
+        'Fixer', 'get_filename_from_parent', 'get_location_hash', 'get_disabled_rules',
+        'is_rule_disabled', 'RuleType', 'GenericRule',
+        'Linter', 'LinterTransformation', 'LintCache', 'lint_files', 'ProblemLocation', 'ProblemReport',
+        'RuleReport', 'FileReport', 'Reporter',
+        'GenericHandler', 'DefaultHandler', 'ViolationFileHandler', 'JunitXmlHandler', 'LazyTextfile',
+    ),
+    'analyse': (
+        'dataflow_analysis_attached', 'read_after_write_vars', 'loop_carried_dependencies',
+    ),
+    'dimension': ('Dimension',),
+}
+
+_lazy_names = {name: package for package, names in _lazy_exports.items() for name in names}
+
+
+def __getattr__(name):
+    """
+    Import the subpackage that provides :data:`name` on first access
+    """
+    if name == '__version__':
+        # Querying the package metadata is costly, hence deferred as well
+        from importlib.metadata import version, PackageNotFoundError  # pylint: disable=import-outside-toplevel
+        try:
+            return version('loki')
+        except PackageNotFoundError:
+            # package is not installed
+            raise AttributeError(f"module 'loki' has no attribute '{name}'") from None
+    if name in _lazy_names:
+        value = getattr(import_module(f'loki.{_lazy_names[name]}'), name)
+    elif name in _lazy_exports:
+        value = import_module(f'loki.{name}')
+    else:
+        raise AttributeError(f"module 'loki' has no attribute '{name}'")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_names) | set(_lazy_exports))
 
 
 # Add flag to trigger an initial print out of the global config
@@ -69,10 +127,21 @@ config.register('frontend-strict-mode', False, env_variable='LOKI_FRONTEND_STRIC
 config.register('disk-cache', False, env_variable='LOKI_DISK_CACHE',
                 preprocess=lambda i: bool(i) if isinstance(i, int) else i)
 
+# Persistent parse cache, which stores the IR of fully parsed source files in a
+# content-addressed cache directory to skip the frontend for unchanged files
+config.register('parse-cache-dir', None, env_variable='LOKI_PARSE_CACHE_DIR')
+
+# Maximum size of the parse cache in MiB before least-recently used entries are evicted
+config.register('parse-cache-size', 1024, env_variable='LOKI_PARSE_CACHE_SIZE', preprocess=int)
+
 # Force symbol comparison and object equality to be case sensitive
 config.register('case-sensitive', False, env_variable='LOKI_CASE_SENSITIVE',
                 preprocess=lambda i: bool(i) if isinstance(i, int) else i)
 
+# Skip the validation of IR node constructor arguments in frontends and transformers
+config.register('trusted-node-construction', True, env_variable='LOKI_TRUSTED_NODE_CONSTRUCTION',
+                preprocess=lambda i: bool(int(i)) if isinstance(i, str) else bool(i))
+
 # Specify a timeout for the REGEX frontend to catch catastrophic backtracking
 config.register('regex-frontend-timeout', 30, env_variable='LOKI_REGEX_FRONTEND_TIMEOUT', preprocess=int)
 
@@ -82,3 +151,6 @@ config.initialize()
 
 if config['print-config']:
     config.print_state()
+
+
+__all__ = [name for name in globals() if not name.startswith('_')] + list(_lazy_names)
@@ -13,7 +13,7 @@ from contextlib import contextmanager
 from loki.expression import FindVariables, Array, FindInlineCalls
 from loki.tools import as_tuple, flatten
 from loki.types import BasicType
-from loki.ir import Visitor, Transformer
+from loki.ir import Node, Visitor, Transformer
 from loki.subroutine import Subroutine
 from loki.tools.util import CaseInsensitiveDict
 
@@ -23,49 +23,127 @@ __all__ = [
 ]
 
 
+class SymbolIndex:
+    """
+    Index that interns symbols to integer ids, which allows to represent
+    sets of symbols as bitsets in Python integers
+
+    Symbols are compared by their usual equality semantics, i.e., two
+    symbols that compare equal are assigned the same id.
+    """
+
+    def __init__(self):
+        self.symbols = []
+        self.ids = {}
+
+    def encode(self, symbols):
+        """
+        Return the bitset for the given symbols, assigning new ids as required
+        """
+        bits = 0
+        for symbol in symbols:
+            idx = self.ids.get(symbol)
+            if idx is None:
+                idx = self.ids[symbol] = len(self.symbols)
+                self.symbols.append(symbol)
+            bits |= 1 << idx
+        return bits
+
+    def decode(self, bits):
+        """
+        Return the set of symbols for the given bitset
+        """
+        symbols = set()
+        while bits:
+            lowest = bits & -bits
+            symbols.add(self.symbols[lowest.bit_length() - 1])
+            bits ^= lowest
+        return symbols
+
+
+class SymbolBitset:
+    """
+    Set of symbols, represented as a bitset of ids in a :any:`SymbolIndex`
+
+    This is attached to IR nodes by :any:`DataflowAnalysisAttacher` and
+    converted to a :any:`set` of symbols on first access of the
+    corresponding property, e.g., :attr:`Node.live_symbols`.
+    """
+
+    __slots__ = ('index', 'bits')
+
+    def __init__(self, index, bits):
+        self.index = index
+        self.bits = bits
+
+    def __iter__(self):
+        return iter(self.index.decode(self.bits))
+
+
 class DataflowAnalysisAttacher(Transformer):
     """
     Analyse and attach in-place the definition, use and live status of
     symbols.
+
+    Internally, all sets of symbols are represented as bitsets of symbol ids
+    in a :any:`SymbolIndex`, which is shared by all nodes analysed by the
+    same attacher.
     """
 
     # group of functions that only query memory properties and don't read/write variable value
     _mem_property_queries = ('size', 'lbound', 'ubound', 'present')
 
+    # Expression finders are stateless and can be shared
+    _find_variables = FindVariables()
+    _find_inline_calls = FindInlineCalls()
+
     def __init__(self, **kwargs):
         super().__init__(inplace=True, invalidate_source=False, **kwargs)
+        self.index = SymbolIndex()
+        self._symbol_map = {}
 
     # Utility routines
 
-    def _visit_body(self, body, live=None, defines=None, uses=None, **kwargs):
+    def _visit_body(self, body, live=0, defines=0, uses=0, **kwargs):
         """
         Iterate through the tuple that is a body and update defines and
         uses along the way.
         """
-        if live is None:
-            live = set()
-        if defines is None:
-            defines = set()
-        if uses is None:
-            uses = set()
         visited = []
         for i in flatten(body):
             visited += [self.visit(i, live_symbols=live|defines, **kwargs)]
-            uses |= visited[-1].uses_symbols.copy() - defines
-            defines |= visited[-1].defines_symbols.copy()
+            uses |= visited[-1].__dict__['_uses_symbols'].bits & ~defines
+            defines |= visited[-1].__dict__['_defines_symbols'].bits
         return as_tuple(visited), defines, uses
 
-    @staticmethod
-    def _symbols_from_expr(expr, condition=None):
+    def _symbol(self, var):
+        """
+        Return the symbol for a variable, i.e., the variable without dimensions.
+        """
+        symbol = self._symbol_map.get(var)
+        if symbol is None:
+            symbol = self._symbol_map[var] = var.clone(dimensions=None)
+        return symbol
+
+    def _symbols_from_expr(self, expr, condition=None):
         """
         Return set of symbols found in an expression.
         """
         if condition is not None:
-            return {v.clone(dimensions=None) for v in FindVariables().visit(expr) if condition(v)}
-        return {v.clone(dimensions=None) for v in FindVariables().visit(expr)}
+            return {self._symbol(v) for v in self._find_variables.visit(expr) if condition(v)}
+        return {self._symbol(v) for v in self._find_variables.visit(expr)}
 
-    @classmethod
-    def _symbols_from_lhs_expr(cls, expr):
+    def _query_args(self, expr):
+        """
+        Return the arguments to functions in an expression that only query
+        memory attributes of a variable.
+        """
+        mem_calls = as_tuple(
+            i for i in self._find_inline_calls.visit(expr) if i.function in self._mem_property_queries
+        )
+        return as_tuple(flatten(self._find_variables.visit(i.parameters) for i in mem_calls))
+
+    def _symbols_from_lhs_expr(self, expr):
         """
         Determine symbol use and symbol definition from a left-hand side expression.
 
@@ -79,8 +157,8 @@ class DataflowAnalysisAttacher(Transformer):
         (defines, uses) : (set, set)
             The sets of defined and used symbols (in that order).
         """
-        defines = {expr.clone(dimensions=None)}
-        uses = cls._symbols_from_expr(getattr(expr, 'dimensions', ()))
+        defines = {self._symbol(expr)}
+        uses = self._symbols_from_expr(getattr(expr, 'dimensions', ()))
         return defines, uses
 
     # Abstract node (also called from every node type for integration)
@@ -88,12 +166,12 @@ class DataflowAnalysisAttacher(Transformer):
     def visit_Node(self, o, **kwargs):
         # Live symbols are determined on InternalNode handler levels and
         # get passed down to all child nodes
-        o._update(_live_symbols=kwargs.get('live_symbols', set()))
+        o._update(_live_symbols=SymbolBitset(self.index, kwargs.get('live_symbols', 0)))
 
         # Symbols defined or used by this node are determined by their individual
         # handler routines and passed on to visitNode from there
-        o._update(_defines_symbols=kwargs.get('defines_symbols', set()))
-        o._update(_uses_symbols=kwargs.get('uses_symbols', set()))
+        o._update(_defines_symbols=SymbolBitset(self.index, kwargs.get('defines_symbols', 0)))
+        o._update(_uses_symbols=SymbolBitset(self.index, kwargs.get('uses_symbols', 0)))
         return o
 
     # Internal nodes
@@ -104,12 +182,12 @@ class DataflowAnalysisAttacher(Transformer):
         for b in o.body:
             if isinstance(b, Subroutine):
                 defines = defines | set(as_tuple(b.procedure_symbol))
-        return self.visit_Node(o, defines_symbols=defines, **kwargs)
+        return self.visit_Node(o, defines_symbols=self.index.encode(defines), **kwargs)
 
     def visit_InternalNode(self, o, **kwargs):
         # An internal node defines all symbols defined by its body and uses all
         # symbols used by its body before they are defined in the body
-        live = kwargs.pop('live_symbols', set())
+        live = kwargs.pop('live_symbols', 0)
         body, defines, uses = self._visit_body(o.body, live=live, **kwargs)
         o._update(body=body)
         return self.visit_Node(o, live_symbols=live, defines_symbols=defines, uses_symbols=uses, **kwargs)
@@ -117,66 +195,67 @@ class DataflowAnalysisAttacher(Transformer):
     def visit_Associate(self, o, **kwargs):
         # An associate block defines all symbols defined by its body and uses all
         # symbols used by its body before they are defined in the body
-        live = kwargs.pop('live_symbols', set())
+        live = kwargs.pop('live_symbols', 0)
         body, defines, uses = self._visit_body(o.body, live=live, **kwargs)
         o._update(body=body)
 
         # reverse the mapping of names before assinging lives, defines, uses sets for Associate node itself
         invert_assoc = CaseInsensitiveDict({v.name: k for k, v in o.associations})
-        _live = set(invert_assoc[v.name] if v.name in invert_assoc else v for v in live)
-        _defines = set(invert_assoc[v.name] if v.name in invert_assoc else v for v in defines)
-        _uses = set(invert_assoc[v.name] if v.name in invert_assoc else v for v in uses)
+        _live, _defines, _uses = (
+            self.index.encode(
+                invert_assoc[v.name] if v.name in invert_assoc else v for v in self.index.decode(bits)
+            )
+            for bits in (live, defines, uses)
+        )
 
         return self.visit_Node(o, live_symbols=_live, defines_symbols=_defines, uses_symbols=_uses, **kwargs)
 
     def visit_Loop(self, o, **kwargs):
         # A loop defines the induction variable for its body before entering it
-        live = kwargs.pop('live_symbols', set())
-        uses = self._symbols_from_expr(o.bounds)
-        body, defines, uses = self._visit_body(o.body, live=live|{o.variable.clone()}, uses=uses, **kwargs)
+        live = kwargs.pop('live_symbols', 0)
+        uses = self.index.encode(self._symbols_from_expr(o.bounds))
+        variable = self.index.encode((self._symbol(o.variable),))
+        body, defines, uses = self._visit_body(o.body, live=live|variable, uses=uses, **kwargs)
         o._update(body=body)
         # Make sure the induction variable is not considered outside the loop
-        uses.discard(o.variable)
-        defines.discard(o.variable)
+        uses &= ~variable
+        defines &= ~variable
         return self.visit_Node(o, live_symbols=live, defines_symbols=defines, uses_symbols=uses, **kwargs)
 
     def visit_WhileLoop(self, o, **kwargs):
         # A while loop uses variables in its condition
-        live = kwargs.pop('live_symbols', set())
-        uses = self._symbols_from_expr(o.condition)
+        live = kwargs.pop('live_symbols', 0)
+        uses = self.index.encode(self._symbols_from_expr(o.condition))
         body, defines, uses = self._visit_body(o.body, live=live, uses=uses, **kwargs)
         o._update(body=body)
         return self.visit_Node(o, live_symbols=live, defines_symbols=defines, uses_symbols=uses, **kwargs)
 
     def visit_Conditional(self, o, **kwargs):
-        live = kwargs.pop('live_symbols', set())
+        live = kwargs.pop('live_symbols', 0)
 
         # exclude arguments to functions that just check the memory attributes of a variable
-        mem_call = as_tuple(i for i in FindInlineCalls().visit(o.condition) if i.function in self._mem_property_queries)
-        query_args = as_tuple(flatten(FindVariables().visit(i.parameters) for i in mem_call))
-        cset = set(v for v in FindVariables().visit(o.condition) if not v in query_args)
+        query_args = self._query_args(o.condition)
+        cset = set(v for v in self._find_variables.visit(o.condition) if not v in query_args)
 
-        condition = self._symbols_from_expr(as_tuple(cset))
+        condition = self.index.encode(self._symbols_from_expr(as_tuple(cset)))
         body, defines, uses = self._visit_body(o.body, live=live, uses=condition, **kwargs)
         else_body, else_defines, uses = self._visit_body(o.else_body, live=live, uses=uses, **kwargs)
         o._update(body=body, else_body=else_body)
         return self.visit_Node(o, live_symbols=live, defines_symbols=defines|else_defines, uses_symbols=uses, **kwargs)
 
     def visit_MultiConditional(self, o, **kwargs):
-        live = kwargs.pop('live_symbols', set())
+        live = kwargs.pop('live_symbols', 0)
 
         # exclude arguments to functions that just check the memory attributes of a variable
-        mem_calls = as_tuple(i for i in FindInlineCalls().visit(o.expr) if i.function in self._mem_property_queries)
-        query_args = as_tuple(flatten(FindVariables().visit(i.parameters) for i in mem_calls))
-        eset = set(v for v in FindVariables().visit(o.expr) if not v in query_args)
+        query_args = self._query_args(o.expr)
+        eset = set(v for v in self._find_variables.visit(o.expr) if not v in query_args)
 
-        mem_calls = as_tuple(i for i in FindInlineCalls().visit(o.values) if i.function in self._mem_property_queries)
-        query_args = as_tuple(flatten(FindVariables().visit(i.parameters) for i in mem_calls))
-        vset = set(v for v in FindVariables().visit(o.values) if not v in query_args)
+        query_args = self._query_args(o.values)
+        vset = set(v for v in self._find_variables.visit(o.values) if not v in query_args)
 
-        uses = self._symbols_from_expr(as_tuple(eset)) | self._symbols_from_expr(as_tuple(vset))
+        uses = self.index.encode(self._symbols_from_expr(as_tuple(eset)) | self._symbols_from_expr(as_tuple(vset)))
         body = ()
-        defines = set()
+        defines = 0
         for b in o.bodies:
             _b, _d, uses = self._visit_body(b, live=live, uses=uses, **kwargs)
             body += (as_tuple(_b),)
@@ -187,8 +266,8 @@ class DataflowAnalysisAttacher(Transformer):
         return self.visit_Node(o, live_symbols=live, defines_symbols=defines, uses_symbols=uses, **kwargs)
 
     def visit_MaskedStatement(self, o, **kwargs):
-        live = kwargs.pop('live_symbols', set())
-        conditions = self._symbols_from_expr(o.conditions)
+        live = kwargs.pop('live_symbols', 0)
+        conditions = self.index.encode(self._symbols_from_expr(o.conditions))
         body, defines, uses = self._visit_body(o.bodies, live=live, uses=conditions, **kwargs)
         body = tuple(as_tuple(b,) for b in body)
         default, default_defs, uses = self._visit_body(o.default, live=live, uses=uses, **kwargs)
@@ -197,25 +276,32 @@ class DataflowAnalysisAttacher(Transformer):
 
     # Leaf nodes
 
+    def visit_LeafNode(self, o, defines_symbols=(), uses_symbols=(), **kwargs):
+        # Leaf node handlers determine the sets of defined and used symbols,
+        # which are converted to bitsets here
+        return self.visit_Node(
+            o, defines_symbols=self.index.encode(defines_symbols),
+            uses_symbols=self.index.encode(uses_symbols), **kwargs
+        )
+
     def visit_Assignment(self, o, **kwargs):
         # exclude arguments to functions that just check the memory attributes of a variable
-        mem_calls = as_tuple(i for i in FindInlineCalls().visit(o.rhs) if i.function in self._mem_property_queries)
-        query_args = as_tuple(flatten(FindVariables().visit(i.parameters) for i in mem_calls))
-        rset = set(v for v in FindVariables().visit(o.rhs) if not v in query_args)
+        query_args = self._query_args(o.rhs)
+        rset = set(v for v in self._find_variables.visit(o.rhs) if not v in query_args)
 
         # The left-hand side variable is defined by this statement
         defines, uses = self._symbols_from_lhs_expr(o.lhs)
 
         # Anything on the right-hand side is used before assigning to it
         uses |= self._symbols_from_expr(as_tuple(rset))
-        return self.visit_Node(o, defines_symbols=defines, uses_symbols=uses, **kwargs)
+        return self.visit_LeafNode(o, defines_symbols=defines, uses_symbols=uses, **kwargs)
 
     def visit_ConditionalAssignment(self, o, **kwargs):
         # The left-hand side variable is defined by this statement
         defines, uses = self._symbols_from_lhs_expr(o.lhs)
         # Anything on the right-hand side is used before assigning to it
         uses |= self._symbols_from_expr((o.condition, o.rhs, o.else_rhs))
-        return self.visit_Node(o, defines_symbols=defines, uses_symbols=uses, **kwargs)
+        return self.visit_LeafNode(o, defines_symbols=defines, uses_symbols=uses, **kwargs)
 
     def visit_CallStatement(self, o, **kwargs):
         if o.routine is not BasicType.DEFERRED:
@@ -227,8 +313,8 @@ class DataflowAnalysisAttacher(Transformer):
             invals = [val for arg, val in o.arg_iter() if str(arg.type.intent).lower() in ('inout', 'in')]
 
             for val in outvals:
-                arrays = [v for v in FindVariables().visit(outvals) if isinstance(v, Array)]
-                dims = set(v for a in arrays for v in FindVariables().visit(a.dimensions))
+                arrays = [v for v in self._find_variables.visit(outvals) if isinstance(v, Array)]
+                dims = set(v for a in arrays for v in self._find_variables.visit(a.dimensions))
                 exprs = self._symbols_from_expr(val)
                 defines |= {e for e in exprs if not e in dims}
                 uses |= dims
@@ -238,37 +324,37 @@ class DataflowAnalysisAttacher(Transformer):
             # We don't know the intent of any of these arguments and thus have
             # to assume all of them are potentially used or defined by this
             # statement
-            arrays = [v for v in FindVariables().visit(o.arguments) if isinstance(v, Array)]
-            arrays += [v for arg, val in o.kwarguments for v in FindVariables().visit(val) if isinstance(v, Array)]
+            arrays = [v for v in self._find_variables.visit(o.arguments) if isinstance(v, Array)]
+            arrays += [v for arg, val in o.kwarguments for v in self._find_variables.visit(val) if isinstance(v, Array)]
 
-            dims = set(v for a in arrays for v in FindVariables().visit(a.dimensions))
+            dims = set(v for a in arrays for v in self._find_variables.visit(a.dimensions))
             defines = self._symbols_from_expr(o.arguments, condition=lambda x: x not in dims)
             for arg, val in o.kwarguments:
                 defines |= self._symbols_from_expr(val, condition=lambda x: x not in dims)
             uses = defines.copy() | dims
 
-        return self.visit_Node(o, defines_symbols=defines, uses_symbols=uses, **kwargs)
+        return self.visit_LeafNode(o, defines_symbols=defines, uses_symbols=uses, **kwargs)
 
     def visit_Allocation(self, o, **kwargs):
-        arrays = [v for v in FindVariables().visit(o.variables) if isinstance(v, Array)]
-        dims = set(v for a in arrays for v in FindVariables().visit(a.dimensions))
+        arrays = [v for v in self._find_variables.visit(o.variables) if isinstance(v, Array)]
+        dims = set(v for a in arrays for v in self._find_variables.visit(a.dimensions))
         defines = self._symbols_from_expr(o.variables, condition=lambda x: x not in dims)
         uses = self._symbols_from_expr(o.data_source or ()) | dims
-        return self.visit_Node(o, defines_symbols=defines, uses_symbols=uses, **kwargs)
+        return self.visit_LeafNode(o, defines_symbols=defines, uses_symbols=uses, **kwargs)
 
     def visit_Deallocation(self, o, **kwargs):
         defines = self._symbols_from_expr(o.variables)
-        return self.visit_Node(o, defines_symbols=defines, **kwargs)
+        return self.visit_LeafNode(o, defines_symbols=defines, **kwargs)
 
     visit_Nullify = visit_Deallocation
 
     def visit_Import(self, o, **kwargs):
         defines = self._symbols_from_expr(o.symbols or ())
-        return self.visit_Node(o, defines_symbols=defines, **kwargs)
+        return self.visit_LeafNode(o, defines_symbols=defines, **kwargs)
 
     def visit_VariableDeclaration(self, o, **kwargs):
         defines = self._symbols_from_expr(o.symbols, condition=lambda v: v.type.initial is not None)
-        return self.visit_Node(o, defines_symbols=defines, **kwargs)
+        return self.visit_LeafNode(o, defines_symbols=defines, **kwargs)
 
 
 class DataflowAnalysisDetacher(Transformer):
@@ -299,19 +385,20 @@ def attach_dataflow_analysis(module_or_routine):
     The IR nodes are updated in-place and thus existing references to IR
     nodes remain valid.
     """
-    live_symbols = set()
+    attacher = DataflowAnalysisAttacher()
+    live_symbols = 0
     if hasattr(module_or_routine, 'arguments'):
-        live_symbols = DataflowAnalysisAttacher._symbols_from_expr(
+        live_symbols = attacher.index.encode(attacher._symbols_from_expr(  # pylint: disable=protected-access
             module_or_routine.arguments,
             condition=lambda a: a.type.intent and a.type.intent.lower() in ('in', 'inout')
-        )
+        ))
 
     if hasattr(module_or_routine, 'spec'):
-        DataflowAnalysisAttacher().visit(module_or_routine.spec, live_symbols=live_symbols)
-        live_symbols |= module_or_routine.spec.defines_symbols
+        attacher.visit(module_or_routine.spec, live_symbols=live_symbols)
+        live_symbols |= module_or_routine.spec.__dict__['_defines_symbols'].bits
 
     if hasattr(module_or_routine, 'body'):
-        DataflowAnalysisAttacher().visit(module_or_routine.body, live_symbols=live_symbols)
+        attacher.visit(module_or_routine.body, live_symbols=live_symbols)
 
 
 def detach_dataflow_analysis(module_or_routine):
@@ -419,12 +506,14 @@ class FindReads(Visitor):
         self.clear_candidates_on_write = clear_candidates_on_write
         self.reads = set()
 
-    @staticmethod
-    def _symbols_from_expr(expr):
+    _find_variables = FindVariables()
+
+    @classmethod
+    def _symbols_from_expr(cls, expr):
         """
         Return set of symbols found in an expression.
         """
-        return {v.clone(dimensions=None) for v in FindVariables().visit(expr)}
+        return {v.clone(dimensions=None) for v in cls._find_variables.visit(expr)}
 
     def _register_reads(self, read_symbols):
         if self.active:
@@ -438,7 +527,8 @@ class FindReads(Visitor):
             self.candidate_set -= write_symbols
 
     def visit(self, o, *args, **kwargs):
-        self.active = (self.active and o not in self.stop) or o in self.start
+        if isinstance(o, Node):
+            self.active = (self.active and o not in self.stop) or o in self.start
         return super().visit(o, *args, **kwargs)
 
     def visit_object(self, o, **kwargs):  # pylint: disable=unused-argument
@@ -501,12 +591,14 @@ class FindWrites(Visitor):
         self.candidate_set = candidate_set
         self.writes = set()
 
-    @staticmethod
-    def _symbols_from_expr(expr):
+    _find_variables = FindVariables()
+
+    @classmethod
+    def _symbols_from_expr(cls, expr):
         """
         Return set of symbols found in an expression.
         """
-        return {v.clone(dimensions=None) for v in FindVariables().visit(expr)}
+        return {v.clone(dimensions=None) for v in cls._find_variables.visit(expr)}
 
     def _register_writes(self, write_symbols):
         if self.candidate_set is None:
@@ -515,7 +607,8 @@ class FindWrites(Visitor):
             self.writes |= write_symbols & self.candidate_set
 
     def visit(self, o, *args, **kwargs):
-        self.active = (self.active and o not in self.stop) or o in self.start
+        if isinstance(o, Node):
+            self.active = (self.active and o not in self.stop) or o in self.start
         return super().visit(o, *args, **kwargs)
 
     def visit_object(self, o, **kwargs):  # pylint: disable=unused-argument
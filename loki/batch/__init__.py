@@ -6,6 +6,7 @@
 # nor does it submit to any jurisdiction.
 
 from loki.batch.configure import * # noqa
+from loki.batch.discovery import * # noqa
 from loki.batch.item import * # noqa
 from loki.batch.scheduler import * # noqa
 from loki.batch.sfilter import * # noqa
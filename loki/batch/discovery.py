@@ -0,0 +1,180 @@
+# (C) Copyright 2018- ECMWF.
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+from functools import reduce
+import json
+import os
+from pathlib import Path
+import tempfile
+
+from loki.batch.item import InterfaceItem, ProcedureItem, TypeDefItem
+from loki.frontend import read_file
+from loki.ir import Interface
+from loki.logging import debug, warning
+from loki.tools import filehash, loki_version
+
+
+__all__ = ['DiscoveryIndex']
+
+
+class DiscoveryIndex:
+    """
+    Persistent index of the program units discovered in source files during
+    the :any:`Scheduler`'s discovery step
+
+    For every source file path, the index records the file's modification time,
+    size and content hash, the frontend arguments used for the discovery (including
+    the :any:`RegexParserClass` classes), and the names of the modules and procedures
+    that are defined in the file. For modules whose definitions have been
+    discovered, the names of the module members are recorded, too. This
+    allows to skip unchanged modules when searching for a module member
+    whose enclosing module is unknown.
+
+    On a subsequent run, files with unchanged modification time and size are
+    resolved from the index without being read. For files with a changed
+    modification time, the content hash is compared to avoid re-parsing files
+    that have been touched but not modified.
+
+    Parameters
+    ----------
+    path : str or :any:`pathlib.Path`, optional
+        The file to load the index from and to store it to. If not given,
+        the index is only kept in memory.
+    """
+
+    def __init__(self, path=None):
+        self.path = None if path is None else Path(path)
+        self.entries = {}
+        self._modified = False
+
+        if self.path and self.path.exists():
+            try:
+                with self.path.open('r') as f:
+                    index = json.load(f)
+            except (OSError, ValueError) as e:
+                warning(f'[Loki::Scheduler] Ignoring invalid discovery index {self.path}: {e}')
+                return
+            if index.get('version') == loki_version():
+                self.entries = index.get('entries', {})
+
+    @staticmethod
+    def _frontend_args_key(frontend_args):
+        """
+        Create the string representation of :data:`frontend_args` to store in an index entry
+        """
+        return repr(sorted((k, str(v)) for k, v in (frontend_args or {}).items()))
+
+    def lookup(self, path, frontend_args=None):
+        """
+        Look-up the definitions of an unchanged file in the index
+
+        Parameters
+        ----------
+        path : str or :any:`pathlib.Path`
+            The path of the source file
+        frontend_args : dict, optional
+            The frontend arguments that are used to discover the file
+
+        Returns
+        -------
+        dict or None
+            A mapping with the keys ``modules`` and ``procedures``, or `None` if the file
+            is not in the index, has been modified, or was discovered with different
+            frontend arguments. ``procedures`` lists the names of procedures defined
+            in the file, and ``modules`` maps the names of modules to the list of
+            their member names (or `None` if these are unknown).
+        """
+        if not (entry := self.entries.get(str(path))):
+            return None
+        if entry['frontend_args'] != self._frontend_args_key(frontend_args):
+            return None
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        if (stat.st_mtime_ns, stat.st_size) != (entry['mtime'], entry['size']):
+            # The file has been touched: compare the content to see if it changed
+            if filehash(read_file(path)) != entry['hash']:
+                return None
+            entry['mtime'], entry['size'] = stat.st_mtime_ns, stat.st_size
+            self._modified = True
+
+        return entry['definitions']
+
+    def update(self, path, sourcefile, frontend_args=None):
+        """
+        Record the definitions of a freshly discovered :any:`Sourcefile` in the index
+
+        Parameters
+        ----------
+        path : str or :any:`pathlib.Path`
+            The path of the source file
+        sourcefile : :any:`Sourcefile`
+            The source file object created during discovery
+        frontend_args : dict, optional
+            The frontend arguments that were used to discover the file
+        """
+        stat = os.stat(path)
+        definitions = {
+            'modules': {module.name.lower(): self._module_members(module) for module in sourcefile.modules},
+            'procedures': [routine.name.lower() for routine in sourcefile.subroutines]
+        }
+
+        entry = self.entries.get(str(path))
+        if entry and (entry['mtime'], entry['size']) == (stat.st_mtime_ns, stat.st_size):
+            # Unchanged file: only refresh the recorded definitions
+            if entry['definitions'] != definitions:
+                entry['definitions'] = definitions
+                self._modified = True
+            return
+
+        self.entries[str(path)] = {
+            'mtime': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'hash': filehash(read_file(path)),
+            'frontend_args': self._frontend_args_key(frontend_args),
+            'definitions': definitions
+        }
+        self._modified = True
+
+    @staticmethod
+    def _module_members(module):
+        """
+        Return the names of the members of :data:`module`, or `None`
+        if the module's definitions have not been parsed, yet
+        """
+        parser_classes = reduce(
+            lambda x, y: x | y,
+            (ProcedureItem._parser_class, InterfaceItem._parser_class, TypeDefItem._parser_class)
+        )
+        if module._incomplete and (module._parser_classes & parser_classes) != parser_classes:
+            return None
+
+        members = set()
+        for node in module.definitions:
+            if isinstance(node, Interface):
+                members.update(str(symbol).lower() for symbol in node.symbols)
+            else:
+                members.add(node.name.lower())
+        return sorted(members)
+
+    def write(self):
+        """
+        Store the index in :attr:`path`, if it has been modified
+        """
+        if not (self.path and self._modified):
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        index = {'version': loki_version(), 'entries': self.entries}
+        with tempfile.NamedTemporaryFile('w', dir=self.path.parent, suffix='.tmp', delete=False) as f:
+            json.dump(index, f)
+        os.replace(f.name, self.path)
+        self._modified = False
+        debug(f'[Loki::Scheduler] Wrote discovery index {self.path}')
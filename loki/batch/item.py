@@ -6,6 +6,7 @@
 # nor does it submit to any jurisdiction.
 
 from functools import reduce
+from pathlib import Path
 import sys
 
 from loki.batch.configure import SchedulerConfig, ItemConfig
@@ -114,6 +115,7 @@ class Item(ItemConfig):
     source : :any:`Sourcefile`
         The sourcefile object in which the IR node corresponding to this item is defined.
         The :attr:`ir` property will look-up and yield the IR node in this source file.
+        This may be resolved lazily on first access (see :attr:`source`).
     trafo_data : any:`dict`
         Container object for analysis passes to store analysis data. This can be used
         in subsequent transformation passes.
@@ -122,8 +124,9 @@ class Item(ItemConfig):
     ----------
     name : str
         Name to identify items in the schedulers graph
-    source : :any:`Sourcefile`
-        The underlying source file that contains the associated item
+    source : :any:`Sourcefile` or :any:`Item`
+        The underlying source file that contains the associated item. If an
+        :any:`Item` is given, the source file is taken from that item on first access.
     config : dict
         Dict of item-specific config options, see :any:`ItemConfig`
     """
@@ -134,10 +137,38 @@ class Item(ItemConfig):
 
     def __init__(self, name, source, config=None):
         self.name = name
-        self.source = source
+        self._source = source
         self.trafo_data = {}
         super().__init__(config)
 
+    @property
+    def source(self):
+        """
+        The :any:`Sourcefile` object in which the IR node corresponding to this item is defined
+
+        For items that have been created with the enclosing scope's item as
+        :data:`source`, the source file is resolved from that item on first access.
+        This allows to create items for files that have not been parsed, yet
+        (see :any:`DiscoveryIndex`).
+        """
+        if isinstance(self._source, Item):
+            self._source = self._source.source
+        return self._source
+
+    @source.setter
+    def source(self, source):
+        self._source = source
+
+    @property
+    def _source_is_loaded(self):
+        """
+        Check if the source file of this item has been parsed already
+        """
+        source = self._source
+        while isinstance(source, Item):
+            source = source._source
+        return not isinstance(source, Path)
+
     def __repr__(self):
         return f'loki.batch.{self.__class__.__name__}<{self.name}>'
 
@@ -528,6 +559,29 @@ class FileItem(Item):
     of items defined by nodes inside the file.
 
     A :any:`FileItem` defines :any:`ModuleItem` and :any:`ProcedureItem` nodes.
+
+    The source file of a :any:`FileItem` can be parsed lazily, by providing
+    the file path as :data:`source`. The file is then parsed with the given
+    :data:`frontend_args` on first access of :attr:`source`. If the names of
+    the modules and procedures in the file are known, e.g., from a
+    :any:`DiscoveryIndex`, these can be provided as :data:`definition_names`
+    to create the definition items without parsing the file.
+
+    Parameters
+    ----------
+    name : str
+        Name to identify items in the schedulers graph
+    source : :any:`Sourcefile` or :any:`pathlib.Path`
+        The underlying source file or the path to the source file
+    config : dict, optional
+        Dict of item-specific config options, see :any:`ItemConfig`
+    frontend_args : dict, optional
+        Frontend arguments that are given to :any:`Sourcefile.from_file` when
+        parsing the file lazily
+    definition_names : dict, optional
+        Mapping with keys ``modules`` and ``procedures`` that provides the names
+        of the program units defined in the file, in the format returned by
+        :meth:`DiscoveryIndex.lookup`
     """
 
     # We do not need to parse anything inside the file for this item type
@@ -536,6 +590,43 @@ class FileItem(Item):
     # Modules and Procedures can appear in a sourcefile
     _defines_items = ('ModuleItem', 'ProcedureItem')
 
+    def __init__(self, name, source, config=None, frontend_args=None, definition_names=None):
+        super().__init__(name, source, config)
+        self._frontend_args = frontend_args
+        self._definition_names = definition_names
+
+    @property
+    def source(self):
+        """
+        The :any:`Sourcefile` associated with this item, which is parsed
+        on first access if the item has been created from a file path
+        """
+        if isinstance(self._source, Path):
+            self._source = Sourcefile.from_file(self._source, **(self._frontend_args or {}))
+        return self._source
+
+    @source.setter
+    def source(self, source):
+        self._source = source
+
+    @property
+    def path(self):
+        """
+        The filepath of the associated source file
+        """
+        if isinstance(self._source, Path):
+            return self._source
+        return self.source.path
+
+    def _get_module_members(self, module_name):
+        """
+        Return the member names of the module :data:`module_name` as provided
+        by :data:`definition_names`, or `None` if these are not known
+        """
+        if self._source_is_loaded or self._definition_names is None:
+            return None
+        return self._definition_names['modules'].get(module_name.lower())
+
     @property
     def definitions(self):
         """
@@ -577,6 +668,21 @@ class FileItem(Item):
         tuple
             The list of :any:`Item` nodes
         """
+        if not self._source_is_loaded and self._definition_names is not None:
+            # Create the items from the known definition names without parsing the file
+            items = tuple(
+                item_factory.get_or_create_item(ModuleItem, name, self.name, config)
+                for name in self._definition_names['modules']
+            )
+            items += tuple(
+                item_factory.get_or_create_item(ProcedureItem, f'#{name}', self.name, config)
+                for name in self._definition_names['procedures']
+            )
+            items = as_tuple(item for item in items if item is not None)
+            if only:
+                items = tuple(item for item in items if isinstance(item, only))
+            return items
+
         items = ()
         for node in self.definitions:
             if isinstance(node, Module):
@@ -950,10 +1056,18 @@ class ItemFactory:
     ----------
     item_cache : :any:`CaseInsensitiveDict`
         This maps item names to corresponding :any:`Item` objects
+    module_member_index : :any:`CaseInsensitiveDict`
+        This maps the local names of module members, i.e., procedures, interfaces and
+        derived types, to the names of the modules in which they are defined. Modules
+        are added to the index when their members become known, and the index is
+        used to look up definitions imported via unqualified imports
+        (see :meth:`get_or_create_module_definitions_from_candidates`).
     """
 
     def __init__(self):
         self.item_cache = CaseInsensitiveDict()
+        self.module_member_index = CaseInsensitiveDict()
+        self._module_members = {}
 
     def __contains__(self, key):
         """
@@ -1127,12 +1241,22 @@ class ItemFactory:
             warning(f'Module {scope_name} not found in self.item_cache. Marking {item_name} as an external dependency')
             item = ExternalItem(item_name, source=None, config=item_conf, origin_cls=item_cls)
         else:
-            source = self.item_cache[scope_name].source
+            scope_item = self.item_cache[scope_name]
+            if scope_item._source_is_loaded:
+                source = scope_item.source
+            else:
+                # Defer parsing the file until the source is accessed
+                source = scope_item
+                if item_cls is ModuleItem:
+                    # Index the module members that are known without parsing the file
+                    members = scope_item._get_module_members(item_name)
+                    if members is not None:
+                        self.index_module_members(item_name, members)
             item = item_cls(item_name, source=source, config=item_conf)
         self.item_cache[item_name] = item
         return item
 
-    def get_or_create_file_item_from_path(self, path, config, frontend_args=None):
+    def get_or_create_file_item_from_path(self, path, config, frontend_args=None, index=None):
         """
         Utility method to create a :any:`FileItem` for a given path
 
@@ -1140,6 +1264,11 @@ class ItemFactory:
         discovery phase. It will use a cached item if it exists, or parse the source
         file using the given :data:`frontend_args`.
 
+        If a :any:`DiscoveryIndex` is given and the file is unchanged, the
+        :any:`FileItem` is created from the index entry without reading the file,
+        and the source file is parsed lazily on first access. Otherwise,
+        the index is updated with the newly parsed file.
+
         Parameters
         ----------
         path : str or pathlib.Path
@@ -1149,6 +1278,8 @@ class ItemFactory:
         frontend_args : dict, optional
             Frontend arguments that are given to :any:`Sourcefile.from_file` when
             parsing the file
+        index : :any:`DiscoveryIndex`, optional
+            The discovery index to use for unchanged files
         """
         item_name = str(path).lower()
         if file_item := self.item_cache.get(item_name):
@@ -1159,9 +1290,17 @@ class ItemFactory:
         if config:
             frontend_args = config.create_frontend_args(path, frontend_args)
 
-        source = Sourcefile.from_file(path, **frontend_args)
         item_conf = config.create_item_config(item_name) if config else None
-        file_item = FileItem(item_name, source=source, config=item_conf)
+        if index is not None and (definition_names := index.lookup(path, frontend_args)) is not None:
+            file_item = FileItem(
+                item_name, source=Path(path), config=item_conf,
+                frontend_args=frontend_args, definition_names=definition_names
+            )
+        else:
+            source = Sourcefile.from_file(path, **frontend_args)
+            if index is not None:
+                index.update(path, source, frontend_args)
+            file_item = FileItem(item_name, source=source, config=item_conf)
         self.item_cache[item_name] = file_item
         return file_item
 
@@ -1188,7 +1327,7 @@ class ItemFactory:
         """
         # Check for file item with the same source object
         for item in self.item_cache.values():
-            if isinstance(item, FileItem) and item.source is source:
+            if isinstance(item, FileItem) and item._source_is_loaded and item.source is source:
                 return item
 
         if not source.path:
@@ -1407,17 +1546,88 @@ class ItemFactory:
             Ideally, only a single item will be found (or there would be a name conflict).
         """
         if not module_names:
-            module_names = [item.name for item in self.item_cache.values() if isinstance(item, ModuleItem)]
+            # Make sure all modules are indexed before looking up the candidates
+            for item in tuple(self.item_cache.values()):
+                if isinstance(item, ModuleItem) and item.name not in self._module_members:
+                    self._get_module_members(item)
+            module_names = self.module_member_index.get(name, ())
         items = []
         for module_name in module_names:
             module_item = self.item_cache.get(module_name)
-            if module_item:
-                definition_items = module_item.create_definition_items(
-                    item_factory=self, config=config, only=only
-                )
-                items += [_it for _it in definition_items if _it.name[_it.name.index('#')+1:] == name.lower()]
+            if not isinstance(module_item, ModuleItem):
+                continue
+            if not module_item._source_is_loaded and name.lower() not in self._get_module_members(module_item):
+                # Skip modules from unparsed files that are known to not define the member
+                continue
+            definition_items = module_item.create_definition_items(
+                item_factory=self, config=config, only=only
+            )
+            items += [_it for _it in definition_items if _it.name[_it.name.index('#')+1:] == name.lower()]
         return tuple(items)
 
+    def index_module_members(self, module_name, member_names):
+        """
+        Record the names of the members of a module in the :attr:`module_member_index`
+
+        Parameters
+        ----------
+        module_name : str
+            The name of the module
+        member_names : list of str
+            The local names of the procedures, interfaces and derived types that are
+            defined in the module
+        """
+        module_name = module_name.lower()
+        self.remove_module_from_index(module_name)
+        members = frozenset(name.lower() for name in member_names)
+        self._module_members[module_name] = members
+        for member in members:
+            self.module_member_index[member] = self.module_member_index.get(member, ()) + (module_name,)
+
+    def remove_module_from_index(self, module_name):
+        """
+        Remove the members of a module from the :attr:`module_member_index`
+
+        The module's members are indexed again when they are next required.
+
+        Parameters
+        ----------
+        module_name : str
+            The name of the module
+        """
+        module_name = module_name.lower()
+        for member in self._module_members.pop(module_name, ()):
+            module_names = tuple(name for name in self.module_member_index[member] if name != module_name)
+            if module_names:
+                self.module_member_index[member] = module_names
+            else:
+                del self.module_member_index[member]
+
+    def _get_module_members(self, module_item):
+        """
+        Return the local names of the members of :data:`module_item` and add them to the
+        :attr:`module_member_index` if this has not been done before
+
+        This triggers the parsing of the module's definitions if the members
+        are not known, yet.
+        """
+        module_name = module_item.name.lower()
+        if (members := self._module_members.get(module_name)) is not None:
+            return members
+
+        members = None
+        if not module_item._source_is_loaded:
+            members = module_item._source._get_module_members(module_name)
+        if members is None:
+            members = set()
+            for node in module_item.definitions:
+                if isinstance(node, Interface):
+                    members.update(str(symbol) for symbol in node.symbols)
+                else:
+                    members.add(str(node.name))
+        self.index_module_members(module_name, members)
+        return self._module_members[module_name]
+
     @staticmethod
     def _get_imported_symbol_name(imprt, symbol_name):
         """
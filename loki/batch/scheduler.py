@@ -5,18 +5,24 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
+from concurrent.futures import as_completed
 from os.path import commonpath
 from pathlib import Path
+from time import perf_counter
 from codetiming import Timer
+import networkx as nx
 
 from loki.batch.configure import SchedulerConfig
+from loki.batch.discovery import DiscoveryIndex
 from loki.batch.sfilter import SFilter
 from loki.batch.sgraph import SGraph
 from loki.batch.item import (
     FileItem, ModuleItem, ProcedureItem, ProcedureBindingItem,
     InterfaceItem, TypeDefItem, ExternalItem, ItemFactory
 )
-from loki.frontend import FP, REGEX, RegexParserClass
+from loki.build.workqueue import workqueue
+from loki.frontend import FP, REGEX, RegexParserClass, regex_completion_counter
+from loki.program_unit import ProgramUnit
 from loki.tools import as_tuple, CaseInsensitiveDict, flatten
 from loki.logging import info, perf, warning, debug
 
@@ -85,6 +91,10 @@ class Scheduler:
         when performing a full parse
     item_factory : :any:`ItemFactory`
         Instance of the factory class for :any:`Item` creation and caching
+    num_workers : int or None
+        Number of worker processes to use for the full parse of source files
+    discovery_index : :any:`pathlib.Path` or None
+        Path of the persistent :any:`DiscoveryIndex` used during discovery
 
     Parameters
     ----------
@@ -117,6 +127,14 @@ class Scheduler:
         By default a full parse is executed, use this flag to suppress.
     frontend : :any:`Frontend`, optional
         Frontend to use for full parse of source files (default :any:`FP`).
+    num_workers : int, optional
+        Number of worker processes to use for the full parse of source files.
+        By default, files are parsed sequentially in the main process.
+        See :meth:`_parse_items_parallel` for details.
+    discovery_index : str or :any:`pathlib.Path`, optional
+        Path of a persistent :any:`DiscoveryIndex` file. If given, source files
+        that are unchanged since the last discovery are not re-scanned, and are
+        only parsed if they are part of the dependency graph.
     """
 
     # TODO: Should be user-definable!
@@ -124,7 +142,8 @@ class Scheduler:
 
     def __init__(self, paths, config=None, seed_routines=None, preprocess=False,
                  includes=None, defines=None, definitions=None, xmods=None,
-                 omni_includes=None, full_parse=True, frontend=FP):
+                 omni_includes=None, full_parse=True, frontend=FP, num_workers=None,
+                 discovery_index=None):
         # Derive config from file or dict
         if isinstance(config, SchedulerConfig):
             self.config = config
@@ -134,6 +153,8 @@ class Scheduler:
             self.config = SchedulerConfig.from_dict(config)
 
         self.full_parse = full_parse
+        self.num_workers = num_workers
+        self.discovery_index = None if discovery_index is None else Path(discovery_index)
 
         # Build-related arguments to pass to the sources
         self.paths = [Path(p) for p in as_tuple(paths)]
@@ -168,22 +189,20 @@ class Scheduler:
     def _discover(self):
         """
         Scan all source paths and create light-weight :any:`Sourcefile` objects for each file
+
+        If :attr:`discovery_index` is set, unchanged files are resolved from the
+        :any:`DiscoveryIndex` without reading them.
         """
-        frontend_args = {
-            'preprocess': self.build_args['preprocess'],
-            'includes': self.build_args['includes'],
-            'defines': self.build_args['defines'],
-            'parser_classes': RegexParserClass.ProgramUnitClass,
-            'frontend': REGEX
-        }
+        frontend_args = self._discovery_frontend_args
 
         # Create a list of initial files to scan with the fast REGEX frontend
         path_list = [path.glob(f'**/*{ext}') for path in self.paths for ext in self.source_suffixes]
         path_list = list(set(flatten(path_list)))  # Filter duplicates and flatten
 
         # Instantiate FileItem instances for all files in the search path
+        index = DiscoveryIndex(self.discovery_index) if self.discovery_index else None
         for path in path_list:
-            self.item_factory.get_or_create_file_item_from_path(path, self.config, frontend_args)
+            self.item_factory.get_or_create_file_item_from_path(path, self.config, frontend_args, index=index)
 
         # Instantiate the basic list of items for files and top-level program units
         #  in each file, i.e., modules and subroutines
@@ -202,7 +221,101 @@ class Scheduler:
             self.item_factory.item_cache.update(definition_items)
 
         # (Re-)build the SGraph after discovery for later traversals
+        completion_count = regex_completion_counter.copy()
         self._sgraph = SGraph.from_seed(self.seeds, self.item_factory, self.config)
+        completion_count = regex_completion_counter - completion_count
+        info(
+            f'[Loki::Scheduler] REGEX frontend completion: {completion_count["full"]} full parses, '
+            f'{completion_count["incremental"]} incremental, {completion_count["skipped"]} skipped'
+        )
+
+        if index:
+            # Record the definitions that have been discovered while building the graph
+            for path in path_list:
+                file_item = self.item_factory.item_cache.get(str(path).lower())
+                if file_item and file_item._source_is_loaded:
+                    index.update(path, file_item.source, self.config.create_frontend_args(path, frontend_args))
+            index.write()
+
+    @property
+    def _discovery_frontend_args(self):
+        """
+        The frontend arguments to use when scanning source files during discovery
+        """
+        return {
+            'preprocess': self.build_args['preprocess'],
+            'includes': self.build_args['includes'],
+            'defines': self.build_args['defines'],
+            'parser_classes': RegexParserClass.ProgramUnitClass,
+            'frontend': REGEX
+        }
+
+    def _rediscover(self, items):
+        """
+        Update the :any:`FileItem` objects and the :any:`SGraph` after a transformation
+        has been applied to :data:`items`
+
+        Instead of scanning all source paths as in :meth:`_discover`, only the files
+        corresponding to :data:`items` are considered: their definition items are
+        created, and the dependencies of the items in these files are updated in the
+        :any:`SGraph` (see :meth:`SGraph.update`). Files that have been renamed
+        by the transformation (see :meth:`rekey_item_cache`) are scanned again from
+        their original path.
+
+        Parameters
+        ----------
+        items : list of :any:`Item`
+            The items to which the transformation has been applied
+
+        Returns
+        -------
+        list of :any:`Sourcefile`
+            The source files that have been modified or scanned again
+        """
+        file_items = {}
+        for item in items:
+            if isinstance(item, ExternalItem):
+                continue
+            file_item = self.item_factory.get_or_create_file_item_from_source(item.source, self.config)
+            file_items[file_item.name] = file_item
+
+        # Scan the original files of renamed file items again
+        for file_item in tuple(file_items.values()):
+            path = file_item.source.path and Path(file_item.source.path)
+            if (
+                path and str(path).lower() not in self.item_factory.item_cache and
+                path.suffix in self.source_suffixes and path.exists() and
+                any(path == search_path or search_path in path.parents for search_path in self.paths)
+            ):
+                file_item = self.item_factory.get_or_create_file_item_from_path(
+                    path, self.config, self._discovery_frontend_args
+                )
+                file_items[file_item.name] = file_item
+
+        for file_item in file_items.values():
+            # The transformation may have added or removed module members
+            for module in file_item.source.modules:
+                self.item_factory.remove_module_from_index(module.name)
+            definition_items = {
+                item.name: item
+                for item in file_item.create_definition_items(item_factory=self.item_factory, config=self.config)
+            }
+            self.item_factory.item_cache.update(definition_items)
+
+        # Update the dependencies of all items in the modified files
+        sources = [file_item.source for file_item in file_items.values()]
+        self._sgraph.update(self.seeds, self._get_items_in_sources(sources), self.item_factory, self.config)
+        return sources
+
+    def _get_items_in_sources(self, sources):
+        """
+        Return the items in the :any:`SGraph` that belong to one of the given
+        :any:`Sourcefile` objects :data:`sources`
+        """
+        return tuple(
+            item for item in self.sgraph.items
+            if not isinstance(item, ExternalItem) and any(item.source is source for source in sources)
+        )
 
     @property
     def sgraph(self):
@@ -265,20 +378,93 @@ class Scheduler:
         return self.sgraph._graph.__iter__()
 
     @Timer(logger=info, text='[Loki::Scheduler] Performed full source parse in {:.2f}s')
-    def _parse_items(self):
+    def _parse_items(self, modified_sources=None):
         """
         Prepare processing by triggering a full parse of the items in
         the execution plan and enriching subroutine calls.
+
+        Parameters
+        ----------
+        modified_sources : list of :any:`Sourcefile`, optional
+            If given, the :any:`SGraph` is not re-built from the seeds after parsing.
+            Instead, only the dependencies of the items in newly parsed files and in
+            :data:`modified_sources` are updated (see :meth:`SGraph.update`).
         """
+        file_graph = self.file_graph
+        sources = [
+            item.source for item in file_graph
+            if not isinstance(item, ExternalItem) and item.source._incomplete
+        ]
+
         # Force the parsing of the routines
         default_frontend_args = self.build_args.copy()
-        default_frontend_args['definitions'] = as_tuple(default_frontend_args['definitions']) + self.definitions
-        for item in SFilter(self.file_graph, reverse=True):
-            frontend_args = self.config.create_frontend_args(item.name, default_frontend_args)
-            item.source.make_complete(**frontend_args)
+        if self.num_workers and self.num_workers > 1:
+            self._parse_items_parallel(default_frontend_args, file_graph)
+        else:
+            default_frontend_args['definitions'] = as_tuple(default_frontend_args['definitions']) + self.definitions
+            for item in SFilter(file_graph, reverse=True):
+                frontend_args = self.config.create_frontend_args(item.name, default_frontend_args)
+                item.source.make_complete(**frontend_args)
+
+        if modified_sources is not None:
+            # Pick up the new connections of the items in the modified and newly parsed files
+            sources += modified_sources
+            self._sgraph.update(self.seeds, self._get_items_in_sources(sources), self.item_factory, self.config)
+        else:
+            # Re-build the SGraph after parsing to pick up all new connections
+            self._sgraph = SGraph.from_seed(self.seeds, self.item_factory, self.config)
 
-        # Re-build the SGraph after parsing to pick up all new connections
-        self._sgraph = SGraph.from_seed(self.seeds, self.item_factory, self.config)
+    def _parse_items_parallel(self, default_frontend_args, file_graph):
+        """
+        Perform the full parse of the items in the file graph using a pool of
+        :attr:`num_workers` worker processes
+
+        Source files are parsed generation by generation in reverse topological
+        order of the file graph, such that all files within a generation are
+        independent of each other and can be parsed concurrently. Each
+        :any:`Sourcefile` is shipped to a worker process, where ``make_complete``
+        is called with the definitions of all files it depends upon. The parsed
+        IR is sent back via pickle and spliced into the existing :any:`Sourcefile`
+        object, which retains the references held by :any:`Item` objects.
+        Finally, the new program units are enriched with the definitions from the
+        main process, to replace the copies that were pickled to the worker.
+
+        Parameters
+        ----------
+        default_frontend_args : dict
+            The default frontend arguments, which may be overwritten by file-specific
+            options in the scheduler config
+        file_graph : :any:`SGraph`
+            The file graph of the items to parse
+        """
+        definitions = as_tuple(default_frontend_args['definitions'])
+        generations = list(nx.topological_generations(file_graph._graph))
+
+        with workqueue(workers=self.num_workers) as q:
+            for generation in reversed(generations):
+                tasks = {}
+                for item in generation:
+                    if isinstance(item, ExternalItem) or not item.source._incomplete:
+                        continue
+
+                    # Provide the definitions of all files that the current file depends upon,
+                    # which have been parsed in a previous generation
+                    item_definitions = definitions + tuple(
+                        definition
+                        for child in nx.descendants(file_graph._graph, item)
+                        if not isinstance(child, ExternalItem)
+                        for definition in child.definitions
+                    )
+                    frontend_args = self.config.create_frontend_args(item.name, default_frontend_args)
+                    frontend_args['definitions'] = item_definitions
+                    tasks[q.call(_parse_sourcefile, item.source, frontend_args)] = (item, item_definitions)
+
+                for task in as_completed(tasks):
+                    item, item_definitions = tasks[task]
+                    vars(item.source).update(vars(task.result()))
+                    for node in item.source.ir.body:
+                        if isinstance(node, ProgramUnit):
+                            node.enrich(item_definitions, recurse=True)
 
     @Timer(logger=info, text='[Loki::Scheduler] Enriched call tree in {:.2f}s')
     def _enrich(self):
@@ -319,7 +505,8 @@ class Scheduler:
         # Find deleted item cache entries
         deleted_keys = set()
         for key, item in self.item_factory.item_cache.items():
-            if isinstance(item, FileItem):
+            if isinstance(item, FileItem) or not item._source_is_loaded:
+                # Skip items whose file has not been parsed, as these cannot have been modified
                 continue
             if isinstance(item, ModuleItem):
                 if item.name not in renamed_keys and item.name not in item.source:
@@ -365,11 +552,16 @@ class Scheduler:
         # re-discovered when running _discover() afterwards.
         if renamed_keys:
             for key, file_item in self.item_factory.item_cache.items():
-                if isinstance(file_item, FileItem):
+                if isinstance(file_item, FileItem) and file_item._source_is_loaded:
                     if any(file_item.source is self.item_factory.item_cache[key].source for key in renamed_keys):
                         file_item.name = f'duplicate of {file_item.name}'
                         renamed_keys[key] = file_item.name
 
+        # Drop renamed or modified modules from the module member index, which
+        # re-indexes them on the next look-up
+        for key in set(renamed_keys) | deleted_keys:
+            self.item_factory.remove_module_from_index(key[:key.index('#')] if '#' in key else key)
+
         # Rebuild item_cache to make keys match entries
         self.item_factory.item_cache = CaseInsensitiveDict(
             (item.name, item) for item in self.item_factory.item_cache.values()
@@ -397,6 +589,69 @@ class Scheduler:
         If combined with a :any:`Transformation.item_filter`, only source files with
         at least one object corresponding to an item of that type are processed.
         """
+        self._process_fused((transformation,))
+
+    def process_pipeline(self, transformations):
+        """
+        Process a sequence of transformations over all :attr:`items` in the
+        scheduler's graph, fusing the traversals of consecutive transformations
+
+        This is equivalent to calling :meth:`process` for each transformation
+        in :data:`transformations`, except that consecutive transformations with
+        the same traversal properties (:any:`Transformation.reverse_traversal`,
+        :any:`Transformation.traverse_file_graph`, :any:`Transformation.item_filter`
+        and :any:`Transformation.process_ignored_items`) are applied in a single
+        traversal of the graph. Each item is handed to every transformation in
+        the fused group in turn, before moving on to the next item.
+
+        A transformation that renames or creates items (see
+        :any:`Transformation.renames_items` and :any:`Transformation.creates_items`)
+        always concludes a fused group, such that the graph is updated before the
+        next transformation is applied.
+
+        Note that fusing changes the order in which transformations are applied
+        across items. Transformations that rely on another transformation having
+        been applied to all items (e.g., an analysis pass that gathers information
+        from successor items) should therefore be applied with separate calls
+        to :meth:`process`.
+
+        Parameters
+        ----------
+        transformations : list of :any:`Transformation`
+            The transformations to apply, in the given order
+        """
+        group = ()
+        for transformation in as_tuple(transformations):
+            if group and not self._can_fuse(group[-1], transformation):
+                self._process_fused(group)
+                group = ()
+            group += (transformation,)
+        if group:
+            self._process_fused(group)
+
+    @staticmethod
+    def _can_fuse(transformation, next_transformation):
+        """
+        Check if :data:`next_transformation` can be applied in the same
+        graph traversal as the preceding :data:`transformation`
+        """
+        if transformation.renames_items or transformation.creates_items:
+            return False
+        return all(
+            getattr(transformation, attr) == getattr(next_transformation, attr)
+            for attr in ('reverse_traversal', 'traverse_file_graph', 'process_ignored_items')
+        ) and as_tuple(transformation.item_filter) == as_tuple(next_transformation.item_filter)
+
+    def _process_fused(self, transformations):
+        """
+        Apply :data:`transformations` in a single traversal of the graph
+
+        All transformations must have the same traversal properties, and only
+        the last may rename or create items (see :meth:`_can_fuse`).
+        """
+        # All transformations share the graph iteration properties
+        transformation = transformations[0]
+
         def _get_definition_items(_item, sgraph_items):
             # For backward-compatibility with the DependencyTransform and LinterTransformation
             if not transformation.traverse_file_graph:
@@ -415,7 +670,9 @@ class Scheduler:
                         items += (item,) + child_items
             return items
 
-        trafo_name = transformation.__class__.__name__
+        trafo_names = [trafo.__class__.__name__ for trafo in transformations]
+        trafo_name = ', '.join(trafo_names)
+        timings = [0.0] * len(transformations)
         log = f'[Loki::Scheduler] Applied transformation <{trafo_name}>' + ' in {:.2f}s'
         with Timer(logger=info, text=log):
 
@@ -441,24 +698,33 @@ class Scheduler:
                     include_external=self.config.default.get('strict', True)
                 )
 
+            processed_items = []
             for _item in traversal:
+                processed_items += [_item]
                 if isinstance(_item, ExternalItem):
                     raise RuntimeError(f'Cannot apply {trafo_name} to {_item.name}: Item is marked as external.')
 
-                transformation.apply(
-                    _item.scope_ir, role=_item.role, mode=_item.mode,
-                    item=_item, targets=_item.targets, items=_get_definition_items(_item, sgraph_items),
-                    successors=graph.successors(_item, item_filter=item_filter),
-                    depths=graph.depths
-                )
-
-        if transformation.renames_items:
+                successors = graph.successors(_item, item_filter=item_filter)
+                for i, trafo in enumerate(transformations):
+                    start = perf_counter()
+                    trafo.apply(
+                        _item.scope_ir, role=_item.role, mode=_item.mode,
+                        item=_item, targets=_item.targets, items=_get_definition_items(_item, sgraph_items),
+                        successors=successors, depths=graph.depths
+                    )
+                    timings[i] += perf_counter() - start
+
+        if len(transformations) > 1:
+            for name, timing in zip(trafo_names, timings):
+                info(f'[Loki::Scheduler]   Applied <{name}> to items in {timing:.2f}s')
+
+        if transformations[-1].renames_items:
             self.rekey_item_cache()
 
-        if transformation.creates_items:
-            self._discover()
+        if transformations[-1].creates_items:
+            modified_sources = self._rediscover(processed_items)
 
-            self._parse_items()
+            self._parse_items(modified_sources=modified_sources)
 
     def callgraph(self, path, with_file_graph=False, with_legend=False):
         """
@@ -623,3 +889,23 @@ class Scheduler:
 
             s_remove = '\n'.join(f'    {s}' for s in sources_to_remove)
             f.write(f'set( LOKI_SOURCES_TO_REMOVE \n{s_remove}\n   )\n')
+
+
+def _parse_sourcefile(source, frontend_args):
+    """
+    Utility function to trigger the full parse of :data:`source` in a worker process
+
+    Parameters
+    ----------
+    source : :any:`Sourcefile`
+        The incomplete source file object to parse
+    frontend_args : dict
+        The frontend arguments to pass to :any:`Sourcefile.make_complete`
+
+    Returns
+    -------
+    :any:`Sourcefile`
+        The parsed source file object
+    """
+    source.make_complete(**frontend_args)
+    return source
@@ -33,10 +33,23 @@ class SGraph:
     Cyclic dependencies are broken for procedures that are marked as
     ``RECURSIVE``, which would otherwise constitute a dependency on itself.
     See :meth:`_break_cycles`.
+
+    The results of :attr:`depths` and :meth:`successors` are memoized and
+    invalidated whenever nodes or edges are added to or removed from the graph
+    via the methods of this class.
     """
 
     def __init__(self):
         self._graph = nx.DiGraph()
+        self._depths = None
+        self._successors = {}
+
+    def _invalidate_caches(self):
+        """
+        Reset the memoized :attr:`depths` and :meth:`successors` after a graph modification
+        """
+        self._depths = None
+        self._successors = {}
 
     @classmethod
     @Timer(logger=info, text='[Loki::Scheduler] Built SGraph from seed in {:.2f}s')
@@ -58,6 +71,65 @@ class SGraph:
         _graph._break_cycles()
         return _graph
 
+    @Timer(logger=info, text='[Loki::Scheduler] Updated SGraph in {:.2f}s')
+    def update(self, seed, items, item_factory, config=None):
+        """
+        Update the graph after the IR of :data:`items` has been modified
+
+        The dependencies of :data:`items` are created anew, and new dependencies
+        are added recursively, as in :meth:`from_seed`. Items that are no longer
+        reachable from :data:`seed` are removed from the graph. The dependencies
+        of all other items remain unchanged.
+
+        Parameters
+        ----------
+        seed : (list of) str
+            The names of the root nodes
+        items : list of :any:`Item`
+            The items whose dependencies have changed
+        item_factory : :any:`ItemFactory`
+            The item factory to use when creating graph nodes
+        config : :any:`SchedulerConfig`, optional
+            The config object to use when creating items
+        """
+        # Item names, and therefore their hashes, may have changed since the nodes
+        # have been inserted, so we rebuild the graph from the existing nodes and edges
+        graph = nx.DiGraph()
+        graph.add_nodes_from(self._graph.nodes)
+        graph.add_edges_from(self._graph.edges)
+        self._graph = graph
+        self._invalidate_caches()
+
+        queue = deque()
+        seed_items = ()
+        for name in as_tuple(seed):
+            item = as_tuple(self._create_item(name, item_factory, config))
+            seed_items += item
+            queue.extend(_item for _item in item if _item not in self._graph)
+            self.add_nodes(item)
+
+        for item in items:
+            if item in self._graph and item not in queue:
+                self._graph.remove_edges_from(tuple(self._graph.out_edges(item)))
+                queue.append(item)
+        self._invalidate_caches()
+
+        while queue:
+            item = queue.popleft()
+            if item.expand:
+                children = self._add_children(item, item_factory, config)
+                if children:
+                    queue.extend(children)
+
+        # Remove items that are no longer reachable from the seeds
+        reachable = set(seed_items)
+        for item in seed_items:
+            reachable |= nx.descendants(self._graph, item)
+        self._graph.remove_nodes_from([item for item in self._graph.nodes if item not in reachable])
+        self._invalidate_caches()
+
+        self._break_cycles()
+
     def as_filegraph(self, item_factory, config=None, item_filter=None, exclude_ignored=False):
         """
         Convert the :any:`Sgraph` to a dependency graph that only contains
@@ -257,6 +329,7 @@ class SGraph:
                         cycle_path = nx.find_cycle(self._graph, item)
                         debug(f'Removed edge {cycle_path[0]!s} to break cyclic dependency {cycle_path!s}')
                         self._graph.remove_edge(*cycle_path[0])
+                        self._invalidate_caches()
                 except nx.NetworkXNoCycle:
                     pass
 
@@ -304,6 +377,10 @@ class SGraph:
             :any:`ProcedureItem`.
         """
         item_filter = as_tuple(item_filter) or None
+        key = (item, item_filter)
+        if (successors := self._successors.get(key)) is not None:
+            return successors
+
         if item_filter and ProcedureItem in item_filter:
             # ProcedureBindingItem and InterfaceItem are intermediate nodes that take
             # essentially the role of an edge to ProcedureItems. Therefore
@@ -320,6 +397,7 @@ class SGraph:
                     successors += (child,) + self.successors(child)
                 else:
                     successors += (child,)
+        self._successors[key] = successors
         return successors
 
     @property
@@ -327,38 +405,46 @@ class SGraph:
         """
         Return a mapping of :any:`Item` nodes to their depth (topological generation)
         in the dependency graph
+
+        The mapping is computed once and shared between calls, and must therefore
+        not be modified.
         """
-        topological_generations = list(nx.topological_generations(self._graph))
-        depths = {
-            item: i_gen
-            for i_gen, gen in enumerate(topological_generations)
-            for item in gen
-        }
-        return depths
+        if self._depths is None:
+            topological_generations = list(nx.topological_generations(self._graph))
+            self._depths = {
+                item: i_gen
+                for i_gen, gen in enumerate(topological_generations)
+                for item in gen
+            }
+        return self._depths
 
     def add_node(self, item):
         """
         Add :data:`item` as a node to the dependency graph
         """
         self._graph.add_node(item)
+        self._invalidate_caches()
 
     def add_nodes(self, items):
         """
         Add the given :data:`items` as nodes to the dependency graph
         """
         self._graph.add_nodes_from(items)
+        self._invalidate_caches()
 
     def add_edge(self, edge):
         """
         Add a dependency :data:`edge` to the dependency graph
         """
         self._graph.add_edge(edge[0], edge[1])
+        self._invalidate_caches()
 
     def add_edges(self, edges):
         """
         Add the dependency :data:`edges` to the dependency graph
         """
         self._graph.add_edges_from(edges)
+        self._invalidate_caches()
 
     def export_to_file(self, dotfile_path):
         """
@@ -7,11 +7,14 @@
 
 from pathlib import Path
 from collections import deque
+import json
 from operator import attrgetter
+import os
+import tempfile
 import networkx as nx
 
 from loki.logging import default_logger
-from loki.tools import as_tuple, delete, load_module
+from loki.tools import as_tuple, delete, load_module, filehash
 from loki.build.compiler import _default_compiler
 from loki.build.obj import Obj
 from loki.build.header import Header
@@ -27,13 +30,23 @@ class Builder:
 
     :param sources: One or more paths to search for source files
     :param includes: One or more paths to that include header files
+    :param content_hash: Skip compiling objects whose source content and
+                         compile arguments are unchanged since their last
+                         compilation, even if the source file is newer than
+                         the object file.
+    :param cache_dir: Directory in which to store the results of dependency
+                      scans and the build records for :data:`content_hash`.
+                      Defaults to the build directory if :data:`content_hash`
+                      is enabled, otherwise nothing is stored.
     """
 
     def __init__(self, source_dirs=None, include_dirs=None, root_dir=None,
-                 build_dir=None, compiler=None, logger=None, workers=3):
+                 build_dir=None, compiler=None, logger=None, workers=3,
+                 content_hash=False, cache_dir=None):
         self.compiler = compiler or _default_compiler
         self.logger = logger or default_logger
         self.workers = workers
+        self.content_hash = content_hash
 
         # Source dirs for auto-detection and include dis for preprocessing
         self.source_dirs = [Path(p).resolve() for p in as_tuple(source_dirs)]
@@ -44,6 +57,16 @@ class Builder:
         self.build_dir = Path.cwd() if build_dir is None else Path(build_dir)
         self.build_dir.mkdir(exist_ok=True)
 
+        # Load persisted dependency scans and build records of compiled objects
+        if cache_dir is not None:
+            self.cache_dir = Path(cache_dir)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        else:
+            self.cache_dir = self.build_dir if content_hash else None
+        self.dependency_cache = self._load_cache('.loki_dependencies.json')
+        self.source_hashes = self._load_cache('.loki_sources.json')
+        self._dependency_cache_used = set()
+
         # Populate _object_cache for everything in source_dirs
         for source_dir in self.source_dirs:
             for ext in Obj._ext:
@@ -59,11 +82,56 @@ class Builder:
     def get_item(self, key):
         return self[key]
 
-    @staticmethod
-    def get_dependency_graph(objs, depgen=None):
+    def _load_cache(self, filename):
+        """
+        Load the JSON file :data:`filename` from the :attr:`cache_dir`, if any
+        """
+        if self.cache_dir is None:
+            return {}
+        try:
+            with (self.cache_dir/filename).open('r') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _save_cache(self, filename, data):
+        """
+        Atomically write :data:`data` to the JSON file :data:`filename`
+        in the :attr:`cache_dir`, if any
+        """
+        if self.cache_dir is None:
+            return
+        with tempfile.NamedTemporaryFile('w', dir=self.cache_dir, suffix='.tmp', delete=False) as f:
+            json.dump(data, f)
+        os.replace(f.name, self.cache_dir/filename)
+
+    def _get_dependencies(self, obj, depgen):
+        """
+        Return the dependencies of :data:`obj`, reusing and recording the
+        scanned ``use`` and ``#include`` statements of its source content
+        in :attr:`dependency_cache`
+        """
+        source_hash = obj.source_hash
+        if source_hash is None:
+            return depgen(obj)
+
+        self._dependency_cache_used.add(source_hash)
+        entry = self.dependency_cache.get(source_hash)
+        if entry:
+            vars(obj).setdefault('uses', list(entry['uses']))
+            vars(obj).setdefault('includes', list(entry['includes']))
+        dependencies = depgen(obj)
+        if not entry:
+            self.dependency_cache[source_hash] = {'uses': list(obj.uses), 'includes': list(obj.includes)}
+        return dependencies
+
+    def get_dependency_graph(self, objs, depgen=None):
         """
         Construct a :class:`networkx.DiGraph` that represents the dependency graph.
 
+        The results of the dependency scans are reused for unchanged sources,
+        and stored in the :attr:`cache_dir`, if any.
+
         :param objs: List of :class:`Obj` to use as the root of the graph.
         :param depgen: Generator object to generate the next level of dependencies
                        from an item. Defaults to ``operator.attrgetter('dependencies')``.
@@ -71,29 +139,36 @@ class Builder:
         depgen = depgen or attrgetter('dependencies')
 
         q = deque(as_tuple(objs))
-        nodes = []
+        nodes = list(q)
+        seen = set(nodes)
         edges = []
 
         while len(q) > 0:
             item = q.popleft()
-            nodes.append(item)
 
             # Record the actual :class:`Obj` dependency objects
             item.obj_dependencies = []
 
-            for dep in depgen(item):
+            for dep in self._get_dependencies(item, depgen):
                 # Note, we always create an `Obj` node, even
                 # if it has no source attached.
                 node = Obj(name=dep)
 
                 item.obj_dependencies.append(node)
 
-                if node not in nodes:
+                if node not in seen:
+                    seen.add(node)
                     nodes.append(node)
                     q.append(node)
 
                 edges.append((item, node))
 
+        # Store only the scans of sources that have been used by this builder
+        self._save_cache('.loki_dependencies.json', {
+            source_hash: entry for source_hash, entry in self.dependency_cache.items()
+            if source_hash in self._dependency_cache_used
+        })
+
         # Create a nw.DiGraph from nodes/edges
         g = nx.DiGraph()
         g.add_nodes_from(nodes)
@@ -101,6 +176,45 @@ class Builder:
 
         return g
 
+    @staticmethod
+    def _build_key(obj, args):
+        """
+        Hash of the source content of :data:`obj` and the compile arguments :data:`args`
+        """
+        return filehash('\n'.join((obj.source_hash, *(str(arg) for arg in args))))
+
+    def is_unchanged(self, obj, args):
+        """
+        Check if the source content of :data:`obj` and the compile arguments
+        :data:`args` are identical to those of its last compilation, if
+        :attr:`content_hash` is enabled
+        """
+        if not self.content_hash or obj.source_hash is None:
+            return False
+        return self.source_hashes.get(obj.name) == self._build_key(obj, args)
+
+    def record_build(self, obj, save=True):
+        """
+        Record the source hash and compile arguments of the successfully
+        compiled :data:`obj`, if :attr:`content_hash` is enabled
+
+        :param save: Write the build records to the :attr:`cache_dir`.
+        """
+        if not self.content_hash:
+            return
+        if obj.source_hash is not None and obj.compile_args is not None:
+            self.source_hashes[obj.name] = self._build_key(obj, obj.compile_args)
+        if save:
+            self.save_source_hashes()
+
+    def save_source_hashes(self):
+        """
+        Write the build records of compiled objects to the :attr:`cache_dir`,
+        if :attr:`content_hash` is enabled
+        """
+        if self.content_hash:
+            self._save_cache('.loki_sources.json', self.source_hashes)
+
     def clean(self, rules=None, path=None):
         """
         Clean up a build directory according, either according to
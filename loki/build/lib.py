@@ -5,21 +5,18 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
+from concurrent.futures import wait, FIRST_COMPLETED
+from heapq import heappush, heappop
 from operator import attrgetter
 from pathlib import Path
+from time import perf_counter
 import networkx as nx
 
-try:
-    from tqdm import tqdm
-except ImportError:
-    def tqdm(iterable, *args, **kwargs):  # pylint: disable=unused-argument
-        return iterable
-
 from loki.logging import warning
 from loki.tools import as_tuple, find_paths
 from loki.build.compiler import _default_compiler
 from loki.build.obj import Obj
-from loki.build.workqueue import workqueue, wait_and_check
+from loki.build.workqueue import workqueue, wait_and_check, DEFAULT_TIMEOUT
 
 
 __all__ = ['Lib']
@@ -45,6 +42,9 @@ class Lib:
         self.name = name
         self.shared = shared
 
+        # Compile time in seconds per object name from the last build
+        self.build_times = {}
+
         if objs is not None:
             self.objs = objs
 
@@ -97,24 +97,8 @@ class Lib:
 
         # Execute the object build in parallel via a queue of worker processes
         with workqueue(workers=workers, logger=logger) as q:
-
-            # Traverse the dependency tree in reverse topological order
-            topo_nodes = list(reversed(list(nx.topological_sort(dep_graph))))
-            for obj in tqdm(topo_nodes):
-                if obj.source_path and obj.q_task is None:
-
-                    # Wait for dependencies to complete before scheduling item
-                    for dep in obj.obj_dependencies:
-                        wait_and_check(dep.q_task, logger=logger)
-
-                    # Schedule object compilation on the workqueue
-                    obj.build(builder=builder, compiler=compiler, logger=logger,
-                              workqueue=q, force=force, include_dirs=include_dirs)
-
-            # Ensure all build tasks have finished
-            for obj in dep_graph.nodes:
-                if obj.q_task is not None:
-                    wait_and_check(obj.q_task, logger=logger)
+            self._build_objs(dep_graph, q, builder=builder, compiler=compiler, logger=logger,
+                             workers=workers, force=force, include_dirs=include_dirs)
 
         # Link the final library
         objs = [Path(o).resolve() for o in external_objs or []]
@@ -122,6 +106,85 @@ class Lib:
         logger.debug(f'Linking {self} ({len(objs)} objects)')
         compiler.link(target=target, objs=objs, shared=shared)
 
+    def _build_objs(self, dep_graph, q, builder, compiler, logger, workers, force, include_dirs):
+        """
+        Compile all objects in :data:`dep_graph` on the workqueue :data:`q`
+
+        Objects are submitted as soon as all their dependencies have been
+        compiled, with at most :data:`workers` compilations in flight.
+        Ready objects are submitted in order of their critical-path length,
+        i.e., the length of the longest chain of objects that depend on
+        them, so that long dependency chains are started first.
+        """
+        # Objects that still need to be compiled, in reverse topological order
+        topo_nodes = list(nx.topological_sort(dep_graph))
+        objs = [obj for obj in reversed(topo_nodes) if obj.source_path and obj.q_task is None]
+        order = {obj: i for i, obj in enumerate(objs)}
+
+        # Critical-path length, counting the object itself and everything that depends on it
+        path_length = {}
+        for obj in topo_nodes:
+            path_length[obj] = 1 + max((path_length[p] for p in dep_graph.predecessors(obj)), default=0)
+
+        # Number of outstanding dependencies and the initially ready objects
+        pending = {obj: sum(dep in order for dep in dep_graph.successors(obj)) for obj in objs}
+        ready = []
+        for obj in objs:
+            if pending[obj] == 0:
+                heappush(ready, (-path_length[obj], order[obj], obj))
+
+        # Wait for objects that have been submitted during a previous build
+        for obj in dep_graph.nodes:
+            if obj not in order and obj.q_task is not None:
+                wait_and_check(obj.q_task, logger=logger)
+
+        def _complete(obj, start):
+            self.build_times[obj.name] = perf_counter() - start
+            builder.record_build(obj, save=False)
+            for dependent in dep_graph.predecessors(obj):
+                if dependent in pending:
+                    pending[dependent] -= 1
+                    if pending[dependent] == 0:
+                        heappush(ready, (-path_length[dependent], order[dependent], dependent))
+
+        self.build_times = {}
+        running = {}
+        max_running = workers or 1
+        build_start = perf_counter()
+        while ready or running:
+            # Submit ready objects while there are free workers
+            while ready and len(running) < max_running:
+                _, _, obj = heappop(ready)
+                start = perf_counter()
+                obj.build(builder=builder, compiler=compiler, logger=logger,
+                          workqueue=q, force=force, include_dirs=include_dirs)
+                if obj.q_task is None:
+                    # The object was up-to-date or compiled synchronously
+                    _complete(obj, start)
+                else:
+                    running[obj.q_task] = (obj, start)
+
+            if running:
+                done, _ = wait(running, timeout=DEFAULT_TIMEOUT, return_when=FIRST_COMPLETED)
+                if not done:
+                    logger.error('Compilation tasks timed out: %s', list(running))
+                    raise TimeoutError
+                for task in done:
+                    obj, start = running.pop(task)
+                    wait_and_check(task, logger=logger)
+                    _complete(obj, start)
+
+        builder.save_source_hashes()
+
+        # Report build timings and the achieved parallelism
+        elapsed = perf_counter() - build_start
+        for name, build_time in sorted(self.build_times.items(), key=lambda item: -item[1]):
+            logger.debug(f'{self}:: {name} compiled in {build_time:.2f}s')
+        if self.build_times and elapsed > 0:
+            parallelism = sum(self.build_times.values()) / elapsed
+            logger.info(f'{self}:: Compiled {len(self.build_times)} objects in {elapsed:.2f}s '
+                        f'(average parallelism {parallelism:.2f})')
+
     def wrap(self, modname, builder, sources=None, libs=None, lib_dirs=None, kind_map=None):
         """
         Wrap the compiled library using ``f90wrap`` and return the loaded module.
@@ -18,7 +18,7 @@ except ImportError:
             return func
 
 from loki.logging import debug
-from loki.tools import execute, as_tuple, flatten, cached_func
+from loki.tools import execute, as_tuple, flatten, cached_func, filehash
 from loki.build.compiler import _default_compiler
 from loki.build.header import Header
 
@@ -63,6 +63,7 @@ class Obj:
     def __init__(self, name=None, source_path=None):  # pylint: disable=unused-argument
         self.path = None  # The eventual .o path
         self.q_task = None  # The parallel worker task
+        self.compile_args = None  # The arguments of the last compilation
 
         if not hasattr(self, 'source_path'):
             # If this is the first time, establish the source path
@@ -84,6 +85,30 @@ class Obj:
             return source
         return None
 
+    @property
+    def source_hash(self):
+        """
+        Hash of the source file's content or `None` if there is no source file
+
+        The hash is recomputed when the modification time or size of the source
+        file changes, which also resets the cached :attr:`source` and the
+        properties derived from it.
+        """
+        if self.source_path is None:
+            return None
+        try:
+            stat = self.source_path.stat()
+        except OSError:
+            return None
+        file_key = (stat.st_mtime_ns, stat.st_size)
+        cached = self.__dict__.get('_source_hash')
+        if cached is None or cached[0] != file_key:
+            for attr in ('source', 'modules', 'subroutines', 'uses', 'includes'):
+                self.__dict__.pop(attr, None)
+            cached = (file_key, filehash(self.source))
+            self._source_hash = cached
+        return cached[1]
+
     @cached_property
     def modules(self):
         return list(_re_module.findall(self.source))
@@ -100,6 +125,8 @@ class Obj:
 
     @cached_property
     def includes(self):
+        if self.source is None:
+            return []
         return list(_re_include.findall(self.source))
 
     @property
@@ -150,6 +177,7 @@ class Obj:
         t_time = target.stat().st_mtime if target.exists() else None
         s_time = source.stat().st_mtime if source.exists() else None
 
+        self.compile_args = None
         if not force and t_time is not None and s_time is not None \
            and t_time > s_time:
             logger.debug(f'{self} up-to-date, skipping...')
@@ -158,10 +186,20 @@ class Obj:
         args = compiler.compile_args(source=source, include_dirs=include_dirs,
                                      target=target, mode=mode, mod_dir=build_dir)
 
+        # Skip objects whose source content and compile arguments are unchanged since
+        # the last compilation
+        if not force and t_time is not None and builder is not None and builder.is_unchanged(self, args):
+            logger.debug(f'{self} unchanged, skipping...')
+            target.touch()
+            return
+
+        self.compile_args = args
         if workqueue is not None:
             self.q_task = workqueue.execute(args, log_queue=workqueue.log_queue)
         else:
             execute(args)
+            if builder is not None:
+                builder.record_build(self)
 
     def wrap(self, builder=None, kind_map=None):
         """
@@ -63,17 +63,39 @@ class StrCompareMixin:
 
     The purpose of the string comparison override is to reliably and flexibly
     identify expression symbols from equivalent strings.
+
+    The canonical string representation of an expression node is computed only
+    once and cached on the node, relying on expression nodes being immutable.
+    Expression nodes should therefore never be modified in-place, but replaced
+    by a new node instead (e.g., via :meth:`clone` or :any:`SubstituteExpressions`).
     """
 
     @staticmethod
     def _canonical(s):
         """ Define canonical string representations (lower-case, no spaces) """
+        if isinstance(s, StrCompareMixin):
+            return s._canonical_key
         if config['case-sensitive']:
             return str(s).replace(' ', '')
         return str(s).lower().replace(' ', '')
 
+    @property
+    def _canonical_key(self):
+        """
+        The cached canonical string representation of this node
+        """
+        try:
+            key, key_lower = self._canonical_keys
+        except AttributeError:
+            key = str(self).replace(' ', '')
+            key_lower = key.lower()
+            self._canonical_keys = (key, key_lower)
+        if config['case-sensitive']:
+            return key
+        return key_lower
+
     def __hash__(self):
-        return hash(self._canonical(self))
+        return hash(self._canonical_key)
 
     def __eq__(self, other):
         if isinstance(other, (str, type(self))):
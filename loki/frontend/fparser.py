@@ -45,7 +45,59 @@ from loki.config import config
 
 
 __all__ = ['HAVE_FP', 'FParser2IR', 'parse_fparser_file', 'parse_fparser_source',
-           'parse_fparser_ast', 'parse_fparser_expression', 'get_fparser_node']
+           'parse_fparser_ast', 'parse_fparser_expression', 'get_fparser_node',
+           'get_fparser_parser']
+
+
+_fparser_cache = {}
+"""Cache of fparser top-level parser classes, see :any:`get_fparser_parser`"""
+
+
+def get_fparser_parser(std='f2008'):
+    """
+    Return fparser's top-level parser class for the given Fortran standard
+
+    Creating the parser via fparser's ``ParserFactory`` sets up fparser's class
+    hierarchy, which is a global state and costly to build. This is therefore
+    done only once per process and the result is reused for all subsequent
+    parser invocations, unless the class hierarchy has since been set up for
+    a different standard (e.g., by another ``ParserFactory`` call).
+
+    Note that fparser's symbol tables are not cleared when the cached parser
+    is returned, which callers have to take care of.
+
+    Parameters
+    ----------
+    std : str, optional
+        The Fortran standard (default: ``'f2008'``)
+
+    Returns
+    -------
+    The parser class, that can be called with a ``FortranReader`` object
+    """
+    if not HAVE_FP:
+        error('Fparser is not available. Try "pip install fparser".')
+        raise RuntimeError
+
+    # ParserFactory replaces the subclasses dict on every call, which allows to
+    # detect whether the class hierarchy is still the one we created
+    parser, subclasses = _fparser_cache.get(std, (None, None))
+    if parser is None or Fortran2003.Base.subclasses is not subclasses:
+        _fparser_cache.clear()
+        parser = ParserFactory().create(std=std)
+        _fparser_cache[std] = (parser, Fortran2003.Base.subclasses)
+    return parser
+
+
+def _clear_fparser_symbol_tables():
+    """
+    Clear FParser's symbol tables if the FParser version is new enough to have them
+    """
+    try:
+        from fparser.two.symbol_table import SYMBOL_TABLES  # pylint: disable=import-outside-toplevel
+        SYMBOL_TABLES.clear()
+    except ImportError:
+        pass
 
 
 @Timer(logger=debug, text=lambda s: f'[Loki::FP] Executed parse_fparser_file in {s:.2f}s')
@@ -67,15 +119,9 @@ def parse_fparser_source(source):
         error('Fparser is not available. Try "pip install fparser".')
         raise RuntimeError
 
-    # Clear FParser's symbol tables if the FParser version is new enough to have them
-    try:
-        from fparser.two.symbol_table import SYMBOL_TABLES  # pylint: disable=import-outside-toplevel
-        SYMBOL_TABLES.clear()
-    except ImportError:
-        pass
-
+    _clear_fparser_symbol_tables()
     reader = FortranStringReader(source, ignore_comments=False)
-    f2008_parser = ParserFactory().create(std='f2008')
+    f2008_parser = get_fparser_parser(std='f2008')
 
     return f2008_parser(reader)
 
@@ -105,8 +151,9 @@ def parse_fparser_ast(ast, raw_source, pp_info=None, definitions=None, scope=Non
         The control flow tree
     """
     # Parse the raw FParser language AST into our internal IR
-    _ir = FParser2IR(raw_source=raw_source, definitions=definitions, pp_info=pp_info, scope=scope).visit(ast)
-    _ir = sanitize_ir(_ir, FP, pp_registry=sanitize_registry[FP], pp_info=pp_info)
+    with ir.trusted_node_construction():
+        _ir = FParser2IR(raw_source=raw_source, definitions=definitions, pp_info=pp_info, scope=scope).visit(ast)
+        _ir = sanitize_ir(_ir, FP, pp_registry=sanitize_registry[FP], pp_info=pp_info)
     return _ir
 
 
@@ -136,7 +183,8 @@ def parse_fparser_expression(source, scope):
         error('Fparser is not installed')
         raise RuntimeError
 
-    _ = ParserFactory().create(std='f2008')
+    _ = get_fparser_parser(std='f2008')
+    _clear_fparser_symbol_tables()
     # Wrap source in brackets to make sure it appears like a valid expression
     # for fparser, and strip that Parenthesis node from the ast immediately after
     ast = Fortran2003.Primary('(' + source + ')').children[1]
@@ -292,7 +340,8 @@ class FParser2IR(GenericVisitor):
         Helper method that returns the label of the node.
         """
         if o is not None and not isinstance(o, str) and o.item is not None:
-            return getattr(o.item, 'label', None)
+            label = getattr(o.item, 'label', None)
+            return None if label is None else str(label)
         return None
 
     def visit(self, o, **kwargs):  # pylint: disable=arguments-differ
@@ -2727,7 +2776,7 @@ class FParser2IR(GenericVisitor):
         # Handle all cases
         conditions = tuple(self.visit(c, **kwargs) for c in where_stmts)
         bodies = tuple(
-            flatten(as_tuple(self.visit(c, **kwargs) for c in o.children[start+1:stop]))
+            tuple(flatten(as_tuple(self.visit(c, **kwargs) for c in o.children[start+1:stop])))
             for start, stop in zip(where_stmts_index[:-1], where_stmts_index[1:])
         )
 
@@ -8,7 +8,9 @@
 """
 Preprocessing utilities for frontends.
 """
+from bisect import bisect_right
 from collections import defaultdict, OrderedDict
+from itertools import accumulate
 from pathlib import Path
 import io
 import re
@@ -107,6 +109,10 @@ def sanitize_input(source, frontend):
 
     The ``sanitize_registry`` (see below) holds pre-defined rules
     for each frontend.
+
+    Each rule is applied only to the lines that contain the rule's
+    :attr:`PPRule.prefilter` string, which are determined with a single
+    search over the source string.
     """
 
     # Apply preprocessing rules and store meta-information
@@ -114,14 +120,13 @@ def sanitize_input(source, frontend):
     for name, rule in sanitize_registry[frontend].items():
         # Apply rule filter over source file
         rule.reset()
-        new_source = ''
-        for ll, line in enumerate(source.splitlines(keepends=True)):
-            ll += 1  # Correct for Fortran counting
-            new_source += rule.filter(line, lineno=ll)
+        lines = source.splitlines(keepends=True)
+        for ll in rule.candidate_lines(source, lines):
+            lines[ll] = rule.filter(lines[ll], lineno=ll+1)  # Correct for Fortran counting
+        source = ''.join(lines)
 
         # Store met-information from rule
         pp_info[name] = rule.info
-        source = new_source
 
     return source, pp_info
 
@@ -182,20 +187,72 @@ class PPRule:
     """
     A preprocessing rule that defines and applies a source replacement
     and collects associated meta-data.
+
+    Parameters
+    ----------
+    match : str or :any:`re.Pattern`
+        The string or regular expression pattern to replace
+    replace : str or callable
+        The replacement string, or a callable that is given to :any:`re.sub`
+    postprocess : callable, optional
+        Callback to re-insert the meta-data into the IR
+    prefilter : str, optional
+        A string that is contained in every line that :data:`match` can match.
+        Lines without this string are not filtered. It is matched case-insensitively
+        if :data:`match` is a case-insensitive pattern. For string rules, this
+        defaults to :data:`match`.
     """
 
     _empty_pattern = re.compile('')
 
-    def __init__(self, match, replace, postprocess=None):
+    def __init__(self, match, replace, postprocess=None, prefilter=None):
         self.match = match
         self.replace = replace
 
+        if prefilter is None and isinstance(match, str):
+            prefilter = match
+        if prefilter is None:
+            self.prefilter = None
+        else:
+            flags = match.flags & re.I if isinstance(match, type(self._empty_pattern)) else 0
+            self.prefilter = re.compile(re.escape(prefilter), flags)
+
         self._postprocess = postprocess
         self._info = defaultdict(list)
 
     def reset(self):
         self._info = defaultdict(list)
 
+    def candidate_lines(self, source, lines):
+        """
+        Determine the indices of :data:`lines` that have to be filtered
+
+        Parameters
+        ----------
+        source : str
+            The source string
+        lines : list of str
+            The lines of :data:`source`, as obtained by :meth:`str.splitlines`
+            with ``keepends=True``
+
+        Returns
+        -------
+        iterable of int
+            The indices of all lines that contain the :attr:`prefilter` string,
+            or all line indices if there is no :attr:`prefilter`
+        """
+        if self.prefilter is None:
+            return range(len(lines))
+
+        # Map the offsets of prefilter matches to line indices
+        line_ends = list(accumulate(map(len, lines)))
+        candidates = []
+        for match in self.prefilter.finditer(source):
+            ll = bisect_right(line_ends, match.start())
+            if not candidates or candidates[-1] != ll:
+                candidates.append(ll)
+        return candidates
+
     def filter(self, line, lineno):
         """
         Filter a source line by matching the given rule and storing meta-content.
@@ -227,23 +284,26 @@ class PPRule:
 sanitize_registry = {
     REGEX: {
         # Strip line annotations from Fypp preprocessor
-        'FYPP ANNOTATIONS': PPRule(match=re.compile(r'(# [1-9].*\".*\.fypp\"\n)'), replace=''),
+        'FYPP ANNOTATIONS': PPRule(
+            match=re.compile(r'(# [1-9].*\".*\.fypp\"\n)'), replace='', prefilter='.fypp"'),
     },
     OMNI: {},
     OFP: {
         # Remove various IBM directives
-        'IBM_DIRECTIVES': PPRule(match=re.compile(r'(@PROCESS.*\n)'), replace='\n'),
+        'IBM_DIRECTIVES': PPRule(match=re.compile(r'(@PROCESS.*\n)'), replace='\n', prefilter='@PROCESS'),
 
         # Despite F2008 compatability, OFP does not recognise the CONTIGUOUS keyword :(
         'CONTIGUOUS': PPRule(
-            match=re.compile(r', CONTIGUOUS', re.I), replace='', postprocess=reinsert_contiguous),
+            match=re.compile(r', CONTIGUOUS', re.I), replace='', postprocess=reinsert_contiguous,
+            prefilter=', CONTIGUOUS'),
 
         # Strip line annotations from Fypp preprocessor
-        'FYPP ANNOTATIONS': PPRule(match=re.compile(r'(# [1-9].*\".*\.fypp\"\n)'), replace=''),
+        'FYPP ANNOTATIONS': PPRule(
+            match=re.compile(r'(# [1-9].*\".*\.fypp\"\n)'), replace='', prefilter='.fypp"'),
     },
     FP: {
         # Remove various IBM directives
-        'IBM_DIRECTIVES': PPRule(match=re.compile(r'(@PROCESS.*\n)'), replace='\n'),
+        'IBM_DIRECTIVES': PPRule(match=re.compile(r'(@PROCESS.*\n)'), replace='\n', prefilter='@PROCESS'),
 
         # Enquote string CPP directives in Fortran source lines to make them string constants
         # Note: this is a bit tricky as we need to make sure that we don't replace it inside CPP
@@ -252,7 +312,7 @@ sanitize_registry = {
             match=re.compile((
                 r'(?P<pp>^\s*#.*__(?:FILE|FILENAME|DATE|VERSION)__)|'  # Match inside a directive
                 r'(?P<else>__(?:FILE|FILENAME|DATE|VERSION)__)')),     # Match elsewhere
-            replace=lambda m: m['pp'] or f'"{m["else"]}"'),
+            replace=lambda m: m['pp'] or f'"{m["else"]}"', prefilter='__'),
 
         # Replace integer CPP directives by 0
         'INTEGER_PP_DIRECTIVES': PPRule(match='__LINE__', replace='0'),
@@ -262,7 +322,7 @@ sanitize_registry = {
             match=re.compile((r'(?P<ws>^\s*)(?P<pre>OPEN\s*\(.*?)'
                               r'(?P<convert>,?\s*CONVERT=[\'\"](?:BIG|LITTLE)_ENDIAN[\'\"]\s*)'
                               r'(?P<post>.*?$)'), re.I),
-            replace=r'\g<ws>\g<pre>\g<post>', postprocess=reinsert_convert_endian),
+            replace=r'\g<ws>\g<pre>\g<post>', postprocess=reinsert_convert_endian, prefilter='CONVERT='),
 
         # Replace NEWUNIT argument in OPEN calls
         'OPEN_NEWUNIT': PPRule(
@@ -271,10 +331,11 @@ sanitize_registry = {
                               r'(?P<args2>.*?$)'), re.I),
             replace=lambda m: f'{m["ws"]}{m["open"]}{m["newunit_val"]}{m["delim"] or ""}' +
                               f'{m["args1"]}{m["args2"]}',
-            postprocess=reinsert_open_newunit),
+            postprocess=reinsert_open_newunit, prefilter='NEWUNIT='),
 
         # Strip line annotations from Fypp preprocessor
-        'FYPP ANNOTATIONS': PPRule(match=re.compile(r'(# [1-9].*\".*\.fypp\"\n)'), replace=''),
+        'FYPP ANNOTATIONS': PPRule(
+            match=re.compile(r'(# [1-9].*\".*\.fypp\"\n)'), replace='', prefilter='.fypp"'),
     }
 }
 """
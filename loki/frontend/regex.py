@@ -13,25 +13,38 @@ from Fortran source files without the need to generate a complete
 parse tree.
 """
 from abc import abstractmethod
+from collections import Counter
 from enum import Flag, auto
+from itertools import islice
 import re
 from codetiming import Timer
 
 from loki import ir
 from loki.config import config
 from loki.expression import symbols as sym
-from loki.frontend.source import Source, FortranReader
+from loki.frontend.source import Source, FortranReader, is_free_form
 from loki.logging import debug
 from loki.scope import SymbolAttributes
 from loki.tools import as_tuple, timeout
 from loki.types import BasicType, ProcedureType, DerivedType
 
-__all__ = ['RegexParserClass', 'parse_regex_source', 'HAVE_REGEX']
+__all__ = [
+    'RegexParserClass', 'parse_regex_source', 'complete_regex_source', 'regex_completion_counter',
+    'HAVE_REGEX'
+]
 
 
 HAVE_REGEX = True
 """Indicate that the regex frontend is available."""
 
+regex_completion_counter = Counter()
+"""
+Number of :meth:`ProgramUnit.make_complete` calls with the :any:`REGEX` frontend
+that required a ``'full'`` parse of the program unit, that were completed
+``'incremental'``-ly via :any:`complete_regex_source`, or that were ``'skipped'``
+because all requested parser classes had been matched before
+"""
+
 
 class RegexParserClass(Flag):
     """
@@ -52,6 +65,139 @@ class RegexParserClass(Flag):
     AllClasses = ProgramUnitClass | InterfaceClass | ImportClass | TypeDefClass | DeclarationClass | CallClass  # pylint: disable=unsupported-binary-operation
 
 
+_re_block_line = re.compile(
+    r'(?P<end>end(?:[ \t]*(?P<end_keyword>module|subroutine|function|interface|type)\b|$))'
+    r'|(?P<contains>contains$)'
+    r'|(?P<routine>[ \t\w()=]*(?P<routine_keyword>subroutine|function)[ \t]+\w+\b)'
+    r'|(?P<module>module[ \t]+(?!procedure\b)\w+)'
+    r'|(?P<interface>(?:abstract[ \t]+)?interface\b)'
+    r'|(?P<type>type(?:[ \t]*,[ \t]*[\w\(\)]+)*?(?:[ \t]*::[ \t]*|[ \t]+)(?!is\b)\w+)',
+    re.IGNORECASE
+)
+"""
+Pattern to classify the lines that open or close a block in :any:`scan_block`
+
+This must be kept consistent with the start line patterns of the block patterns,
+e.g., :any:`ModulePattern`.
+"""
+
+
+def scan_block(reader, keywords):
+    """
+    Find the first top-level block opened by one of the given :data:`keywords`
+
+    This performs a single forward pass over the lines in the sanitized
+    source, keeping track of the nesting of ``module``, ``subroutine``,
+    ``function``, ``interface`` and ``type`` blocks on a stack. This allows
+    to determine the extent of a block in time linear in the number of lines,
+    without the backtracking of a regular expression that spans the entire
+    block.
+
+    A bare ``END`` statement closes the innermost program unit, and a
+    mismatched ``END`` statement closes all blocks nested inside the
+    matching one. Blocks that are not closed before the end of the
+    source are not considered to be blocks and the scan resumes
+    after their opening line.
+
+    Parameters
+    ----------
+    reader : :any:`FortranReader`
+        The reader object containing a sanitized Fortran source
+    keywords : tuple of str
+        The (lower case) keywords of blocks to look for
+
+    Returns
+    -------
+    tuple or NoneType
+        The line indices ``(start, contains, end)`` in :attr:`FortranReader.sanitized_lines`
+        of the first matching block, with ``contains`` the index of the ``CONTAINS``
+        statement of the block or `None`. `None` if no block was found.
+    """
+    first = 0
+    while True:
+        stack = []  # Entries of the form [keyword, start, contains]
+        lines = islice(reader.iter_sanitized_lines(), first, None)
+        for idx, line in enumerate(lines, start=first):
+            match = _re_block_line.match(line.line)
+            if not match:
+                continue
+
+            kind = match.lastgroup
+            if kind == 'end':
+                keyword = match['end_keyword']
+                if keyword is None:
+                    closes = ('module', 'subroutine', 'function')
+                else:
+                    closes = (keyword.lower(),)
+                depth = next((d for d in reversed(range(len(stack))) if stack[d][0] in closes), None)
+                if depth is None:
+                    continue
+                keyword, start, contains = stack[depth]
+                del stack[depth:]
+                if depth == 0 and keyword in keywords:
+                    return start, contains, idx
+            elif kind == 'contains':
+                if stack and stack[-1][2] is None:
+                    stack[-1][2] = idx
+            elif kind == 'routine':
+                stack.append([match['routine_keyword'].lower(), idx, None])
+            else:
+                stack.append([kind, idx, None])
+
+        if not stack:
+            return None
+        # The outermost open block has not been closed: skip its opening line
+        first = stack[0][1] + 1
+
+
+class BlockMatch:
+    """
+    The result of matching a block via :any:`scan_block` in the sanitized source
+
+    This mimics the interface of :class:`re.Match` for the use in the block patterns
+    (e.g., :any:`ModulePattern`): the groups of the match of the start line are available
+    as well as the groups ``spec`` (or ``body``) and ``contains``, which span the block's
+    content before and after the ``CONTAINS`` statement, respectively.
+
+    Parameters
+    ----------
+    reader : :any:`FortranReader`
+        The reader object in which the block was found
+    lines : tuple of int
+        The line indices ``(start, contains, end)`` as returned by :any:`scan_block`
+    head : :class:`re.Match`
+        The match of the start line
+    body_group : str, optional
+        The name of the group for the content before the ``CONTAINS`` statement
+    """
+
+    def __init__(self, reader, lines, head, body_group='spec'):
+        self.reader = reader
+        start, contains, end = lines
+        spans = reader.sanitized_spans
+        self.head = head
+        self.offset = spans[start]
+        self.spans = {
+            0: (self.offset + head.start(), spans[end + 1] - 1),
+            body_group: (self.offset + head.end(), spans[end] if contains is None else spans[contains]),
+            'contains': None if contains is None else (spans[contains], spans[end])
+        }
+
+    def span(self, group=0):
+        if group in self.spans:
+            return self.spans[group] or (-1, -1)
+        start, end = self.head.span(group)
+        if start == -1:
+            return start, end
+        return self.offset + start, self.offset + end
+
+    def __getitem__(self, group):
+        if group in self.spans:
+            span = self.spans[group]
+            return None if span is None else self.reader.get_sanitized_substring(span)
+        return self.head[group]
+
+
 class Pattern:
     """
     Base class for patterns used in the :any:`REGEX` frontend
@@ -103,6 +249,34 @@ class Pattern:
             The parent scope for the current source fragment
         """
 
+    def search_block(self, reader, keywords, body_group='spec'):
+        """
+        Find the first top-level block opened by one of :data:`keywords` in the reader object
+
+        The extent of the block is determined by :any:`scan_block` and the
+        stored pattern is matched against the block's start line.
+
+        Parameters
+        ----------
+        reader : :any:`FortranReader`
+            The reader object containing a sanitized Fortran source
+        keywords : tuple of str
+            The (lower case) keywords of blocks to look for
+        body_group : str, optional
+            The name of the group for the content before the ``CONTAINS`` statement
+
+        Returns
+        -------
+        :any:`BlockMatch` or NoneType
+            The match object or `None` if no block was found
+        """
+        lines = scan_block(reader, keywords)
+        if lines is None:
+            return None
+        spans = reader.sanitized_spans
+        head = self.pattern.match(reader.get_sanitized_substring((spans[lines[0]], spans[lines[0] + 1] - 1)))
+        return BlockMatch(reader, lines, head, body_group=body_group)
+
     @classmethod
     def match_block_candidates(cls, reader, candidates, parser_classes=None, scope=None):
         """
@@ -192,7 +366,7 @@ class Pattern:
                 for candidate in filtered_candidates:
                     match = candidate.match(reader, parser_classes=parser_classes, scope=scope)
                     if match:
-                        if last_match - idx > 1:
+                        if idx - last_match > 1:
                             span = (reader.sanitized_spans[last_match + 1], reader.sanitized_spans[idx])
                             source = reader.source_from_sanitized_span(span)
                             ir_ += [ir.RawSource(source.string, source=source)]
@@ -369,9 +543,172 @@ def parse_regex_source(source, parser_classes=None, scope=None):
     else:
         reader = FortranReader(source)
     timeout_message = f'REGEX frontend timeout of {config["regex-frontend-timeout"]} s exceeded'
-    with timeout(config['regex-frontend-timeout'], message=timeout_message):
+    with timeout(config['regex-frontend-timeout'], message=timeout_message), ir.trusted_node_construction():
         ir_ = Pattern.match_block_candidates(reader, candidates, parser_classes=parser_classes, scope=scope)
-    return ir.Section(body=as_tuple(ir_), source=source)
+        return ir.Section(body=as_tuple(ir_), source=source)
+
+
+_SPLIT_BLOCK_CLASSES = (
+    (RegexParserClass.TypeDefClass, RegexParserClass.DeclarationClass),
+    (RegexParserClass.InterfaceClass, RegexParserClass.ImportClass | RegexParserClass.DeclarationClass),
+)
+"""
+Pairs of parser classes ``(block_class, statement_class)``, for which statements matched
+by ``statement_class`` may appear inside of blocks matched by ``block_class``
+
+If ``statement_class`` was active in a previous parse, the unmatched source fragments
+do not contain these blocks in one piece and ``block_class`` cannot be added incrementally.
+"""
+
+
+@Timer(logger=debug, text=lambda s: f'[Loki::REGEX] Executed complete_regex_source in {s:.2f}s')
+def complete_regex_source(program_unit, parser_classes):
+    """
+    Incrementally match additional parser classes in a program unit created by the
+    :any:`REGEX` frontend
+
+    Instead of parsing the entire source of :data:`program_unit` again, only the
+    :any:`RawSource` fragments that remained unmatched in the previous parse are
+    matched against the active patterns, and the resulting nodes are spliced into the
+    existing IR. This includes the IR of member procedures, derived type definitions
+    and procedures in interface blocks.
+
+    The IR is left unchanged if an incremental update is not possible, i.e., if
+    ``ProgramUnitClass`` was not active in the previous parse, or if a newly added
+    block pattern may contain statements that have been matched before
+    (see :data:`_SPLIT_BLOCK_CLASSES`).
+
+    Parameters
+    ----------
+    program_unit : :any:`ProgramUnit`
+        The incomplete program unit
+    parser_classes : RegexParserClass
+        Active parser classes for matching, including the previously active classes
+
+    Returns
+    -------
+    bool
+        `True` if the IR has been updated incrementally, `False` if a full parse of
+        the program unit is required instead
+    """
+    if not program_unit.source:
+        return False
+    units = tuple(_incomplete_program_units(program_unit))
+    for unit in units:
+        previous_classes = unit._parser_classes  # pylint: disable=protected-access
+        if not previous_classes or not previous_classes & RegexParserClass.ProgramUnitClass:
+            return False
+        new_classes = parser_classes & ~previous_classes
+        if previous_classes & (RegexParserClass.TypeDefClass | RegexParserClass.InterfaceClass):
+            # Source fragments preceding a matched block are matched with all parser classes
+            # in Pattern.match_block_statement_candidates
+            previous_classes = RegexParserClass.AllClasses
+        if any(new_classes & block_class and previous_classes & statement_class
+               for block_class, statement_class in _SPLIT_BLOCK_CLASSES):
+            return False
+
+    # Source fragments are not necessarily recognizable as free-form source,
+    # therefore we determine the format from the full program unit
+    free_form = is_free_form(program_unit.source.string.split('\n'))
+
+    timeout_message = f'REGEX frontend timeout of {config["regex-frontend-timeout"]} s exceeded'
+    with timeout(config['regex-frontend-timeout'], message=timeout_message), ir.trusted_node_construction():
+        for unit in units:
+            _complete_program_unit(unit, parser_classes, free_form)
+    return True
+
+
+def _incomplete_program_units(program_unit):
+    """
+    Yield :data:`program_unit` and all incomplete program units nested in it
+    """
+    from loki import ProgramUnit  # pylint: disable=import-outside-toplevel,cyclic-import
+    if not program_unit._incomplete:  # pylint: disable=protected-access
+        return
+    yield program_unit
+    for node in program_unit.spec.body if program_unit.spec else ():
+        if isinstance(node, ir.Interface):
+            for routine in node.body:
+                if isinstance(routine, ProgramUnit):
+                    yield from _incomplete_program_units(routine)
+    for node in program_unit.contains.body if program_unit.contains else ():
+        if isinstance(node, ProgramUnit):
+            yield from _incomplete_program_units(node)
+
+
+def _complete_program_unit(program_unit, parser_classes, free_form):
+    """
+    Match :data:`parser_classes` in the unmatched fragments of the spec of :data:`program_unit`
+    """
+    from loki import Module  # pylint: disable=import-outside-toplevel,cyclic-import
+    # pylint: disable=protected-access
+    if not parser_classes & ~program_unit._parser_classes:
+        return
+    if isinstance(program_unit, Module):
+        pattern = PATTERN_REGISTRY['ModulePattern']
+    else:
+        pattern = PATTERN_REGISTRY['SubroutineFunctionPattern']
+    if program_unit.spec is not None:
+        body = _complete_body(
+            program_unit.spec.body, pattern.spec_block_candidates, pattern.spec_statement_candidates,
+            parser_classes, program_unit, free_form
+        )
+        if body is not None:
+            program_unit.spec._update(body=body)
+            # Procedure bindings declare the bound procedures in the parent scope, which
+            # must not override the type information of existing member procedures
+            for routine in program_unit.subroutines:
+                routine.register_in_parent_scope()
+    program_unit._parser_classes = parser_classes | program_unit._parser_classes
+
+
+def _complete_body(body, block_candidates, statement_candidates, parser_classes, scope, free_form):
+    """
+    Match :data:`parser_classes` in the :any:`RawSource` nodes in :data:`body`
+
+    Returns the new body, or `None` if nothing has changed.
+    """
+    new_body = []
+    changed = False
+    for node in body:
+        if isinstance(node, ir.RawSource) and node.source and node.source.string:
+            reader = FortranReader(node.source.string, first_line=node.source.lines[0], free_form=free_form)
+            if block_candidates:
+                ir_ = Pattern.match_block_statement_candidates(
+                    reader, block_candidates, statement_candidates, parser_classes=parser_classes, scope=scope
+                )
+            else:
+                ir_ = Pattern.match_statement_candidates(
+                    reader, statement_candidates, parser_classes=parser_classes, scope=scope
+                )
+            if not all(isinstance(n, ir.RawSource) for n in ir_):
+                new_body += ir_
+                changed = True
+                continue
+        elif isinstance(node, ir.TypeDef):
+            _complete_typedef(node, parser_classes, free_form)
+        new_body += [node]
+    return tuple(new_body) if changed else None
+
+
+def _complete_typedef(typedef, parser_classes, free_form):
+    """
+    Match :data:`parser_classes` in the unmatched fragments of the body of :data:`typedef`
+
+    Procedure bindings after the ``CONTAINS`` statement have been matched together
+    with the type definition, and only the declaration part is updated.
+    """
+    pattern = PATTERN_REGISTRY['TypedefPattern']
+    body = typedef.body
+    contains_index = next(
+        (idx for idx, node in enumerate(body) if isinstance(node, ir.Intrinsic) and node.text == 'CONTAINS'),
+        len(body)
+    )
+    spec = _complete_body(
+        body[:contains_index], (), pattern.spec_statement_candidates, parser_classes, typedef, free_form
+    )
+    if spec is not None:
+        typedef._update(body=spec + tuple(body[contains_index:]))
 
 
 class ModulePattern(Pattern):
@@ -380,18 +717,13 @@ class ModulePattern(Pattern):
     """
 
     parser_class = RegexParserClass.ProgramUnitClass
+    spec_block_candidates = ('TypedefPattern', 'InterfacePattern')
+    spec_statement_candidates = ('ImportPattern', 'VariableDeclarationPattern')
 
     def __init__(self):
         super().__init__(
-            r'^module[ \t]+(?P<name>\w+)\b.*?$'
-            r'(?P<spec>.*?)'
-            r'(?P<contains>^contains\n(?:'
-            r'(?:[ \t\w()]*?subroutine.*?^end[ \t]*subroutine\b(?:[ \t]\w+)?\n)|'
-            r'(?:[ \t\w()]*?function.*?^end[ \t]*function\b(?:[ \t]\w+)?\n)|'
-            r'(?:^#\w+.*?\n)'
-            r')*)?'
-            r'^end[ \t]*module\b(?:[ \t](?P=name))?',
-            re.IGNORECASE | re.DOTALL | re.MULTILINE
+            r'^module[ \t]+(?!procedure\b)(?P<name>\w+)\b.*?$',
+            re.IGNORECASE
         )
 
     def match(self, reader, parser_classes, scope):
@@ -408,7 +740,7 @@ class ModulePattern(Pattern):
             The parent scope for the current source fragment
         """
         from loki import Module  # pylint: disable=import-outside-toplevel,cyclic-import
-        match = self.pattern.search(reader.sanitized_string)
+        match = self.search_block(reader, ('module',))
         if not match:
             return None, None, reader
 
@@ -425,11 +757,10 @@ class ModulePattern(Pattern):
             module = Module(name=name, source=source, parent=scope)
 
         if match['spec'] and match['spec'].strip():
-            block_candidates = ('TypedefPattern', 'InterfacePattern')
-            statement_candidates = ('ImportPattern', 'VariableDeclarationPattern')
             spec = self.match_block_statement_candidates(
                 reader.reader_from_sanitized_span(match.span('spec'), include_padding=True),
-                block_candidates, statement_candidates, parser_classes=parser_classes, scope=module
+                self.spec_block_candidates, self.spec_statement_candidates,
+                parser_classes=parser_classes, scope=module
             )
         else:
             spec = None
@@ -464,18 +795,13 @@ class SubroutineFunctionPattern(Pattern):
     """
 
     parser_class = RegexParserClass.ProgramUnitClass
+    spec_block_candidates = ('InterfacePattern',)
+    spec_statement_candidates = ('ImportPattern', 'VariableDeclarationPattern', 'CallPattern')
 
     def __init__(self):
         super().__init__(
-            r'^(?P<prefix>[ \t\w()=]*)?(?P<keyword>subroutine|function)[ \t]+(?P<name>\w+)\b.*?$'
-            r'(?P<spec>(?:.*?(?:^(?:abstract[ \t]+)?interface\b.*?^end[ \t]+interface)?)+)'
-            r'(?P<contains>^contains\n(?:'
-            r'(?:[ \t\w()=]*?subroutine.*?^end[ \t]*subroutine\b(?:[ \t]\w+)?\n)|'
-            r'(?:[ \t\w()=]*?function.*?^end[ \t]*function\b(?:[ \t]\w+)?\n)|'
-            r'(?:^#\w+.*?\n)'
-            r')*)?'
-            r'^end[ \t]*(?P=keyword)\b(?:[ \t](?P=name))?',
-            re.IGNORECASE | re.DOTALL | re.MULTILINE
+            r'^(?P<prefix>[ \t\w()=]*)?(?P<keyword>subroutine|function)[ \t]+(?P<name>\w+)\b.*?$',
+            re.IGNORECASE
         )
 
     def match(self, reader, parser_classes, scope):
@@ -492,7 +818,7 @@ class SubroutineFunctionPattern(Pattern):
             The parent scope for the current source fragment
         """
         from loki import Subroutine  # pylint: disable=import-outside-toplevel,cyclic-import
-        match = self.pattern.search(reader.sanitized_string)
+        match = self.search_block(reader, ('subroutine', 'function'))
         if not match:
             return None, None, reader
 
@@ -512,11 +838,10 @@ class SubroutineFunctionPattern(Pattern):
             )
 
         if match['spec']:
-            statement_candidates = ('ImportPattern', 'VariableDeclarationPattern', 'CallPattern')
-            block_candidates = ('InterfacePattern',)
             spec = self.match_block_statement_candidates(
                 reader.reader_from_sanitized_span(match.span('spec'), include_padding=True),
-                block_candidates, statement_candidates, parser_classes=parser_classes, scope=routine
+                self.spec_block_candidates, self.spec_statement_candidates,
+                parser_classes=parser_classes, scope=routine
             )
         else:
             spec = None
@@ -560,10 +885,8 @@ class InterfacePattern(Pattern):
     def __init__(self):
         super().__init__(
             r'^(?P<is_abstract>abstract[ \t]+)?'
-            r'interface\b[ \t]*(?P<spec>\w+\b.*?$)?'
-            r'(?P<body>.*?)'
-            r'^end[ \t]+interface\b[ \t]*(?P=spec)?',
-            re.IGNORECASE | re.DOTALL | re.MULTILINE
+            r'interface\b[ \t]*(?P<spec>\w+\b.*?$)?',
+            re.IGNORECASE
         )
 
     def match(self, reader, parser_classes, scope):
@@ -580,7 +903,7 @@ class InterfacePattern(Pattern):
             The parent scope for the current source fragment
         """
         from loki import Interface  # pylint: disable=import-outside-toplevel,cyclic-import
-        match = self.pattern.search(reader.sanitized_string)
+        match = self.search_block(reader, ('interface',), body_group='body')
         if not match:
             return None, None, reader
 
@@ -601,7 +924,7 @@ class InterfacePattern(Pattern):
         else:
             spec = None
 
-        interface = Interface(body=body, abstract=is_abstract, spec=spec, source=source)
+        interface = Interface(body=as_tuple(body), abstract=is_abstract, spec=spec, source=source)
         if match.span()[0] > 0:
             pre = reader.reader_from_sanitized_span((0, match.span()[0]), include_padding=True)
         else:
@@ -653,7 +976,7 @@ class ProcedureStatementPattern(Pattern):
             for s in procedures
         ]
         return ir.ProcedureDeclaration(
-            symbols=symbols, module=is_module, source=reader.source_from_current_line()
+            symbols=as_tuple(symbols), module=is_module, source=reader.source_from_current_line()
         )
 
 
@@ -663,16 +986,15 @@ class TypedefPattern(Pattern):
     """
 
     parser_class = RegexParserClass.TypeDefClass
+    spec_statement_candidates = ('VariableDeclarationPattern',)
+    contains_statement_candidates = ('ProcedureBindingPattern', 'GenericBindingPattern')
 
     def __init__(self):
         super().__init__(
-            r'type(?:[ \t]*,[ \t]*[\w\(\)]+)*?'  # type keyword with optional parameters
+            r'^type(?:[ \t]*,[ \t]*[\w\(\)]+)*?'  # type keyword with optional parameters
             r'(?:[ \t]*::[ \t]*|[ \t]+)'  # optional `::` separator or white space
-            r'(?P<name>\w+)\b.*?$'  # Type name
-            r'(?P<spec>.*?)'  # Type spec
-            r'(?P<contains>^contains\n.*?)?'  # Optional procedure bindings part (after ``contains`` keyword)
-            r'^end[ \t]*type\b(?:[ \t]+(?P=name))?',  # End keyword with optionally type name repeated
-            re.IGNORECASE | re.DOTALL | re.MULTILINE
+            r'(?!is\b)(?P<name>\w+)\b.*?$',  # Type name
+            re.IGNORECASE
         )
 
     def match(self, reader, parser_classes, scope):
@@ -688,7 +1010,7 @@ class TypedefPattern(Pattern):
         scope : :any:`Scope`
             The parent scope for the current source fragment
         """
-        match = self.pattern.search(reader.sanitized_string)
+        match = self.search_block(reader, ('type',))
         if not match:
             return None, None, reader
 
@@ -696,10 +1018,9 @@ class TypedefPattern(Pattern):
         typedef = ir.TypeDef(name=match['name'], body=(), parent=scope, source=source)
 
         if match['spec'] and match['spec'].strip():
-            statement_candidates = ('VariableDeclarationPattern',)
             spec = self.match_statement_candidates(
                 reader.reader_from_sanitized_span(match.span('spec'), include_padding=True),
-                statement_candidates, parser_classes=parser_classes, scope=typedef
+                self.spec_statement_candidates, parser_classes=parser_classes, scope=typedef
             )
         else:
             spec = []
@@ -709,10 +1030,9 @@ class TypedefPattern(Pattern):
             span = match.span('contains')
             span = (span[0] + 8, span[1])  # Skip the "contains" keyword as it has been added
 
-            statement_candidates = ('ProcedureBindingPattern', 'GenericBindingPattern')
             contains += self.match_statement_candidates(
                 reader.reader_from_sanitized_span(span, include_padding=True),
-                statement_candidates, parser_classes=parser_classes, scope=typedef
+                self.contains_statement_candidates, parser_classes=parser_classes, scope=typedef
             )
         else:
             contains = []
@@ -778,7 +1098,7 @@ class ProcedureBindingPattern(Pattern):
                 bind_name = sym.Variable(name=s[1], type=type_, scope=scope.parent)
                 symbols += [sym.Variable(name=s[0], type=type_.clone(bind_names=(bind_name,)), scope=scope)]
 
-        return ir.ProcedureDeclaration(symbols=symbols, source=reader.source_from_current_line())
+        return ir.ProcedureDeclaration(symbols=as_tuple(symbols), source=reader.source_from_current_line())
 
 
 class GenericBindingPattern(Pattern):
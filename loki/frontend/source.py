@@ -9,6 +9,8 @@
 Implementation of :any:`Source` and adjacent utilities
 """
 from bisect import bisect_left
+from collections.abc import Sequence
+from functools import cached_property, lru_cache
 from itertools import accumulate
 import re
 from codetiming import Timer
@@ -119,6 +121,325 @@ class Source:
         ]
 
 
+class SanitizedSpans(Sequence):
+    """
+    Read-only view of the line start indices of a section of a sanitized
+    source string
+
+    This allows :any:`FortranReader` objects for a section of the source to
+    share the span table of the reader they have been created from, instead
+    of copying and shifting it.
+
+    Parameters
+    ----------
+    spans : tuple of int
+        The line start indices in the full sanitized string
+    start : int
+        The index of the first line of the section in :data:`spans`
+    length : int
+        The number of entries in the view
+    """
+
+    __slots__ = ('spans', 'start', 'length')
+
+    def __init__(self, spans, start, length):
+        self.spans = spans
+        self.start = start
+        self.length = length
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self[idx] for idx in range(*index.indices(self.length)))
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError('SanitizedSpans index out of range')
+        return self.spans[self.start + index] - self.spans[self.start]
+
+
+class SanitizedLine:
+    """
+    A single statement or preprocessor directive in the sanitized source
+    produced by :any:`FortranReader`
+
+    This mirrors the attributes of fparser's ``Line`` objects that are used
+    by the reader and the REGEX frontend.
+
+    Parameters
+    ----------
+    line : str
+        The sanitized statement with comments, continuations, label and
+        construct name removed
+    span : tuple of int
+        The first and last line number of the statement in the original source
+    label : int, optional
+        The statement label
+    name : str, optional
+        The construct name
+    """
+
+    __slots__ = ('line', 'span', 'label', 'name')
+
+    def __init__(self, line, span, label=None, name=None):
+        self.line = line
+        self.span = span
+        self.label = label
+        self.name = name
+
+    def __repr__(self):
+        return f'SanitizedLine({self.line!r}, {self.span})'
+
+
+_re_label = re.compile(r'\s*(?P<label>\d+)\s*(\b|(?=&)|\Z)')
+_re_construct_name = re.compile(r'\s*(?P<name>\w+)\s*:\s*(\b|(?=&)|\Z)')
+_re_free_format_start = re.compile(r'[^c*!]\s*[^\s\d\t]', re.IGNORECASE)
+
+
+def is_free_form(lines):
+    """
+    Determine whether the given source lines are in free-form format,
+    using the same heuristic as fparser
+
+    Parameters
+    ----------
+    lines : list of str
+        The lines of the Fortran source
+    """
+    num_lines = 0
+    for line in lines:
+        line = line.rstrip()
+        if line and line[0] != '!':
+            if line[0] != '\t' and _re_free_format_start.match(line[:5]) or line[-1] == '&':
+                return True
+            num_lines += 1
+            if num_lines == 10000:
+                break
+    return False
+
+
+def _extract_label_and_name(line):
+    """
+    Strip statement label and construct name from the beginning of :data:`line`
+    """
+    label = name = None
+    match = _re_label.match(line)
+    if match:
+        label = int(match['label'])
+        line = line[match.end():].lstrip()
+    match = _re_construct_name.match(line)
+    if match:
+        name = match['name']
+        line = line[match.end():].lstrip()
+    return label, name, line
+
+
+def _strip_inline_comment(line, quote=None):
+    """
+    Remove a trailing ``!`` comment from :data:`line`, skipping over character
+    strings
+
+    Parameters
+    ----------
+    line : str
+        The source line
+    quote : str, optional
+        The delimiter of a character string continued from the previous line
+
+    Returns
+    -------
+    tuple
+        The line without comment and the delimiter of a character string that
+        is continued on the next line (or `None`)
+    """
+    if quote is None:
+        idx = line.find('!')
+        if idx == -1:
+            if '"' not in line and "'" not in line:
+                return line, None
+        elif '"' not in line[:idx] and "'" not in line[:idx]:
+            return line[:idx], None
+
+    pos, end = 0, len(line)
+    while pos < end:
+        slashes = 0
+        if quote is None:
+            # Look for the start of a string or a comment
+            while pos < end:
+                char = line[pos]
+                if char in '"\'' and not slashes % 2:
+                    quote = char
+                    break
+                if char == '!':
+                    return line[:pos], None
+                slashes = slashes + 1 if char == '\\' else 0
+                pos += 1
+            continue
+
+        # Look for the end of the current string
+        if line[pos] == quote:
+            pos += 1
+        while pos < end:
+            char = line[pos]
+            pos += 1
+            if char == quote and not slashes % 2:
+                quote = None
+                break
+            slashes = slashes + 1 if char == '\\' else 0
+    return line, quote
+
+
+def _split_statements(line):
+    """
+    Split :data:`line` at ``;`` statement separators outside of character
+    strings and parentheses
+    """
+    parts = []
+    start, depth, quote = 0, 0, None
+    for pos, char in enumerate(line):
+        if quote is not None:
+            if char == quote:
+                quote = None
+        elif char in '"\'':
+            quote = char
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth = max(depth - 1, 0)
+        elif char == ';' and depth == 0:
+            parts += [line[start:pos].strip()]
+            start = pos + 1
+    parts += [line[start:].strip()]
+    return parts
+
+
+def _sanitize_free_form(source_lines):
+    """
+    Sanitize free-form Fortran source lines
+
+    This produces the same statements and line spans as fparser's
+    ``FortranStringReader`` with comments ignored, but does not follow
+    ``INCLUDE`` statements, and statements separated by ``;`` are not
+    lower-cased.
+
+    Parameters
+    ----------
+    source_lines : list of str
+        The lines of the original source
+
+    Returns
+    -------
+    list of :any:`SanitizedLine`
+    """
+    lines = [line.expandtabs().replace('\xa0', ' ').rstrip() for line in source_lines]
+    num_lines = len(lines)
+    items = []
+    idx = 0
+    while idx < num_lines:
+        line = lines[idx]
+        idx += 1
+        stripped = line.lstrip()
+        if not stripped or stripped[0] == '!':
+            continue
+
+        start = idx
+        if stripped[0] == '#':
+            # Preprocessor directive with backslash continuation
+            parts = []
+            while line.endswith('\\') and idx < num_lines:
+                parts += [line[:-1]]
+                line = lines[idx].rstrip()
+                idx += 1
+            parts += [line]
+            items += [SanitizedLine(''.join(parts).strip(), (start, idx))]
+            continue
+
+        label, name, line = _extract_label_and_name(line)
+        line, quote = _strip_inline_comment(line)
+        pos = line.rfind('&')
+        end = start
+        if pos == -1 or line[pos+1:].rstrip():
+            parts = [line]
+        else:
+            # Resolve line continuations
+            parts = [line[:pos]]
+            while idx < num_lines:
+                line = lines[idx]
+                idx += 1
+                stripped = line.lstrip()
+                if not stripped or stripped[0] == '!':
+                    continue
+                line, quote = _strip_inline_comment(line, quote)
+                pos = line.rfind('&')
+                if pos == -1 or line[pos+1:].rstrip():
+                    pos = len(line)
+                cont = line[:pos].find('&')
+                if cont != 1 and line[:cont].lstrip():
+                    cont = -1
+                parts += [line[cont+1:pos]]
+                end = idx
+                if pos == len(line):
+                    break
+
+        line = ''.join(parts).strip()
+        if not line:
+            continue
+        if ';' not in line:
+            items += [SanitizedLine(line, (start, end), label, name)]
+            continue
+
+        # Split multiple statements on a single line
+        first, *others = _split_statements(line)
+        if first:
+            items += [SanitizedLine(first, (start, end), label, name)]
+        for other in others:
+            if other:
+                other_label, other_name, other = _extract_label_and_name(other)
+                items += [SanitizedLine(other, (start, end), other_label, other_name)]
+    return items
+
+
+@lru_cache(maxsize=64)
+def _sanitize_source(raw_source, free_form=None):
+    """
+    Sanitize the given Fortran source string
+
+    The result is memoized per source string, so that readers created
+    repeatedly for the same source, e.g., when concretizing a file in several
+    steps, do not need to sanitize it again.
+
+    Free-form sources are sanitized natively, while fixed-form sources are
+    handed to fparser's ``FortranStringReader``.
+
+    Parameters
+    ----------
+    raw_source : str
+        The Fortran source code
+    free_form : bool, optional
+        Whether the source is in free-form format. Determined from the source if not given.
+
+    Returns
+    -------
+    tuple
+        The sanitized lines, the start index of each line in the sanitized
+        string (followed by the string length + 1), and the sanitized string
+    """
+    source_lines = raw_source.split('\n')
+    if free_form is None:
+        free_form = is_free_form(source_lines)
+    if free_form:
+        lines = tuple(_sanitize_free_form(source_lines))
+    else:
+        if FortranStringReader is None:
+            raise RuntimeError('FortranReader needs fparser2 for fixed-form source')
+        lines = tuple(FortranStringReader(raw_source))
+    spans = (0,) + tuple(accumulate(len(item.line)+1 for item in lines))
+    string = '\n'.join(item.line for item in lines)
+    return lines, spans, string
+
+
 class FortranReader:
     """
     Reader for Fortran source strings that provides a sanitized version of the source code
@@ -133,41 +454,127 @@ class FortranReader:
     This enables easier pattern matching in the source code. The original source code
     can be recovered (with some restrictions) for each position in the sanitized source string.
 
+    Readers for a section of the source (see :meth:`reader_from_sanitized_span`) share the
+    original and sanitized source with the reader they are created from and only store the
+    range of lines they cover. The attributes below are created on first access.
+
     Parameters
     ----------
     raw_source : str
         The Fortran source code
+    first_line : int, optional
+        The line number of the first line of :data:`raw_source` in the original
+        source file. If given, :data:`raw_source` is used as is, and all :any:`Source` objects created by the reader carry line numbers
+        relative to the original source file. Otherwise, :data:`raw_source` is
+        stripped and line numbers refer to the stripped string.
+    free_form : bool, optional
+        Whether :data:`raw_source` is in free-form format. This is determined from
+        the source if not given, which may be ambiguous for source fragments.
 
     Attributes
     ----------
     source_lines : list
         The lines of the original source code
-    sanitized_lines : list of :class:`fparser.common.Line`
+    sanitized_lines : list of :any:`SanitizedLine`
         Lines in the sanitized source code
     sanitized_string : str
         The sanitized source code
-    sanitized_spans : list of int
+    sanitized_spans : :any:`SanitizedSpans`
         Start index of each line in the sanitized string
     """
 
-    def __init__(self, raw_source):
+    def __init__(self, raw_source, first_line=None, free_form=None):
         self.line_offset = 0
-        raw_source = raw_source.strip()
-        self.source_lines = raw_source.splitlines()
-        self._sanitize_raw_source(raw_source)
+        if first_line is None:
+            self._line_shift = 0
+            raw_source = raw_source.strip()
+            self._source_lines = raw_source.splitlines()
+        else:
+            self._line_shift = first_line - 1
+            self._source_lines = raw_source.split('\n')
+        self._source_range = (0, len(self._source_lines))
+        self._sanitize_raw_source(raw_source, free_form)
 
     @Timer(logger=debug, text=lambda s: f'[Loki::Frontend] Executed _sanitize_raw_source in {s:.2f}s')
-    def _sanitize_raw_source(self, raw_source):
+    def _sanitize_raw_source(self, raw_source, free_form=None):
         """
         Helper routine to create a sanitized Fortran source string
         with comments removed and whitespace stripped from line beginning and end
         """
-        if FortranStringReader is None:
-            raise RuntimeError('FortranReader needs fparser2')
-        reader = FortranStringReader(raw_source)
-        self.sanitized_lines = tuple(item for item in reader)
-        self.sanitized_spans = (0,) + tuple(accumulate(len(item.line)+1 for item in self.sanitized_lines))
-        self.sanitized_string = '\n'.join(item.line for item in self.sanitized_lines)
+        self._lines, self._spans, self._string = _sanitize_source(raw_source, free_form)
+        self._line_range = (0, len(self._lines))
+
+    @cached_property
+    def source_lines(self):
+        """
+        The lines of the original source code
+        """
+        return self._source_lines[self._source_range[0]:self._source_range[1]]
+
+    @cached_property
+    def sanitized_lines(self):
+        """
+        Lines in the sanitized source code
+        """
+        return self._lines[self._line_range[0]:self._line_range[1]]
+
+    @property
+    def sanitized_spans(self):
+        """
+        Start index of each line in :attr:`sanitized_string`, followed
+        by the start index of the first line after the reader's section
+        """
+        return SanitizedSpans(self._spans, self._line_range[0], self._line_range[1] - self._line_range[0] + 1)
+
+    @cached_property
+    def sanitized_string(self):
+        """
+        The sanitized source code
+        """
+        start = self._spans[self._line_range[0]]
+        end = self._spans[self._line_range[1] + 1] if self._line_range[1] + 1 < len(self._spans) else None
+        return self._string[start:end]
+
+    def iter_sanitized_lines(self):
+        """
+        Iterate over :attr:`sanitized_lines` without creating the list of lines
+        """
+        return map(self._lines.__getitem__, range(*self._line_range))
+
+    def get_sanitized_substring(self, span):
+        """
+        Return the substring of :attr:`sanitized_string` for the given :data:`span`
+
+        Unlike slicing :attr:`sanitized_string`, this does not require the
+        sanitized string of a reader for a section of the source to be created.
+        """
+        offset = self._spans[self._line_range[0]]
+        return self._string[offset + span[0]:offset + span[1]]
+
+    def _get_sanitized_line(self, index):
+        """
+        Return the line with the given :data:`index` in :attr:`sanitized_lines`
+        """
+        if index < 0:
+            return self._lines[self._line_range[1] + index]
+        return self._lines[self._line_range[0] + index]
+
+    def _get_source_lines(self, start=0, end=None):
+        """
+        Return the lines ``[start, end)`` of :attr:`source_lines`
+        """
+        offset, last = self._source_range
+        end = last if end is None else min(offset + end, last)
+        return self._source_lines[min(offset + start, last):end]
+
+    def _create_source(self, lines, string):
+        """
+        Create a :any:`Source` object for the given :data:`lines` of the reader,
+        shifting them to the line numbers in the original source file
+        """
+        if self._line_shift:
+            lines = (lines[0] + self._line_shift, lines[1] + self._line_shift)
+        return Source(lines=lines, string=string)
 
     def get_line_index(self, line_number):
         """
@@ -198,12 +605,15 @@ class FortranReader:
             `end` exclusive (i.e. ``[start, end)``).
         """
         # First, find the corresponding line indices in the sanitized string
-        sanitized_start = bisect_left(self.sanitized_spans, span[0])
+        first, last = self._line_range
+        num_lines = last - first
+        offset = self._spans[first]
+        sanitized_start = bisect_left(self._spans, offset + span[0], lo=first, hi=last + 1) - first
         if span[1] is None:
-            sanitized_end = len(self.sanitized_lines)
+            sanitized_end = num_lines
         else:
-            sanitized_end = bisect_left(self.sanitized_spans, span[1], lo=sanitized_start)
-            sanitized_end = min(len(self.sanitized_lines), sanitized_end)
+            sanitized_end = bisect_left(self._spans, offset + span[1], lo=first + sanitized_start, hi=last + 1) - first
+            sanitized_end = min(num_lines, sanitized_end)
 
         # Next, find the corresponding line indices in the original string
         if include_padding:
@@ -211,31 +621,34 @@ class FortranReader:
                 # Span starts at the beginning of the sanitized string: include everything
                 # before as well
                 source_start = 0
-            elif sanitized_start >= len(self.sanitized_lines):
+            elif sanitized_start >= num_lines:
                 # Span starts after the sanitized string: include only lines after it
-                source_start = self.get_line_index(self.sanitized_lines[-1].span[1] + 1)
-            elif self.sanitized_lines[sanitized_start].span[0] - self.sanitized_lines[sanitized_start-1].span[1] > 1:
+                source_start = self.get_line_index(self._get_sanitized_line(-1).span[1] + 1)
+            elif (
+                self._get_sanitized_line(sanitized_start).span[0] -
+                self._get_sanitized_line(sanitized_start-1).span[1] > 1
+            ):
                 # There are lines in the original string that are missing in the sanitized string
                 # between the previous and the start line
-                source_start = self.get_line_index(self.sanitized_lines[sanitized_start-1].span[1] + 1)
+                source_start = self.get_line_index(self._get_sanitized_line(sanitized_start-1).span[1] + 1)
             else:
-                source_start = self.get_line_index(self.sanitized_lines[sanitized_start].span[0])
+                source_start = self.get_line_index(self._get_sanitized_line(sanitized_start).span[0])
 
-            if sanitized_end == len(self.sanitized_lines):
+            if sanitized_end == num_lines:
                 # Span reaches until the end of the sanitized_string: include everything
                 # after it as well
-                source_end = len(self.source_lines)
+                source_end = self._source_range[1] - self._source_range[0]
             else:
                 # Include everything until (but not including) the line corresponding to the
                 # first line after the span in the sanitized string
-                source_end = self.get_line_index(self.sanitized_lines[sanitized_end].span[0])
-        elif sanitized_start >= len(self.sanitized_lines):
+                source_end = self.get_line_index(self._get_sanitized_line(sanitized_end).span[0])
+        elif sanitized_start >= num_lines:
             # Span starts after the sanitized string: Point to the first line after it
-            source_start = self.get_line_index(self.sanitized_lines[-1].span[1] + 1)
+            source_start = self.get_line_index(self._get_sanitized_line(-1).span[1] + 1)
             source_end = source_start
         else:
-            source_start = self.get_line_index(self.sanitized_lines[sanitized_start].span[0])
-            source_end = self.get_line_index(self.sanitized_lines[sanitized_end-1].span[1] + 1)
+            source_start = self.get_line_index(self._get_sanitized_line(sanitized_start).span[0])
+            source_end = self.get_line_index(self._get_sanitized_line(sanitized_end-1).span[1] + 1)
 
         return sanitized_start, sanitized_end, source_start, source_end
 
@@ -243,17 +656,18 @@ class FortranReader:
         """
         Create a :any:`Source` object with the content of the reader
         """
-        if not self.source_lines:
+        num_source_lines = self._source_range[1] - self._source_range[0]
+        if not num_source_lines:
             string = ''
             lines = (self.line_offset + 1, self.line_offset + 1)
         elif include_padding:
-            string = '\n'.join(self.source_lines)
-            lines = (self.line_offset + 1, self.line_offset + len(self.source_lines))
+            string = '\n'.join(self._get_source_lines())
+            lines = (self.line_offset + 1, self.line_offset + num_source_lines)
         else:
-            lines = (self.sanitized_lines[0].span[0], self.sanitized_lines[-1].span[1])
+            lines = (self._get_sanitized_line(0).span[0], self._get_sanitized_line(-1).span[1])
             index = (lines[0] - self.line_offset - 1, lines[1] - self.line_offset)
-            string = '\n'.join(self.source_lines[index[0]:index[1]])
-        return Source(lines=lines, string=string)
+            string = '\n'.join(self._get_source_lines(index[0], index[1]))
+        return self._create_source(lines, string)
 
     def source_from_head(self):
         """
@@ -263,22 +677,23 @@ class FortranReader:
         This means typically comments or preprocessor directives. Returns `None` if there
         is nothing.
         """
-        if not self.source_lines:
+        num_source_lines = self._source_range[1] - self._source_range[0]
+        if not num_source_lines:
             return None
 
-        if not self.sanitized_lines:
-            string = '\n'.join(self.source_lines)
-            lines = (self.line_offset + 1, self.line_offset + len(self.source_lines))
-            return Source(lines=lines, string=string)
+        if self._line_range[0] == self._line_range[1]:
+            string = '\n'.join(self._get_source_lines())
+            lines = (self.line_offset + 1, self.line_offset + num_source_lines)
+            return self._create_source(lines, string)
 
-        line_diff = self.sanitized_lines[0].span[0] - self.line_offset
+        line_diff = self._get_sanitized_line(0).span[0] - self.line_offset
         if line_diff == 1:
             return None
         assert line_diff > 0
 
-        string = '\n'.join(self.source_lines[:line_diff - 1])
-        lines = (self.line_offset + 1, self.sanitized_lines[0].span[0] - 1)
-        return Source(lines=lines, string=string)
+        string = '\n'.join(self._get_source_lines(0, line_diff - 1))
+        lines = (self.line_offset + 1, self._get_sanitized_line(0).span[0] - 1)
+        return self._create_source(lines, string)
 
     def source_from_tail(self):
         """
@@ -288,18 +703,19 @@ class FortranReader:
         This means typically comments or preprocessor directives. Returns `None` if there
         is nothing.
         """
-        if not self.sanitized_lines:
+        if self._line_range[0] == self._line_range[1]:
             return None
 
-        line_diff = len(self.source_lines) + self.line_offset - self.sanitized_lines[-1].span[1]
+        num_source_lines = self._source_range[1] - self._source_range[0]
+        line_diff = num_source_lines + self.line_offset - self._get_sanitized_line(-1).span[1]
         if line_diff == 0:
             return None
         assert line_diff > 0
 
-        start = self.sanitized_lines[-1].span[1] + 1
-        string = '\n'.join(self.source_lines[self.get_line_index(start):])
+        start = self._get_sanitized_line(-1).span[1] + 1
+        string = '\n'.join(self._get_source_lines(self.get_line_index(start)))
         lines = (start, start + line_diff - 1)
-        return Source(lines=lines, string=string)
+        return self._create_source(lines, string)
 
     def source_from_sanitized_span(self, span, include_padding=False):
         """
@@ -307,11 +723,11 @@ class FortranReader:
         to the given span in the sanitized string
         """
         *_, source_start, source_end = self.get_line_indices_from_span(span, include_padding)
-        string = '\n'.join(self.source_lines[source_start:source_end])
+        string = '\n'.join(self._get_source_lines(source_start, source_end))
         if not string:
             return None
         lines = (self.line_offset + source_start + 1, self.line_offset + source_end)
-        return Source(lines=lines, string=string)
+        return self._create_source(lines, string)
 
     def reader_from_sanitized_span(self, span, include_padding=False):
         """
@@ -319,22 +735,19 @@ class FortranReader:
         to the given span in the sanitized string
         """
         sanit_start, sanit_end, source_start, source_end = self.get_line_indices_from_span(span, include_padding)
-        if sanit_start >= len(self.sanitized_lines):
+        if sanit_start >= self._line_range[1] - self._line_range[0]:
             return None
 
+        # The new reader shares the original and sanitized source with this reader
         new_reader = FortranReader.__new__(FortranReader)
         new_reader.line_offset = self.line_offset + source_start
-        new_reader.source_lines = self.source_lines[source_start:source_end]
-        new_reader.sanitized_lines = self.sanitized_lines[sanit_start:sanit_end]
-        span_offset = self.sanitized_spans[sanit_start]
-        new_reader.sanitized_spans = tuple(span - span_offset for span in self.sanitized_spans[sanit_start:sanit_end+1])
-
-        if sanit_end + 1 < len(self.sanitized_spans):
-            sanitized_span = [self.sanitized_spans[sanit_start], self.sanitized_spans[sanit_end + 1]]
-        else:
-            sanitized_span = [self.sanitized_spans[sanit_start], None]
-        new_reader.sanitized_string = self.sanitized_string[sanitized_span[0]:sanitized_span[1]]
-
+        new_reader._line_shift = self._line_shift
+        new_reader._source_lines = self._source_lines
+        new_reader._source_range = (self._source_range[0] + source_start, self._source_range[0] + source_end)
+        new_reader._lines = self._lines
+        new_reader._line_range = (self._line_range[0] + sanit_start, self._line_range[0] + sanit_end)
+        new_reader._spans = self._spans
+        new_reader._string = self._string
         return new_reader
 
     def __iter__(self):
@@ -344,7 +757,7 @@ class FortranReader:
 
     def __next__(self):
         self._current_index += 1
-        if self._current_index > len(self.sanitized_lines):
+        if self._current_index > self._line_range[1] - self._line_range[0]:
             raise StopIteration
         return self.current_line
 
@@ -354,9 +767,9 @@ class FortranReader:
         Return the current line of the iterator or `None` if outside of iteration range
         """
         _current_index = getattr(self, '_current_index', 0)
-        if _current_index <= 0 or _current_index > len(self.sanitized_lines):
+        if _current_index <= 0 or _current_index > self._line_range[1] - self._line_range[0]:
             return None
-        return self.sanitized_lines[_current_index - 1]
+        return self._get_sanitized_line(_current_index - 1)
 
     def source_from_current_line(self):
         """
@@ -365,7 +778,7 @@ class FortranReader:
         line = self.current_line
         start = self.get_line_index(line.span[0])
         end = self.get_line_index(line.span[1])
-        return Source(lines=line.span, string='\n'.join(self.source_lines[start:end+1]))
+        return self._create_source(line.span, '\n'.join(self._get_source_lines(start, end+1)))
 
 
 def extract_source(ast, text, label=None, full_lines=False):
@@ -12,8 +12,9 @@ Control flow node classes for
 """
 
 from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from functools import partial
 from itertools import chain
 from typing import Any, Tuple, Union
 
@@ -21,6 +22,7 @@ from pymbolic.primitives import Expression
 
 from pydantic.dataclasses import dataclass as dataclass_validated
 
+from loki.config import config
 from loki.scope import Scope
 from loki.tools import flatten, as_tuple, is_iterable, truncate_string, CaseInsensitiveDict
 from loki.types import DataType, BasicType, DerivedType, SymbolAttributes
@@ -40,6 +42,8 @@ __all__ = [
     'Import', 'VariableDeclaration', 'ProcedureDeclaration', 'DataDeclaration',
     'StatementFunction', 'TypeDef', 'MultiConditional', 'MaskedStatement',
     'Intrinsic', 'Enumeration', 'RawSource',
+    # Utilities
+    'trusted_node_construction',
 ]
 
 # Configuration for validation mechanism via pydantic
@@ -48,8 +52,60 @@ dataclass_validation_config  = {
     'arbitrary_types_allowed': True,
 }
 
-# Using this decorator, we can force strict validation
-dataclass_strict = partial(dataclass_validated, config=dataclass_validation_config)
+
+# Flag for :any:`trusted_node_construction`, which is local to each thread
+_trusted_construction = ContextVar('trusted_node_construction', default=False)
+
+
+class _NodeValidationSwitch:
+    """
+    Descriptor for the ``__pydantic_run_validation__`` class attribute of
+    IR node classes that disables pydantic's validation of constructor
+    arguments inside :any:`trusted_node_construction`
+    """
+
+    def __get__(self, instance, owner):
+        return not _trusted_construction.get()
+
+
+_node_validation = _NodeValidationSwitch()
+
+
+def dataclass_strict(**kwargs):
+    """
+    Using this decorator, we can force strict validation of IR nodes,
+    unless they are created inside :any:`trusted_node_construction`
+    """
+    def wrap(cls):
+        cls = dataclass_validated(cls, config=dataclass_validation_config, **kwargs)
+        cls.__pydantic_run_validation__ = _node_validation
+        return cls
+    return wrap
+
+
+@contextmanager
+def trusted_node_construction():
+    """
+    Context manager that skips the validation of constructor arguments
+    for all IR nodes created inside it
+
+    This is used by the frontends and when a :any:`Transformer` rebuilds
+    nodes, to speed up the creation of nodes from arguments that are known
+    to be of the correct type already. Nodes are created as plain frozen
+    dataclasses, which means that, e.g., lists are not converted to tuples.
+    The setting only applies to the current thread. Validation can be
+    re-enabled globally for debugging purposes via
+    ``config['trusted-node-construction']``.
+    """
+    if _trusted_construction.get() or not config['trusted-node-construction']:
+        yield
+        return
+
+    token = _trusted_construction.set(True)
+    try:
+        yield
+    finally:
+        _trusted_construction.reset(token)
 
 # Abstract base classes
 
@@ -84,11 +140,15 @@ class Node:
 
     _traversable = []
 
+    # Global counter of in-place modifications of IR nodes, which allows
+    # to invalidate information derived from the IR (see :any:`ProgramUnit`)
+    _ir_version = 0
+
     def __post_init__(self):
         # Create private placeholders for dataflow analysis fields that
         # do not show up in the dataclass field definitions, as these
         # are entirely transient.
-        self._update(_live_symbols=None, _defines_symbols=None, _uses_symbols=None)
+        self.__dict__.update(_live_symbols=None, _defines_symbols=None, _uses_symbols=None)
 
     @property
     def children(self):
@@ -140,6 +200,9 @@ class Node:
         argnames = [i for i in self._traversable if i not in kwargs]
         kwargs.update(zip(argnames, args))
         self.__dict__.update(kwargs)
+        if any(k in self.__dataclass_fields__ for k in kwargs):  # pylint: disable=no-member
+            # Transient fields (e.g., dataflow analysis) do not count as modification
+            Node._ir_version += 1
 
     @property
     def args(self):
@@ -175,6 +238,20 @@ class Node:
 
         return ir_graph(self, show_comments, show_expressions,linewidth, symgen)
 
+    def _get_dataflow_symbols(self, name):
+        """
+        Return the set of symbols stored by dataflow analysis in the field :data:`name`
+
+        Dataflow analysis may store a lazy representation (e.g., a bitset) of the
+        symbols, which is converted to a :any:`set` on first access.
+        """
+        symbols = self.__dict__[name]
+        if symbols is None:
+            raise RuntimeError('Need to run dataflow analysis on the IR first.')
+        if not isinstance(symbols, set):
+            symbols = self.__dict__[name] = set(symbols)
+        return symbols
+
     @property
     def live_symbols(self):
         """
@@ -188,9 +265,7 @@ class Node:
         :py:func:`loki.analyse.analyse_dataflow.dataflow_analysis_attached`
         context manager.
         """
-        if self.__dict__['_live_symbols'] is None:
-            raise RuntimeError('Need to run dataflow analysis on the IR first.')
-        return self.__dict__['_live_symbols']
+        return self._get_dataflow_symbols('_live_symbols')
 
     @property
     def defines_symbols(self):
@@ -203,9 +278,7 @@ class Node:
         :py:func:`loki.analyse.analyse_dataflow.dataflow_analysis_attached`
         context manager.
         """
-        if self.__dict__['_defines_symbols'] is None:
-            raise RuntimeError('Need to run dataflow analysis on the IR first.')
-        return self.__dict__['_defines_symbols']
+        return self._get_dataflow_symbols('_defines_symbols')
 
     @property
     def uses_symbols(self):
@@ -219,9 +292,7 @@ class Node:
         :py:func:`loki.analyse.analyse_dataflow.dataflow_analysis_attached`
         context manager.
         """
-        if self.__dict__['_uses_symbols'] is None:
-            raise RuntimeError('Need to run dataflow analysis on the IR first.')
-        return self.__dict__['_uses_symbols']
+        return self._get_dataflow_symbols('_uses_symbols')
 
 
 @dataclass_strict(frozen=True)
@@ -8,7 +8,10 @@
 """
 Visitor classes for transforming the IR
 """
-from loki.ir.nodes import Node, Conditional, ScopedNode
+from collections import defaultdict
+from heapq import heapify, heappop, heappush
+
+from loki.ir.nodes import Node, Conditional, ScopedNode, trusted_node_construction
 from loki.ir.visitor import Visitor
 from loki.tools import flatten, is_iterable, as_tuple, replace_windowed
 
@@ -46,7 +49,9 @@ class Transformer(Visitor):
        nodes. Alternatively, with :data:`inplace` the mapping can be
        applied without rebuilding the tree, leaving existing references to
        individual IR nodes intact (as long as the mapping does not replace or
-       remove them in the tree).
+       remove them in the tree). With :data:`share_unchanged`, only nodes on
+       the path to a replaced node are rebuilt, and all other nodes are shared
+       between the original and the new tree.
 
     Parameters
     ----------
@@ -63,6 +68,14 @@ class Transformer(Visitor):
         If set to `True`, this will also rebuild :class:`ScopedNode` in the IR.
         This requires updating :attr:`TypedSymbol.scope` properties, which is
         expensive and thus carried out only when explicitly requested.
+    share_unchanged : bool, optional
+        If set to `True`, nodes and tuples for which the transformation does not
+        change any children are not rebuilt but returned as-is. The new tree
+        then shares all unchanged subtrees with the original tree, making the
+        cost of applying a sparse mapper proportional to the number of changed
+        nodes and their depth. Because nodes can be modified in-place (e.g.,
+        with :data:`inplace`), this should not be used when the new tree is
+        meant to be an independent copy.
 
     Attributes
     ----------
@@ -72,13 +85,25 @@ class Transformer(Visitor):
         :math:`n \in T` to the rebuilt nodes in the new tree :math:`n' \in T'`.
     """
 
-    def __init__(self, mapper=None, invalidate_source=True, inplace=False, rebuild_scopes=False):
+    def __init__(self, mapper=None, invalidate_source=True, inplace=False, rebuild_scopes=False,
+                 share_unchanged=False):
         super().__init__()
         self.mapper = mapper.copy() if mapper is not None else {}
         self.invalidate_source = invalidate_source
         self.rebuilt = {}
         self.inplace = inplace
         self.rebuild_scopes = rebuild_scopes
+        self.share_unchanged = share_unchanged
+        self._mapper_index = None
+        self._mapper_index_checked = False
+        self._visiting = False
+
+    @staticmethod
+    def _is_unchanged(original, visited):
+        """
+        Check whether all items in :data:`visited` are identical to those in :data:`original`
+        """
+        return len(original) == len(visited) and all(new is old for new, old in zip(visited, original))
 
     def _rebuild_without_source(self, o, children, **args):
         """
@@ -89,13 +114,14 @@ class Transformer(Visitor):
         if 'source' in o.args_frozen:
             args_frozen['source'] = None
 
-        if self.inplace:
-            # Updated nodes in place, if requested
-            o._update(*children, **args_frozen)
-            return o
+        with trusted_node_construction():
+            if self.inplace:
+                # Updated nodes in place, if requested
+                o._update(*children, **args_frozen)
+                return o
 
-        # Rebuild updated nodes by default
-        return o._rebuild(*children, **args_frozen)
+            # Rebuild updated nodes by default
+            return o._rebuild(*children, **args_frozen)
 
     def _rebuild(self, o, children, **args):
         """
@@ -112,22 +138,67 @@ class Transformer(Visitor):
                 if any(child_has_no_source) or len(child_has_no_source) != len(flatten(o.children)):
                     return self._rebuild_without_source(o, children, **args_frozen)
 
-        if self.inplace:
-            # Updated nodes in place, if requested
-            o._update(*children, **args_frozen)
-            return o
+        with trusted_node_construction():
+            if self.inplace:
+                # Updated nodes in place, if requested
+                o._update(*children, **args_frozen)
+                return o
 
-        # Rebuild updated nodes by default
-        return o._rebuild(*children, **args_frozen)
+            # Rebuild updated nodes by default
+            return o._rebuild(*children, **args_frozen)
 
     def visit_object(self, o, **kwargs):
         """Return the object unchanged."""
         return o
 
+    def _get_mapper_index(self):
+        """
+        Utility method that indexes the keys of :attr:`mapper` by the tuple
+        elements they can match.
+
+        Every key is indexed by itself and, if it is a group of nodes, by the
+        first node of that group. The index is rebuilt if keys are added to or
+        removed from :attr:`mapper`, e.g., by a subclass during the traversal.
+        Other changes of the keys, which are detected via their identities, are
+        only checked for once per top-level call to :meth:`visit`.
+
+        Returns
+        -------
+        tuple
+            The keys of :attr:`mapper`, a `dict` mapping tuple elements to the
+            positions of the keys that can match them, and the positions of
+            empty group keys
+        """
+        if self._mapper_index is not None and len(self._mapper_index[1]) != len(self.mapper):
+            self._mapper_index = None
+        elif self._mapper_index is not None and not self._mapper_index_checked:
+            if self._mapper_index[0] != tuple(map(id, self.mapper)):
+                self._mapper_index = None
+        self._mapper_index_checked = True
+
+        if self._mapper_index is None:
+            key_ids = tuple(map(id, self.mapper))
+            keys = tuple(self.mapper)
+            index = defaultdict(list)
+            unindexed = []
+            for pos, k in enumerate(keys):
+                index[k].append(pos)
+                if is_iterable(k):
+                    group = as_tuple(k)
+                    if group:
+                        index[group[0]].append(pos)
+                    else:
+                        unindexed.append(pos)
+            self._mapper_index = (key_ids, keys, dict(index), unindexed)
+        return self._mapper_index[1:]
+
     def _inject_tuple_mapping(self, o):
         """
         Utility method for one-to-many mappings to insert iterables for
         the replaced node into a tuple.
+
+        Only the keys in :attr:`mapper` that can match an element of the tuple
+        are considered, in the order of :attr:`mapper`.
         """
         def _inject_handle(nodes, i, old, new):
             """Utility to replace `old` in `nodes[i:]` by `new`"""
@@ -136,7 +207,35 @@ class Transformer(Visitor):
             nodes = nodes[:j] + new + nodes[j+1:]
             return nodes, j + len(new)
 
-        for k, handle in self.mapper.items():
+        keys, index, unindexed = self._get_mapper_index()
+
+        def _candidates(nodes):
+            """Utility to find the positions of keys that can match any of `nodes`"""
+            for node in nodes:
+                try:
+                    yield from index.get(node, ())
+                except TypeError:
+                    # Unhashable objects can not be equal to any key
+                    pass
+
+        seen = set(_candidates(o))
+        seen.update(unindexed)
+        queue = list(seen)
+        heapify(queue)
+
+        while queue:
+            pos = heappop(queue)
+            k = keys[pos]
+            handle = self.mapper[k]
+            if not (is_iterable(k) or is_iterable(handle)):
+                continue
+
+            # Keys after the current one can match nodes that are inserted by this mapping
+            for new_pos in _candidates(as_tuple(handle)):
+                if new_pos > pos and new_pos not in seen:
+                    seen.add(new_pos)
+                    heappush(queue, new_pos)
+
             if is_iterable(k):
                 o = replace_windowed(o, k, subs=handle)
             if k in o and is_iterable(handle):
@@ -154,13 +253,17 @@ class Transformer(Visitor):
         Visit all elements in a tuple, injecting any one-to-many mappings.
         """
         # First inject tuples that match at least a sub-set of current nodes
-        o = self._inject_tuple_mapping(o)
+        injected = self._inject_tuple_mapping(o)
 
         # Then recurse over the new nodes
-        visited = tuple(self.visit(i, **kwargs) for i in o)
+        visited = tuple(self.visit(i, **kwargs) for i in injected)
 
         # Strip empty sublists/subtuples or None entries
-        return tuple(i for i in visited if i is not None and as_tuple(i))
+        visited = tuple(i for i in visited if i is not None and as_tuple(i))
+
+        if self.share_unchanged and isinstance(o, tuple) and self._is_unchanged(o, visited):
+            return o
+        return visited
 
     visit_list = visit_tuple
 
@@ -169,7 +272,9 @@ class Transformer(Visitor):
         Handler for :any:`Node` objects.
 
         It replaces :data:`o` by :data:`mapper[o]`, if it is in the mapper,
-        otherwise visits all children before rebuilding the node.
+        otherwise visits all children before rebuilding the node. With
+        :data:`share_unchanged`, the node is returned as-is if none of
+        its children has changed.
         """
         if o in self.mapper:
             handle = self.mapper[o]
@@ -183,6 +288,8 @@ class Transformer(Visitor):
                 return handle._rebuild(**handle.args)
 
         rebuilt = tuple(self.visit(i, **kwargs) for i in o.children)
+        if self.share_unchanged and self._is_unchanged(o.children, rebuilt):
+            return o
         return self._rebuild(o, rebuilt)
 
     def visit_ScopedNode(self, o, **kwargs):
@@ -224,7 +331,8 @@ class Transformer(Visitor):
         rebuilt = tuple(self.visit(i, **kwargs) for i in o.children)
 
         # Update in-place the node with rebuilt children
-        o._update(*rebuilt)
+        if not self._is_unchanged(o.children, rebuilt):
+            o._update(*rebuilt)
         return o
 
     def visit(self, o, *args, **kwargs):
@@ -245,7 +353,16 @@ class Transformer(Visitor):
         :any:`Node` or tuple
             The rebuilt control flow tree.
         """
-        obj = super().visit(o, *args, **kwargs)
+        if self._visiting:
+            obj = super().visit(o, *args, **kwargs)
+        else:
+            # The keys of the mapper may have changed since the last visit
+            self._mapper_index_checked = False
+            self._visiting = True
+            try:
+                obj = super().visit(o, *args, **kwargs)
+            finally:
+                self._visiting = False
         if isinstance(o, Node) and obj is not o:
             self.rebuilt[o] = obj
         return obj
@@ -268,7 +385,11 @@ class NestedTransformer(Transformer):
         visited = self._inject_tuple_mapping(visited)
 
         # Strip empty sublists/subtuples or None entries
-        return tuple(i for i in visited if i is not None and as_tuple(i))
+        visited = tuple(i for i in visited if i is not None and as_tuple(i))
+
+        if self.share_unchanged and isinstance(o, tuple) and self._is_unchanged(o, visited):
+            return o
+        return visited
 
     visit_list = visit_tuple
 
@@ -295,6 +416,8 @@ class NestedTransformer(Transformer):
             if self.invalidate_source:
                 return self._rebuild_without_source(o, extended)
             return o._rebuild(*extended, **o.args_frozen)
+        if self.share_unchanged and handle is o and self._is_unchanged(o.children, rebuilt):
+            return o
         return self._rebuild(handle, rebuilt)
 
     def visit_ScopedNode(self, o, **kwargs):
@@ -14,23 +14,29 @@ import inspect
 from multiprocessing import Manager
 from pathlib import Path
 import shutil
+from time import perf_counter
 from codetiming import Timer
 
 from loki.build import workqueue
 from loki.batch import Scheduler, SchedulerConfig, Item
 from loki.config import config as loki_config
+from loki.ir import Comment, CommentBlock, FindNodes
+from loki.frontend import read_file
 from loki.lint.reporter import (
-    FileReport, RuleReport, Reporter, LazyTextfile,
+    FileReport, RuleReport, ProblemReport, ProblemLocation, Reporter, LazyTextfile,
     DefaultHandler, JunitXmlHandler, ViolationFileHandler
 )
-from loki.lint.utils import Fixer
+from loki.lint.rules import GenericRule
+from loki.lint.utils import Fixer, get_disabled_rules
 from loki.logging import logger
+from loki.module import Module
 from loki.sourcefile import Sourcefile
-from loki.tools import filehash, find_paths, CaseInsensitiveDict
+from loki.subroutine import Subroutine
+from loki.tools import filehash, find_paths, CaseInsensitiveDict, DiskCache, loki_version
 from loki.transform import Transformation
 
 
-__all__ = ['Linter', 'LinterTransformation', 'lint_files']
+__all__ = ['Linter', 'LinterTransformation', 'LintCache', 'lint_files']
 
 
 class Linter:
@@ -128,6 +134,11 @@ class Linter:
         creating the :any:`Linter`. Additionally, the file report is returned,
         e.g., to use it wiht :meth:`fix`.
 
+        Unless the config option ``fused`` is set to `False`, all rules are
+        checked in a single pass over the file (see :meth:`check_fused`).
+        Otherwise, and for rules that overwrite :meth:`GenericRule.check`,
+        the rule's ``check`` routine is called for each rule in turn.
+
         Parameters
         ----------
         sourcefile : :any:`Sourcefile`
@@ -174,20 +185,116 @@ class Linter:
         rules = overwrite_rules if overwrite_rules is not None else self.rules
         rules = [rule for rule in rules if disabled_rules.get(rule.__name__) is not True]
 
-        timer = Timer(logger=None)
+        rule_reports = [RuleReport(rule, disabled=disabled_rules.get(rule.__name__)) for rule in rules]
 
-        # Run all the rules on that file
-        for rule in rules:
+        # Run all the rules on that file, in a single pass for rules that
+        # do not overwrite the generic check routine
+        fused_reports = []
+        if config.get('fused', True):
+            fused_reports = [
+                rule_report for rule_report in rule_reports
+                if getattr(rule_report.rule.check, '__func__', None) is GenericRule.check.__func__
+            ]
+            self.check_fused(sourcefile, fused_reports, config, **kwargs)
+
+        timer = Timer(logger=None)
+        for rule_report in rule_reports:
+            if rule_report in fused_reports:
+                continue
             timer.start()
-            rule_report = RuleReport(rule, disabled=disabled_rules.get(rule.__name__))
-            rule.check(sourcefile, rule_report, config[rule.__name__], **kwargs)
+            rule_report.rule.check(sourcefile, rule_report, config[rule_report.rule.__name__], **kwargs)
             rule_report.elapsed_sec = timer.stop()
+
+        for rule_report in rule_reports:
             file_report.add(rule_report)
 
         # Store the file report
         self.reporter.add_file_report(file_report)
         return file_report
 
+    @staticmethod
+    def check_fused(ast, rule_reports, config, **kwargs):
+        """
+        Check all rules in a single pass over the given IR object
+
+        This is equivalent to calling :meth:`GenericRule.check` for each
+        rule, but the IR of each :any:`Subroutine` is traversed only once:
+        the nodes matching any rule's :attr:`GenericRule.node_types` are
+        collected together with the comments that may disable rules, and
+        then routed to :meth:`GenericRule.check_nodes` of the interested rules.
+
+        The time spent in each rule's entry points, plus an equal share of
+        the common traversal, is accumulated in :attr:`RuleReport.elapsed_sec`.
+
+        Parameters
+        ----------
+        ast : :any:`Sourcefile` or :any:`Module` or :any:`Subroutine`
+            The IR object to be checked.
+        rule_reports : list of :any:`RuleReport`
+            The reports for the rules to check, in which rule violations
+            are registered.
+        config : dict
+            The linter configuration with the configuration for each rule.
+        """
+        for rule_report in rule_reports:
+            rule_report.elapsed_sec = 0.0
+
+        def _call(rule_report, method, ast, *args, **kwargs):
+            start = perf_counter()
+            rule = rule_report.rule
+            getattr(rule, method)(ast, *args, rule_report, config[rule.__name__], **kwargs)
+            rule_report.elapsed_sec += perf_counter() - start
+
+        def _enabled(reports, comments, start):
+            disabled = get_disabled_rules(comments)
+            enabled = [r for r in reports if not disabled.intersection(r.rule.identifiers())]
+            elapsed = (perf_counter() - start) / max(len(reports), 1)
+            for rule_report in reports:
+                rule_report.elapsed_sec += elapsed
+            return enabled
+
+        def _check(ast, reports, **kwargs):
+            if isinstance(ast, Sourcefile):
+                for rule_report in reports:
+                    _call(rule_report, 'check_file', ast)
+                for module in getattr(ast, 'modules', None) or ():
+                    _check(module, reports, **kwargs)
+                for subroutine in getattr(ast, 'subroutines', None) or ():
+                    _check(subroutine, reports, **kwargs)
+
+            elif isinstance(ast, Module):
+                start = perf_counter()
+                reports = _enabled(reports, FindNodes((Comment, CommentBlock)).visit(ast.spec), start)
+                for rule_report in reports:
+                    _call(rule_report, 'check_module', ast)
+                for subroutine in getattr(ast, 'subroutines', None) or ():
+                    _check(subroutine, reports, **kwargs)
+
+            elif isinstance(ast, Subroutine):
+                # Collect comments and all node types of interest in a single traversal
+                start = perf_counter()
+                node_types = {node_type for r in reports for node_type in r.rule.node_types}
+                nodes = FindNodes((Comment, CommentBlock, *node_types)).visit(ast.ir)
+                comments = [node for node in nodes if isinstance(node, (Comment, CommentBlock))]
+                reports = _enabled(reports, comments, start)
+
+                if not (targets := kwargs.pop('targets', None)):
+                    items = kwargs.get('items') or ()
+                    item = [item for item in items if item.local_name.lower() == ast.name.lower()]
+                    if len(item) > 0:
+                        targets = item[0].targets
+
+                for rule_report in reports:
+                    _call(rule_report, 'check_subroutine', ast, targets=targets, **kwargs)
+                    if rule_report.rule.node_types:
+                        rule_nodes = [node for node in nodes if isinstance(node, rule_report.rule.node_types)]
+                        _call(rule_report, 'check_nodes', ast, rule_nodes, targets=targets, **kwargs)
+
+                for member in getattr(ast, 'members', None) or ():
+                    _check(member, reports, **kwargs)
+
+        _check(ast, list(rule_reports), **kwargs)
+
     def fix(self, sourcefile, file_report, backup_suffix=None, overwrite_config=None):
         """
         Fix all rule violations in :data:`file_report` that were reported by
@@ -270,6 +377,126 @@ class LinterTransformation(Transformation):
             self.linter.fix(sourcefile, report, backup_suffix=self.linter.config.get('backup_suffix'))
 
 
+class LintCache:
+    """
+    Persistent cache of :any:`FileReport` objects for unchanged source files
+
+    Cache entries are stored in a :any:`DiskCache` under a key made up of
+    the hash of the file content, the names, implementations and configuration
+    of the rules of :data:`linter`, the ``disable`` configuration entry
+    matching the file, and the Loki version. For a file with a cache entry, the stored report
+    is replayed into the :any:`Reporter` of the linter without parsing the
+    file.
+
+    In cached reports, the IR objects in which problems were reported are
+    replaced by a :any:`ProblemLocation`.
+
+    Parameters
+    ----------
+    linter : :any:`Linter`
+        The linter instance whose rules and configuration determine the
+        cache keys
+    path : str or :any:`pathlib.Path`
+        The cache directory
+    max_size : int, optional
+        The maximum size of the cache directory in MB
+    """
+
+    def __init__(self, linter, path, max_size=None):
+        self.linter = linter
+        self.cache = DiskCache(path, max_size=max_size * 1024**2 if max_size else None, suffix='.lint')
+        self.rule_hashes = {rule: self._get_rule_hash(rule) for rule in linter.rules}
+
+    @staticmethod
+    def _get_rule_hash(rule):
+        """
+        Hash of the source files of the modules that define :data:`rule`
+        and its base classes, to invalidate cache entries when rules are
+        modified outside of Loki, e.g., in ``lint_rules``
+        """
+        paths = []
+        for cls in inspect.getmro(rule):
+            try:
+                path = inspect.getsourcefile(cls)
+            except TypeError:
+                # Built-in classes have no source file
+                continue
+            if path and path not in paths:
+                paths += [path]
+        return filehash(''.join(filehash(read_file(path)) for path in paths))
+
+    def make_key(self, path, source):
+        """
+        Create the cache key for the file at :data:`path` with the
+        content :data:`source`
+        """
+        config = self.linter.config
+        rules = [
+            (rule.__module__, rule.__name__, self.rule_hashes[rule], repr(config.get(rule.__name__)))
+            for rule in self.linter.rules
+        ]
+        disable_config = config.get('disable')
+        if isinstance(disable_config, dict):
+            disable_key = next((key for key in disable_config if Path(path).match(key)), None)
+            disable = repr(disable_config[disable_key]) if disable_key else None
+        else:
+            disable = None
+        return DiskCache.make_key(filehash(source), rules, disable, loki_version())
+
+    def load(self, path, source=None):
+        """
+        Return the cached :any:`FileReport` for the file at :data:`path`
+        or `None` if no cache entry exists
+
+        Parameters
+        ----------
+        path : str or :any:`pathlib.Path`
+            The path of the source file
+        source : str, optional
+            The content of the source file, which is read from :data:`path`
+            if not given
+        """
+        source = read_file(path) if source is None else source
+        entry = self.cache.load(self.make_key(path, source))
+        if entry is None:
+            return None
+
+        rules = {rule.__name__: rule for rule in self.linter.rules}
+        file_report = FileReport(str(path), hash=filehash(source))
+        for rule_name, elapsed_sec, problems in entry:
+            rule_report = RuleReport(rules[rule_name], reports=[
+                ProblemReport(msg, location) for msg, location in problems
+            ])
+            rule_report.elapsed_sec = elapsed_sec
+            file_report.add(rule_report)
+        return file_report
+
+    def store(self, path, file_report, source=None):
+        """
+        Store :data:`file_report` for the file at :data:`path` in the cache
+
+        Parameters
+        ----------
+        path : str or :any:`pathlib.Path`
+            The path of the source file
+        file_report : :any:`FileReport`
+            The report for the file
+        source : str, optional
+            The content of the source file, which is read from :data:`path`
+            if not given
+        """
+        source = read_file(path) if source is None else source
+        entry = [
+            (
+                rule_report.rule.__name__, rule_report.elapsed_sec,
+                [(problem.msg, ProblemLocation.from_location(problem.location))
+                 for problem in rule_report.problem_reports]
+            )
+            for rule_report in file_report.reports
+        ]
+        self.cache.store(self.make_key(path, source), entry)
+
+
 def lint_files_scheduler(linter, basedir, config):
     """
     Discover files relative to :data:`basedir` using :any:`SchedulerConfig`
@@ -281,14 +508,26 @@ def lint_files_scheduler(linter, basedir, config):
     return transformation.counter
 
 
-def check_and_fix_file(path, linter, fix=False, backup_suffix=None):
+def check_and_fix_file(path, linter, fix=False, backup_suffix=None, cache=None):
     """
     Check the file at :data:`path` with :data:`linter` and, optionally,
     fix it
+
+    If a :any:`LintCache` is given, the cached report is used for unchanged
+    files, unless it contains problems that are to be fixed.
     """
     try:
+        if cache is not None:
+            raw_source = read_file(path)
+            report = cache.load(path, source=raw_source)
+            if report is not None and not (fix and report.fixable_reports):
+                linter.reporter.add_file_report(report)
+                return True
+
         source = Sourcefile.from_file(path)
         report = linter.check(source)
+        if cache is not None:
+            cache.store(path, report, source=raw_source)
         if fix:
             linter.fix(source, report, backup_suffix=backup_suffix)
     except Exception as exc:  # pylint: disable=broad-except
@@ -299,16 +538,20 @@ def check_and_fix_file(path, linter, fix=False, backup_suffix=None):
     return True
 
 
-def lint_files_glob(linter, basedir, include, exclude=None, max_workers=1, fix=False, backup_suffix=None):
+def lint_files_glob(linter, basedir, include, exclude=None, max_workers=1, fix=False, backup_suffix=None,
+                    cache=None):
     """
     Discover files relative to :data:`basedir` using patterns in :data:`include`
     and apply :data:`linter` on each of them.
+
+    Reports for unchanged files are taken from :data:`cache`, if a
+    :any:`LintCache` is given.
     """
     files = find_paths(basedir, include, ignore=exclude)
     checked_count = 0
     if max_workers == 1 or loki_config['debug']:
         for path in files:
-            checked_count += check_and_fix_file(path, linter, fix=fix, backup_suffix=backup_suffix)
+            checked_count += check_and_fix_file(path, linter, fix=fix, backup_suffix=backup_suffix, cache=cache)
     else:
         manager = Manager()
         linter.reporter.init_parallel(manager)
@@ -316,7 +559,10 @@ def lint_files_glob(linter, basedir, include, exclude=None, max_workers=1, fix=F
         with workqueue(workers=max_workers, logger=logger, manager=manager) as q:
             log_queue = getattr(q, 'log_queue', None)
             q_tasks = [
-                q.call(check_and_fix_file, f, linter, fix=fix, backup_suffix=backup_suffix, log_queue=log_queue)
+                q.call(
+                    check_and_fix_file, f, linter, fix=fix, backup_suffix=backup_suffix,
+                    cache=cache, log_queue=log_queue
+                )
                 for f in files
             ]
             for t in as_completed(q_tasks):
@@ -345,6 +591,8 @@ def lint_files(rules, config, handlers=None):
            'backup_suffix': <suffix>, # Optional: Backup original file with given suffix
            'junitxml_file': <some file path>,  # Optional: write JunitXML-output of lint results
            'violations_file': <some file path>,  # Optional: write a YAML file containing violations
+           'cache_dir': <some directory path>,  # Optional: cache reports for unchanged files
+           'cache_size': <size in MB>,  # Optional: limit the size of the cache directory
            'rules': ['SomeRule', 'AnotherRule', ...],  # Optional: select only these rules
            'SomeRule': <rule options>, # Optional: configuration values for individual rules
         }
@@ -355,6 +603,11 @@ def lint_files(rules, config, handlers=None):
     See :any:`JunitXmlHandler` and :any:`ViolationFileHandler` for more details
     on the output file options.
 
+    With ``cache_dir``, reports for files that are unchanged since a previous
+    run with the same rules and configuration are replayed from a
+    :any:`LintCache` without parsing the files. This applies only to the
+    glob-based file discovery.
+
     The ``rules`` option in the config allows selecting only certain rules out of
     the provided :data:`rules` argument.
 
@@ -414,10 +667,14 @@ def lint_files(rules, config, handlers=None):
     if 'scheduler' in config:
         checked_count = lint_files_scheduler(linter, basedir, config['scheduler'])
     else:
+        cache = None
+        if config.get('cache_dir'):
+            cache = LintCache(linter, config['cache_dir'], max_size=config.get('cache_size'))
         checked_count = lint_files_glob(
             linter, basedir, config['include'],
             exclude=config.get('exclude'), max_workers=config.get('max_workers', 1),
-            fix=config.get('fix', False), backup_suffix=config.get('backup_suffix')
+            fix=config.get('fix', False), backup_suffix=config.get('backup_suffix'),
+            cache=cache
         )
 
     linter.reporter.output()
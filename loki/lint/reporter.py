@@ -19,6 +19,7 @@ try:
 except ImportError:
     HAVE_JUNIT_XML = False
 
+from loki.frontend.source import Source
 from loki.ir import Node
 from loki.lint.utils import get_filename_from_parent, is_rule_disabled, get_location_hash
 from loki.logging import logger, error
@@ -28,12 +29,64 @@ from loki.subroutine import Subroutine
 from loki.tools import filehash
 
 __all__ = [
-    'ProblemReport', 'RuleReport', 'FileReport', 'Reporter',
+    'ProblemLocation', 'ProblemReport', 'RuleReport', 'FileReport', 'Reporter',
     'GenericHandler', 'DefaultHandler', 'ViolationFileHandler',
     'JunitXmlHandler', 'LazyTextfile'
 ]
 
 
+class ProblemLocation:
+    """
+    Picklable summary of the IR object in which a problem was reported
+
+    This retains only the information about a location that is used by
+    report handlers, i.e., the source lines, the first line of the source
+    string, and the type and name of a program unit. It is used in place
+    of the IR object in reports that are replayed from a :any:`LintCache`.
+
+    Parameters
+    ----------
+    source : :any:`Source`, optional
+        The source object of the location
+    path : str, optional
+        The path of the file containing the location
+    scope_type : str, optional
+        ``'routine'`` or ``'module'`` if the location is a program unit
+    name : str, optional
+        The name of the program unit
+    """
+
+    def __init__(self, source=None, path=None, scope_type=None, name=None):
+        self.source = source
+        self.path = path
+        self.scope_type = scope_type
+        self.name = name
+
+    @classmethod
+    def from_location(cls, location):
+        """
+        Create the summary for an IR object or return :data:`location` if it
+        is a :any:`ProblemLocation` already
+        """
+        if location is None or isinstance(location, ProblemLocation):
+            return location
+
+        source = getattr(location, '_source', getattr(location, 'source', None))
+        if source is not None:
+            # Only the first line of the source string is needed for location hashes
+            string = source.string
+            if string:
+                string = string[:string.find('\n')+1] or string
+            source = Source(lines=source.lines, string=string)
+
+        path = get_filename_from_parent(location)
+        if isinstance(location, Subroutine):
+            return cls(source=source, path=path, scope_type='routine', name=location.name)
+        if isinstance(location, Module):
+            return cls(source=source, path=path, scope_type='module', name=location.name)
+        return cls(source=source, path=path)
+
+
 class ProblemReport:
     """
     Data type to represent a problem reported for a node in the IR
@@ -42,7 +95,7 @@ class ProblemReport:
     ----------
     msg : str
         The message describing the problem.
-    location : :any:`Sourcefile` or :any:`Module` or :any:`Subroutine` or :any:`Node`
+    location : :any:`Sourcefile` or :any:`Module` or :any:`Subroutine` or :any:`Node` or :any:`ProblemLocation`
         The IR component in which the problem exists.
     """
 
@@ -257,7 +310,7 @@ class GenericHandler:
         ----------
         filename : str
             The file name of the source file.
-        location : :any:`Node` or :any:`Subroutine` or :any:`Sourcefile` or :any:`Module`
+        location : :any:`Node` or :any:`Subroutine` or :any:`Sourcefile` or :any:`Module` or :any:`ProblemLocation`
             The AST node that triggered the problem report.
 
         Returns
@@ -280,6 +333,8 @@ class GenericHandler:
             scope = f' in routine "{location.name}"'
         elif isinstance(location, Module):
             scope = f' in module "{location.name}"'
+        elif isinstance(location, ProblemLocation) and location.scope_type:
+            scope = f' in {location.scope_type} "{location.name}"'
         else:
             scope = ''
         return f'{filename}{line}{scope}'
@@ -10,6 +10,7 @@ Base class for linter rules and available rule types
 """
 from enum import Enum
 
+from loki.ir import FindNodes
 from loki.lint.utils import is_rule_disabled
 from loki.module import Module
 from loki.sourcefile import Sourcefile
@@ -39,6 +40,11 @@ class GenericRule:
     Optional configuration values can be defined in :data:`config` together with
     the default value for this option. Only the relevant entry points to a
     rule must be implemented.
+
+    Rules that inspect only IR nodes of certain types in a subroutine should
+    declare these in :data:`node_types` and implement :meth:`check_nodes`
+    instead of searching the IR themselves. This allows the :any:`Linter` to
+    traverse each subroutine only once for all rules.
     """
 
     type = None
@@ -80,6 +86,12 @@ class GenericRule:
     List of rules that replace the deprecated rule, where applicable
     """
 
+    node_types = ()
+    """
+    Tuple of IR node types that are passed to :meth:`check_nodes`
+    for every subroutine
+    """
+
     @classmethod
     def identifiers(cls):
         """
@@ -105,6 +117,18 @@ class GenericRule:
         Must be implemented by a rule if applicable.
         """
 
+    @classmethod
+    def check_nodes(cls, subroutine, nodes, rule_report, config, **kwargs):
+        """
+        Perform rule checks on the IR nodes of a subroutine
+
+        This is called after :meth:`check_subroutine` with all nodes in
+        ``subroutine.ir`` that are instances of :data:`node_types`,
+        in the order returned by :any:`FindNodes`.
+
+        Must be implemented by a rule if :data:`node_types` is given.
+        """
+
     @classmethod
     def check_file(cls, sourcefile, rule_report, config):
         """
@@ -163,11 +187,14 @@ class GenericRule:
                 return
 
             if not (targets := kwargs.pop('targets', None)):
-                items = kwargs.get('items', ())
+                items = kwargs.get('items') or ()
                 item = [item for item in items if item.local_name.lower() == ast.name.lower()]
                 if len(item) > 0:
                     targets = item[0].targets
             cls.check_subroutine(ast, rule_report, config, targets=targets, **kwargs)
+            if cls.node_types:
+                nodes = FindNodes(cls.node_types).visit(ast.ir)
+                cls.check_nodes(ast, nodes, rule_report, config, targets=targets, **kwargs)
 
             # Recurse for any procedures contained in a subroutine
             if hasattr(ast, 'members') and ast.members is not None:
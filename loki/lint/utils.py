@@ -14,7 +14,10 @@ from loki.sourcefile import Sourcefile
 from loki.subroutine import Subroutine
 
 
-__all__ = ['Fixer', 'get_filename_from_parent', 'get_location_hash', 'is_rule_disabled']
+__all__ = [
+    'Fixer', 'get_filename_from_parent', 'get_location_hash', 'get_disabled_rules',
+    'is_rule_disabled'
+]
 
 
 class Fixer:
@@ -44,8 +47,8 @@ class Fixer:
 
         if mapper:
             # Apply the changes and invalidate source objects
-            subroutine.spec = Transformer(mapper).visit(subroutine.spec)
-            subroutine.body = Transformer(mapper).visit(subroutine.body)
+            subroutine.spec = Transformer(mapper, share_unchanged=True).visit(subroutine.spec)
+            subroutine.body = Transformer(mapper, share_unchanged=True).visit(subroutine.body)
             subroutine._source = None
             parent = subroutine.parent
             while parent is not None:
@@ -164,6 +167,34 @@ def get_location_hash(location):
 
 _disabled_rules_re = re.compile(r'^\s*!\s*loki-lint\s*:(?:.*?)disable=(?P<rules>[\w\.,]*)')
 
+def get_disabled_rules(comments):
+    """
+    Collect the identifiers of all Linter rules that are disabled via user
+    annotations in the given comments
+
+    This looks for comments of the form ``! loki-lint: disable=RuleName``
+    in the same way as :meth:`is_rule_disabled`, but allows to determine
+    the disabled rules for several rules from a single traversal of the IR.
+
+    Parameters
+    ----------
+    comments : list of :any:`Comment` or :any:`CommentBlock`
+        The comment nodes to search for annotations
+
+    Returns
+    -------
+    set of str
+        The identifiers of all rules that are disabled
+    """
+    disabled = set()
+    for node in comments:
+        for comment in getattr(node, 'comments', [node]):
+            match = _disabled_rules_re.match(comment.text)
+            if match:
+                disabled.update(match.group('rules').split(','))
+    return disabled
+
+
 def is_rule_disabled(ir, identifiers, disabled_line_hashes=None):
     """
     Check if a Linter rule is disabled in the provided context via user annotations
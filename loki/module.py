@@ -275,11 +275,15 @@ class Module(ProgramUnit):
         # TODO: We need to remove the AST, as certain AST types
         # (eg. FParser) are not pickle-safe.
         del s['_ast']
+        # The cache of derived properties is only valid within this process
+        s.pop('_ir_cache', None)
         return s
 
     def __setstate__(self, s):
         self.__dict__.update(s)
 
+        self._ast = None
+
         # Re-register all contained procedures in symbol table and update parentage
         if self.contains:
             for node in self.contains.body:
@@ -290,6 +294,10 @@ class Module(ProgramUnit):
                 if isinstance(node, Scope):
                     node._reset_parent(self)
 
+        # Update parentage of derived type definitions
+        for typedef in self.typedefs:
+            typedef._reset_parent(self)
+
         # Ensure that we are attaching all symbols to the newly create ``self``.
         self.rescope_symbols()
 
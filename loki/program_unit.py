@@ -10,7 +10,8 @@ from abc import abstractmethod
 from loki.expression import Variable
 from loki.frontend import (
     Frontend, parse_omni_source, parse_ofp_source, parse_fparser_source,
-    RegexParserClass, preprocess_cpp, sanitize_input
+    RegexParserClass, preprocess_cpp, sanitize_input, complete_regex_source,
+    regex_completion_counter
 )
 from loki.ir import nodes as ir, FindNodes, Transformer
 from loki.logging import debug
@@ -58,6 +59,14 @@ class ProgramUnit(Scope):
         frontend and a full parse using one of the other frontends is pending.
     parser_classes : :any:`RegexParserClass`, optional
         Provide the list of parser classes used during incomplete regex parsing
+
+    Notes
+    -----
+    The properties that are derived from the :attr:`spec`, such as :attr:`variables`,
+    :attr:`variable_map` or :attr:`imports`, are cached until the :attr:`spec`
+    is replaced or any IR node is modified in-place via :meth:`Node._update`.
+    Returned tuples and maps are therefore shared between calls and must not
+    be modified.
     """
 
     def __initialize__(self, name, docstring=None, spec=None, contains=None,
@@ -276,6 +285,11 @@ class ProgramUnit(Scope):
 
         Existing :any:`Module` and :any:`Subroutine` objects continue to exist and references
         to them stay valid, as they will only be updated instead of replaced.
+
+        With the :any:`REGEX` frontend, only parser classes that have not been active
+        before are matched, and only against the source fragments that have not been
+        matched before (see :any:`complete_regex_source`). The number of such incremental
+        updates and of full parses is recorded in :any:`regex_completion_counter`.
         """
         if not self._incomplete:
             return
@@ -286,9 +300,14 @@ class ProgramUnit(Scope):
         xmods = frontend_args.get('xmods')
         parser_classes = frontend_args.get('parser_classes', RegexParserClass.AllClasses)
         if frontend == Frontend.REGEX and self._parser_classes:
-            if self._parser_classes == parser_classes:
+            if not parser_classes & ~self._parser_classes:
+                regex_completion_counter['skipped'] += 1
                 return
             parser_classes = parser_classes | self._parser_classes
+            if complete_regex_source(self, parser_classes):
+                regex_completion_counter['incremental'] += 1
+                return
+            regex_completion_counter['full'] += 1
 
         # If this object does not have a parent, we create a temporary parent scope
         # and make sure the node exists in the parent scope. This way, the existing
@@ -466,33 +485,69 @@ class ProgramUnit(Scope):
 
         return obj
 
+    def _get_cached(self, name, func, *key):
+        """
+        Return the result of :data:`func`, which is cached as long as the
+        :attr:`spec`, :attr:`contains` and any additional :data:`key` values remain
+        the same and no IR node has been modified in-place
+
+        Parameters
+        ----------
+        name : str
+            The name of the cache entry
+        func : callable
+            Function without arguments that computes the value
+        *key : optional
+            Additional values that invalidate the cache entry when changed
+        """
+        cache = self.__dict__.setdefault('_ir_cache', {})
+        # The IR is compared by identity, as a structurally equal clone of the spec
+        # contains different node objects
+        ir_state = (ir.Node._ir_version, self.spec, self.contains)
+        entry = cache.get(name)
+        if (
+            entry is not None and entry[1] == key and
+            entry[0][0] == ir_state[0] and all(a is b for a, b in zip(entry[0][1:], ir_state[1:]))
+        ):
+            return entry[2]
+        value = func()
+        cache[name] = (ir_state, key, value)
+        return value
+
     @property
     def typedefs(self):
         """
         Return the :any:`TypeDef` defined in the :attr:`spec` of this unit
         """
-        return as_tuple(FindNodes(ir.TypeDef).visit(self.spec))
+        return self._get_cached('typedefs', lambda: as_tuple(FindNodes(ir.TypeDef).visit(self.spec)))
 
     @property
     def typedef_map(self):
         """
         Map of names and :any:`TypeDef` defined in the :attr:`spec` of this unit
         """
-        return CaseInsensitiveDict((td.name, td) for td in self.typedefs)
+        return self._get_cached(
+            'typedef_map', lambda: CaseInsensitiveDict((td.name, td) for td in self.typedefs)
+        )
 
     @property
     def declarations(self):
         """
         Return the declarations from the :attr:`spec` of this unit
         """
-        return as_tuple(FindNodes((ir.VariableDeclaration, ir.ProcedureDeclaration)).visit(self.spec))
+        return self._get_cached(
+            'declarations',
+            lambda: as_tuple(FindNodes((ir.VariableDeclaration, ir.ProcedureDeclaration)).visit(self.spec))
+        )
 
     @property
     def variables(self):
         """
         Return the variables declared in the :attr:`spec` of this unit
         """
-        return as_tuple(flatten(decl.symbols for decl in self.declarations))
+        return self._get_cached(
+            'variables', lambda: as_tuple(flatten(decl.symbols for decl in self.declarations))
+        )
 
     @variables.setter
     def variables(self, variables):
@@ -528,39 +583,45 @@ class ProgramUnit(Scope):
         """
         Map of variable names to :any:`Variable` objects
         """
-        return CaseInsensitiveDict((v.name, v) for v in self.variables)
+        return self._get_cached(
+            'variable_map', lambda: CaseInsensitiveDict((v.name, v) for v in self.variables)
+        )
 
     @property
     def imports(self):
         """
         Return the list of :any:`Import` in this unit
         """
-        return as_tuple(FindNodes(ir.Import).visit(self.spec or ()))
+        return self._get_cached('imports', lambda: as_tuple(FindNodes(ir.Import).visit(self.spec or ())))
 
     @property
     def import_map(self):
         """
         Map of imported symbol names to :any:`Import` objects
         """
-        return CaseInsensitiveDict((s.name, imprt) for imprt in self.imports for s in imprt.symbols)
+        return self._get_cached(
+            'import_map',
+            lambda: CaseInsensitiveDict((s.name, imprt) for imprt in self.imports for s in imprt.symbols)
+        )
 
     @property
     def imported_symbols(self):
         """
         Return the symbols imported in this unit
         """
-        imports = self.imports
-        return as_tuple(flatten(
+        return self._get_cached('imported_symbols', lambda: as_tuple(flatten(
             imprt.symbols or [s[1] for s in imprt.rename_list or []]
-            for imprt in imports
-        ))
+            for imprt in self.imports
+        )))
 
     @property
     def imported_symbol_map(self):
         """
         Map of imported symbol names to objects
         """
-        return CaseInsensitiveDict((s.name, s) for s in self.imported_symbols)
+        return self._get_cached(
+            'imported_symbol_map', lambda: CaseInsensitiveDict((s.name, s) for s in self.imported_symbols)
+        )
 
     @property
     def all_imports(self):
@@ -578,39 +639,43 @@ class ProgramUnit(Scope):
         """
         Return the list of :any:`Interface` declared in this unit
         """
-        return as_tuple(FindNodes(ir.Interface).visit(self.spec))
+        return self._get_cached('interfaces', lambda: as_tuple(FindNodes(ir.Interface).visit(self.spec)))
 
     @property
     def interface_symbols(self):
         """
         Return the list of symbols declared via interfaces in this unit
         """
-        return as_tuple(flatten(intf.symbols for intf in self.interfaces))
+        return self._get_cached(
+            'interface_symbols', lambda: as_tuple(flatten(intf.symbols for intf in self.interfaces))
+        )
 
     @property
     def interface_map(self):
         """
         Map of declared interface names to :any:`Interface` nodes
         """
-        return CaseInsensitiveDict(
+        return self._get_cached('interface_map', lambda: CaseInsensitiveDict(
             (s.name, intf) for intf in self.interfaces for s in intf.symbols
-        )
+        ))
 
     @property
     def interface_symbol_map(self):
         """
         Map of declared interface names to symbols
         """
-        return CaseInsensitiveDict(
+        return self._get_cached('interface_symbol_map', lambda: CaseInsensitiveDict(
             (s.name, s) for s in self.interface_symbols
-        )
+        ))
 
     @property
     def enum_symbols(self):
         """
         List of symbols defined via an enum
         """
-        return as_tuple(flatten(enum.symbols for enum in FindNodes(ir.Enumeration).visit(self.spec or ())))
+        return self._get_cached('enum_symbols', lambda: as_tuple(
+            flatten(enum.symbols for enum in FindNodes(ir.Enumeration).visit(self.spec or ()))
+        ))
 
     @property
     def definitions(self):
@@ -626,23 +691,27 @@ class ProgramUnit(Scope):
         """
         Return list of all symbols declared or imported in this module scope
         """
+        def _symbols():
+            #Find all nodes that may contain symbols
+            nodelist = FindNodes((ir.VariableDeclaration, ir.ProcedureDeclaration,
+                        ir.Import, ir.Interface, ir.Enumeration)).visit(self.spec or ())
 
-        #Find all nodes that may contain symbols
-        nodelist = FindNodes((ir.VariableDeclaration, ir.ProcedureDeclaration,
-                    ir.Import, ir.Interface, ir.Enumeration)).visit(self.spec or ())
+            #Return all symbols found in nodelist as well as any procedure_symbols
+            #in contained subroutines
+            return as_tuple(flatten(n.symbols for n in nodelist)) + \
+                   tuple(routine.procedure_symbol for routine in self.subroutines)
 
-        #Return all symbols found in nodelist as well as any procedure_symbols
-        #in contained subroutines
-        return as_tuple(flatten(n.symbols for n in nodelist)) + \
-               tuple(routine.procedure_symbol for routine in self.subroutines)
+        # Member procedures may be renamed without modifying the IR
+        return self._get_cached('symbols', _symbols, tuple(routine.name for routine in self.subroutines))
 
     @property
     def symbol_map(self):
         """
         Map of symbol names to symbols
         """
-        return CaseInsensitiveDict(
-            (s.name, s) for s in self.symbols
+        return self._get_cached(
+            'symbol_map', lambda: CaseInsensitiveDict((s.name, s) for s in self.symbols),
+            tuple(routine.name for routine in self.subroutines)
         )
 
     @property
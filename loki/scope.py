@@ -31,6 +31,11 @@ class SymbolTable(dict):
 
     The interface of this table behaves like a :any:`dict`.
 
+    Entries are stored and returned as copy-on-write copies of
+    :any:`SymbolAttributes` (see :meth:`SymbolAttributes._share`), such that
+    modifying a looked-up entry does not alter the table, without having to
+    clone the entry on every look-up.
+
     Parameters
     ----------
     parent : :any:`SymbolTable`, optional
@@ -126,7 +131,7 @@ class SymbolTable(dict):
         value = super().get(name, None)
         if value is None and recursive and self.parent is not None:
             return self.parent._lookup_formatted_name(name, recursive)
-        return value.clone() if value is not None else None
+        return value._share() if value is not None else None
 
     def lookup(self, name, recursive=True):
         """
@@ -154,7 +159,7 @@ class SymbolTable(dict):
         value = self.lookup(key, recursive=False)
         if value is None:
             raise KeyError(key)
-        return value.clone()
+        return value
 
     def get(self, key, default=None):
         """
@@ -168,12 +173,12 @@ class SymbolTable(dict):
             Return this value if :attr:`key` is not found in the table
         """
         value = self.lookup(key, recursive=False)
-        return value.clone() if value is not None else default
+        return value if value is not None else default
 
     def __setitem__(self, key, value):
         assert isinstance(value, SymbolAttributes)
         name_parts = self.format_lookup_name(key)  # pylint: disable=assignment-from-no-return
-        super().__setitem__(name_parts, value.clone())
+        super().__setitem__(name_parts, value._share())
 
     def __hash__(self):
         return hash(tuple(self.keys()))
@@ -205,16 +210,16 @@ class SymbolTable(dict):
         if default is None:
             default = SymbolAttributes(BasicType.DEFERRED)
         assert isinstance(default, SymbolAttributes)
-        super().setdefault(self.format_lookup_name(key), default.clone())
+        super().setdefault(self.format_lookup_name(key), default._share())
 
     def update(self, other):
         """
         Update this symbol table with entries from :attr:`other`
         """
         if isinstance(other, dict):
-            other = {self.format_lookup_name(k): v.clone() for k, v in other.items()}
+            other = {self.format_lookup_name(k): v._share() for k, v in other.items()}
         else:
-            other = {self.format_lookup_name(k): v.clone() for k, v in other}
+            other = {self.format_lookup_name(k): v._share() for k, v in other}
         super().update(other)
 
     def clone(self, **kwargs):
@@ -9,6 +9,7 @@
 Contains the declaration of :any:`Sourcefile` that is used to represent and
 manipulate (Fortran) source code files.
 """
+from functools import lru_cache
 from pathlib import Path
 from codetiming import Timer
 
@@ -21,12 +22,13 @@ from loki.frontend import (
     RegexParserClass
 
 )
+from loki.config import config
 from loki.ir import Section, RawSource, Comment, PreprocessorDirective
 from loki.logging import info, debug, perf
 from loki.module import Module
 from loki.program_unit import ProgramUnit
 from loki.subroutine import Subroutine
-from loki.tools import flatten, as_tuple
+from loki.tools import flatten, as_tuple, DiskCache, write_if_changed, loki_version
 
 
 __all__ = ['Sourcefile']
@@ -128,18 +130,37 @@ class Sourcefile:
             if frontend == REGEX:
                 return cls.from_regex(source, filepath, parser_classes=parser_classes)
 
-            if frontend == OMNI:
-                return cls.from_omni(source, filepath, definitions=definitions,
-                                     includes=includes, defines=defines,
-                                     xmods=xmods, omni_includes=omni_includes)
-
-            if frontend == OFP:
-                return cls.from_ofp(source, filepath, definitions=definitions)
+            # Look-up the parsed file in the persistent parse cache, using the preprocessed
+            # source to capture the content of included files. OMNI resolves includes
+            # itself, which the cache key cannot capture, so the cache is skipped then.
+            cache = _get_parse_cache()
+            if frontend == OMNI and not preprocess and (includes or omni_includes):
+                cache = None
+            if cache is not None:
+                cache_key = _parse_cache_key(source, frontend, {
+                    'path': filepath, 'definitions': definitions, 'preprocess': preprocess,
+                    'includes': includes, 'defines': defines, 'omni_includes': omni_includes,
+                    'xmods': xmods
+                })
+                if (sourcefile := cache.load(cache_key)) is not None:
+                    debug(f'[Loki::Sourcefile] Loaded {filename} from parse cache')
+                    sourcefile._enrich_from_definitions(definitions)
+                    return sourcefile
 
-            if frontend == FP:
-                return cls.from_fparser(source, filepath, definitions=definitions)
+            if frontend == OMNI:
+                sourcefile = cls.from_omni(source, filepath, definitions=definitions,
+                                           includes=includes, defines=defines,
+                                           xmods=xmods, omni_includes=omni_includes)
+            elif frontend == OFP:
+                sourcefile = cls.from_ofp(source, filepath, definitions=definitions)
+            elif frontend == FP:
+                sourcefile = cls.from_fparser(source, filepath, definitions=definitions)
+            else:
+                raise NotImplementedError(f'Unknown frontend: {frontend}')
 
-            raise NotImplementedError(f'Unknown frontend: {frontend}')
+            if cache is not None:
+                cache.store(cache_key, sourcefile)
+            return sourcefile
 
     @classmethod
     def from_omni(cls, raw_source, filepath, definitions=None, includes=None,
@@ -358,6 +379,7 @@ class Sourcefile:
 
         Existing :any:`Module` and :any:`Subroutine` objects continue to exist and references
         to them stay valid, as they will only be updated instead of replaced.
+        For this reason, the persistent parse cache is not used here.
         """
         if not self._incomplete:
             return
@@ -370,6 +392,7 @@ class Sourcefile:
             # Sanitize frontend_args
             if isinstance(frontend, str):
                 frontend = Frontend[frontend.upper()]
+
             if frontend == REGEX:
                 frontend_argnames = ['parser_classes']
             elif frontend == OMNI:
@@ -386,6 +409,13 @@ class Sourcefile:
                 if isinstance(node, ProgramUnit):
                     node.make_complete(frontend=frontend, **frontend_args)
                     body += [node]
+                elif (
+                    isinstance(node, RawSource) and frontend == REGEX and self._parser_classes and
+                    self._parser_classes & RegexParserClass.ProgramUnitClass
+                ):
+                    # Only program units are matched outside of program units, which the
+                    # previous REGEX parse has done already
+                    body += [node]
                 elif isinstance(node, RawSource):
                     # Sanitize the input code to ensure non-supported features
                     # do not break frontend parsing ourside of program units
@@ -436,6 +466,19 @@ class Sourcefile:
                     parser_classes = self._parser_classes | parser_classes
                 self._parser_classes = parser_classes
 
+    def _enrich_from_definitions(self, definitions):
+        """
+        Enrich all program units in the source file with the given :data:`definitions`
+
+        This is used to attach the definitions of the current process to IR
+        that has been loaded from the parse cache.
+        """
+        if not definitions:
+            return
+        for node in self.ir.body:
+            if isinstance(node, ProgramUnit):
+                node.enrich(definitions, recurse=True)
+
     @property
     def source(self):
         return self._source
@@ -573,18 +616,60 @@ class Sourcefile:
             as possible (default: False)
         cuf: bool, optional
             To use either Cuda Fortran or Fortran backend
+
+        Returns
+        -------
+        bool :
+            `True` if the file was written, `False` if it already had
+            the same content and was left untouched
         """
         path = self.path if path is None else Path(path)
         source = self.to_fortran(conservative, cuf) if source is None else source
-        self.to_file(source=source, path=path)
+        return self.to_file(source=source, path=path)
 
     @classmethod
     def to_file(cls, source, path):
         """
         Same as :meth:`write` but can be called from a static context.
+
+        The file is replaced atomically and only if its content changes,
+        see :any:`write_if_changed`.
         """
-        info(f'[Loki::Sourcefile] Writing to {path}')
-        with path.open('w') as f:
-            f.write(source)
-            if source[-1] != '\n':
-                f.write('\n')
+        if not source.endswith('\n'):
+            source += '\n'
+        if write_if_changed(path, source):
+            info(f'[Loki::Sourcefile] Writing to {path}')
+            return True
+        debug(f'[Loki::Sourcefile] Unchanged {path}')
+        return False
+
+
+@lru_cache(maxsize=None)
+def _parse_cache(cache_dir, max_size):
+    """
+    Return the :any:`DiskCache` instance for the given parse cache directory
+    """
+    return DiskCache(cache_dir, max_size=max_size * 1024**2 if max_size else None)
+
+
+def _get_parse_cache():
+    """
+    Return the :any:`DiskCache` for the persistent parse cache or `None` if
+    no ``parse-cache-dir`` is configured
+    """
+    if not config['parse-cache-dir']:
+        return None
+    return _parse_cache(str(config['parse-cache-dir']), config['parse-cache-size'])
+
+
+def _parse_cache_key(source, frontend, frontend_args):
+    """
+    Create the parse cache key for a :data:`source` string, :data:`frontend`
+    and the corresponding :data:`frontend_args`
+
+    Definitions are represented by their names only, and the Loki version
+    is included to invalidate cache entries when Loki is updated.
+    """
+    definitions = sorted(str(d.name).lower() for d in as_tuple(frontend_args.get('definitions')))
+    args = sorted((k, str(v)) for k, v in frontend_args.items() if k != 'definitions')
+    return DiskCache.make_key(source, str(frontend), definitions, args, loki_version())
@@ -116,7 +116,7 @@ class Subroutine(ProgramUnit):
         )
 
     def __getstate__(self):
-        _ignore = ('_ast', '_parent')
+        _ignore = ('_ast', '_parent', '_ir_cache')
         return dict((k, v) for k, v in self.__dict__.items() if k not in _ignore)
 
     def __setstate__(self, s):
@@ -128,6 +128,10 @@ class Subroutine(ProgramUnit):
         for member in self.members:
             self.symbol_attrs[member.name] = SymbolAttributes(ProcedureType(procedure=member))
 
+        # Update parentage of derived type definitions
+        for typedef in self.typedefs:
+            typedef._reset_parent(self)
+
         # Ensure that we are attaching all symbols to the newly create ``self``.
         self.rescope_symbols()
 
@@ -8,9 +8,10 @@
 
 import atexit
 import fnmatch
-from functools import wraps
+from functools import lru_cache, wraps
 from hashlib import md5
 from importlib import import_module, reload, invalidate_caches
+from importlib.metadata import version, PackageNotFoundError
 import os
 from pathlib import Path
 import pickle
@@ -26,7 +27,7 @@ from loki.config import config
 
 __all__ = [
     'LokiTempdir', 'gettempdir', 'filehash', 'delete', 'find_paths', 'find_files',
-    'disk_cached', 'load_module'
+    'disk_cached', 'DiskCache', 'load_module', 'write_if_changed', 'loki_version'
 ]
 
 
@@ -127,6 +128,79 @@ def filehash(source, prefix=None, suffix=None):
     return f'{prefix}{str(md5(source.encode()).hexdigest())}{suffix}'
 
 
+@lru_cache(maxsize=None)
+def loki_version():
+    """
+    Return the version of the installed Loki package, to invalidate
+    persistent caches when Loki is updated
+
+    If Loki is not installed, a hash of its source tree is returned instead.
+    """
+    try:
+        return version('loki')
+    except PackageNotFoundError:
+        # package is not installed
+        loki_dir = Path(__file__).parents[1]
+        hasher = md5()
+        for path in sorted(loki_dir.rglob('*.py')):
+            hasher.update(str(path.relative_to(loki_dir)).encode())
+            hasher.update(path.read_bytes())
+        return f'src-{hasher.hexdigest()}'
+
+
+# The process umask can only be queried by setting it, which is not thread-safe,
+# so it is read once on import and applied to newly created files
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def write_if_changed(path, content):
+    """
+    Atomically write :data:`content` to :data:`path` unless the file
+    already holds exactly that content
+
+    The content is written to a temporary file in the target directory,
+    which is then renamed onto :data:`path`. Readers therefore never observe
+    a partially written file, and an unchanged file keeps its modification
+    time, so that build systems do not recompile it. The permissions of an
+    existing file are preserved.
+
+    Parameters
+    ----------
+    path : str or :any:`pathlib.Path`
+        The file to write
+    content : str
+        The text to write
+
+    Returns
+    -------
+    bool :
+        `True` if the file was written, `False` if it was unchanged
+    """
+    path = Path(path)
+    data = content.encode()
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+        mode = path.stat().st_mode
+    except FileNotFoundError:
+        mode = None
+
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp',
+                                     delete=False) as handle:
+        handle.write(data)
+    try:
+        if mode is None:
+            os.chmod(handle.name, 0o666 & ~_UMASK)
+        else:
+            os.chmod(handle.name, mode & 0o7777)
+        os.replace(handle.name, path)
+    except BaseException:
+        os.remove(handle.name)
+        raise
+    return True
+
+
 def delete(filename, force=False):
     filepath = Path(filename)
     debug(f'Deleting {filepath}')
@@ -225,6 +299,133 @@ def disk_cached(argname, suffix='cache'):
     return decorator
 
 
+class DiskCache:
+    """
+    Content-addressed cache directory for pickled objects with
+    size-bounded least-recently-used (LRU) eviction
+
+    Objects are stored under a key, that is typically created from the content
+    they are derived from via :meth:`make_key`. Every cache hit updates the
+    modification time of the corresponding cache file, which allows to evict
+    the least-recently used entries once the total size of the cache exceeds
+    :attr:`max_size`.
+
+    Writing a cache entry is atomic, i.e., the object is written to a temporary
+    file first and then moved into place. This makes it safe to share a cache
+    directory between concurrently running processes.
+
+    Parameters
+    ----------
+    path : str or :any:`pathlib.Path`
+        The cache directory, which is created if it does not exist
+    max_size : int, optional
+        The maximum total size of all cache entries in bytes. By default, the
+        cache size is unbounded.
+    suffix : str, optional
+        The file suffix to use for cache entries
+    """
+
+    def __init__(self, path, max_size=None, suffix='.pickle'):
+        self.path = Path(path)
+        self.max_size = max_size
+        self.suffix = suffix
+        self._size = None
+
+    @staticmethod
+    def make_key(*args):
+        """
+        Create a cache key from a hash of the string representation of :data:`args`
+        """
+        return filehash(repr(args))
+
+    def _entry_path(self, key):
+        return self.path/f'{key}{self.suffix}'
+
+    def load(self, key):
+        """
+        Load the object stored under :data:`key`
+
+        Returns
+        -------
+        object or None
+            The cached object or `None` if no entry exists for :data:`key`
+        """
+        cachefile = self._entry_path(key)
+        try:
+            with cachefile.open('rb') as cachehandle:
+                obj = pickle.load(cachehandle)
+        except FileNotFoundError:
+            return None
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            debug(f'Discarding invalid cache entry "{cachefile}": {e}')
+            return None
+
+        # Mark the entry as recently used
+        try:
+            os.utime(cachefile)
+        except FileNotFoundError:
+            pass
+        return obj
+
+    def store(self, key, obj):
+        """
+        Store :data:`obj` under :data:`key` and evict least-recently used
+        entries if the cache grows too large
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+        cachefile = self._entry_path(key)
+        with tempfile.NamedTemporaryFile(dir=self.path, suffix='.tmp', delete=False) as cachehandle:
+            pickle.dump(obj, cachehandle)
+        os.replace(cachehandle.name, cachefile)
+        debug(f'Saved cache entry: "{cachefile}"')
+
+        if self.max_size is not None:
+            if self._size is None:
+                self._size = self.size
+            else:
+                self._size += cachefile.stat().st_size
+            if self._size > self.max_size:
+                self.evict()
+
+    def _entries(self):
+        if not self.path.exists():
+            return []
+        return [entry for entry in os.scandir(self.path) if entry.name.endswith(self.suffix)]
+
+    @property
+    def size(self):
+        """
+        The total size of all cache entries in bytes
+        """
+        return sum(entry.stat().st_size for entry in self._entries())
+
+    def evict(self, max_size=None):
+        """
+        Delete least-recently used entries until the total size of the cache
+        is below :data:`max_size` (default: :attr:`max_size`)
+        """
+        max_size = self.max_size if max_size is None else max_size
+        entries = sorted(
+            ((entry.stat().st_mtime, entry.stat().st_size, entry.path) for entry in self._entries()),
+            reverse=True
+        )
+        size = sum(entry[1] for entry in entries)
+        while entries and size > max_size:
+            _, entry_size, entry_path = entries.pop()
+            try:
+                os.remove(entry_path)
+            except FileNotFoundError:
+                pass
+            size -= entry_size
+        self._size = size
+
+    def clear(self):
+        """
+        Remove all entries from the cache
+        """
+        self.evict(max_size=0)
+
+
 def load_module(module, path=None):
     """
     Handle import paths and load the compiled module
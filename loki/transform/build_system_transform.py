@@ -9,10 +9,13 @@
 Transformations to be used in build-system level tasks
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from loki.transform.transformation import Transformation
 from loki.batch.item import ProcedureItem, ModuleItem#, GlobalVariableItem
+from loki.logging import info
+from loki.sourcefile import Sourcefile
 
 __all__ = ['FileWriteTransformation']
 
@@ -35,6 +38,17 @@ class FileWriteTransformation(Transformation):
     include_module_var_imports : bool, optional
         Flag to force the :any:`Scheduler` traversal graph to recognise
         module variable imports and write the modified module files.
+    workers : int, optional
+        Number of threads used to write files in the background. Code
+        generation always happens during the traversal, but comparing against
+        and replacing the file on disk is deferred to the thread pool. When
+        greater than 1, :meth:`wait` must be called after processing to make
+        sure all files have been written.
+
+    Files are only replaced if their content changes, so that unmodified
+    outputs keep their timestamps (see :any:`write_if_changed`). The number
+    of files written and changed are recorded in :attr:`num_files` and
+    :attr:`num_changed`.
     """
 
     # This transformation is applied over the file graph
@@ -42,13 +56,19 @@ class FileWriteTransformation(Transformation):
 
     def __init__(
             self, builddir=None, mode='loki', suffix=None, cuf=False,
-            include_module_var_imports=False
+            include_module_var_imports=False, workers=None
     ):
         self.builddir = Path(builddir)
         self.mode = mode
         self.suffix = suffix
         self.cuf = cuf
         self.include_module_var_imports = include_module_var_imports
+        self.workers = workers
+
+        self.num_files = 0
+        self.num_changed = 0
+        self._executor = None
+        self._pending = []
 
     @property
     def item_filter(self):
@@ -74,4 +94,39 @@ class FileWriteTransformation(Transformation):
         sourcepath = Path(item.path).with_suffix(f'.{self.mode}{suffix}')
         if self.builddir is not None:
             sourcepath = self.builddir/sourcepath.name
-        sourcefile.write(path=sourcepath, cuf=self.cuf)
+
+        if self.workers is None or self.workers <= 1:
+            self._record(sourcefile.write(path=sourcepath, cuf=self.cuf))
+        else:
+            # Generate the code now, as the IR may be modified by subsequent
+            # transformations, and only defer the file I/O
+            source = sourcefile.to_fortran(cuf=self.cuf)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers)
+            self._pending.append(self._executor.submit(Sourcefile.to_file, source, sourcepath))
+
+    def _record(self, changed):
+        self.num_files += 1
+        if changed:
+            self.num_changed += 1
+
+    def wait(self):
+        """
+        Wait for all pending writes to finish and report the number
+        of files that changed
+
+        Returns
+        -------
+        int :
+            The total number of files that were changed on disk
+        """
+        pending, self._pending = self._pending, []
+        try:
+            for future in pending:
+                self._record(future.result())
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+        info(f'[Loki::FileWrite] {self.num_changed} of {self.num_files} files changed')
+        return self.num_changed
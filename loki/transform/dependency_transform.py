@@ -20,6 +20,7 @@ from loki.subroutine import Subroutine
 from loki.types import ProcedureType
 from loki.tools import as_tuple
 from loki.transform.transformation import Transformation
+from loki.transform.transform_utilities import recursive_expression_map_update
 
 
 __all__ = ['DependencyTransformation', 'ModuleWrapTransformation']
@@ -275,6 +276,7 @@ class DependencyTransformation(Transformation):
                 call._update(name=call.name.clone(name=new_name, type=new_type))
                 _update_item(orig_name, str(call.name))
 
+        call_map = {}
         for call in FindInlineCalls(unique=False).visit(routine.body):
             if call.function in members:
                 continue
@@ -282,8 +284,14 @@ class DependencyTransformation(Transformation):
                 orig_name = str(call.name)
                 new_name = f'{orig_name}{self.suffix}'
                 new_type = call.function.type.clone(dtype=ProcedureType(name=new_name))
-                call.function = call.function.clone(name=new_name, type=new_type)
-                _update_item(orig_name, str(call.name))
+                call_map[call] = call.clone(function=call.function.clone(name=new_name, type=new_type))
+                _update_item(orig_name, new_name)
+
+        if call_map:
+            # Expression nodes are immutable, so we substitute the renamed calls,
+            # including any that are nested inside the parameters of other calls
+            call_map = recursive_expression_map_update(call_map)
+            routine.body = SubstituteExpressions(call_map).visit(routine.body)
 
     def rename_imports(self, source, imports, targets=None):
         """
@@ -256,7 +256,7 @@ def loop_interchange(routine, project_bounds=False):
 
         # Apply loop-interchange mapping
         if loop_map:
-            routine.body = Transformer(loop_map).visit(routine.body)
+            routine.body = Transformer(loop_map, share_unchanged=True).visit(routine.body)
             info('%s: interchanged %d loop nest(s)', routine.name, len(loop_map))
 
 
@@ -421,7 +421,7 @@ def loop_fusion(routine):
         loop_map.update({loop: comment for loop in loop_list[1:]})
 
     # Apply transformation
-    routine.body = Transformer(loop_map).visit(routine.body)
+    routine.body = Transformer(loop_map, share_unchanged=True).visit(routine.body)
     info('%s: fused %d loops in %d groups.', routine.name,
          sum(len(loop_list) for loop_list in fusion_groups.values()), len(fusion_groups))
 
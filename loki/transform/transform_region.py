@@ -116,7 +116,9 @@ def region_hoist(routine):
         # Insert target <-> hoisted regions into map
         hoist_map[hoist_targets[group][0]] = hoist_body
 
-    routine.body = MaskedTransformer(active=True, start=starts, stop=stops, mapper=hoist_map).visit(routine.body)
+    routine.body = MaskedTransformer(
+        active=True, start=starts, stop=stops, mapper=hoist_map, share_unchanged=True
+    ).visit(routine.body)
     num_targets = sum(1 for pragma in hoist_map if 'target' in get_pragma_parameters(pragma))
     info('%s: hoisted %d region(s) in %d group(s)', routine.name, len(hoist_map) - num_targets, num_targets)
     promote_nonmatching_variables(routine, promotion_vars_dims, promotion_vars_index)
@@ -202,8 +204,8 @@ def region_to_call(routine):
                 region_routine.variables = as_tuple(region_routine_variables)
                 region_routine.rescope_symbols()
 
-                # Build the call signature
-                region_routine_var_map = region_routine.variable_map
+                # Build the call signature, using a copy of the routine's (cached) variable map
+                region_routine_var_map = CaseInsensitiveDict(region_routine.variable_map)
                 region_routine_arguments = []
                 for intent, args in zip(('in', 'inout', 'out'), (region_in_args, region_inout_args, region_out_args)):
                     for arg in args:
@@ -228,7 +230,9 @@ def region_to_call(routine):
                 call = CallStatement(name=Variable(name=name), arguments=call_arguments)
                 mask_map[region.pragma_post] = call
 
-    routine.body = MaskedTransformer(active=True, start=starts, stop=stops, mapper=mask_map).visit(routine.body)
+    routine.body = MaskedTransformer(
+        active=True, start=starts, stop=stops, mapper=mask_map, share_unchanged=True
+    ).visit(routine.body)
     info('%s: converted %d region(s) to calls', routine.name, counter)
 
     return routines
@@ -79,8 +79,9 @@ class Transformation:
     creates_items : bool
         Indicates to the :any:`Scheduler` that a transformation may create new
         scopes or other dependency nodes (e.g., by adding new routines to a
-        module). The scheduler will run a discovery step after the transformation has
-        been applied to include these new items in the dependency graph (default ``False``).
+        module). The scheduler will run a discovery step for the files of the processed
+        items after the transformation has been applied to include these new items
+        in the dependency graph (default ``False``).
     """
 
     # Forces scheduler traversal in reverse order from the leaf nodes upwards
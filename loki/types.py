@@ -363,6 +363,10 @@ class SymbolAttributes:
     There is no need to check for the presence of attributes, undefined
     attributes can be queried and default to `None`.
 
+    Copies that are created via :meth:`_share` (as done by :any:`SymbolTable`
+    on insertion and look-up) share the attribute storage with the original
+    object until either of them is modified (copy-on-write).
+
     Parameters
     ----------
     dtype : :any:`DataType`
@@ -371,7 +375,10 @@ class SymbolAttributes:
         Any attributes that should be stored as properties
     """
 
+    __slots__ = ('__dict__', '__weakref__', '_shared')
+
     def __init__(self, dtype, **kwargs):
+        object.__setattr__(self, '_shared', False)
         if isinstance(dtype, DataType):
             self.dtype = dtype
         else:
@@ -385,25 +392,51 @@ class SymbolAttributes:
         return hash(tuple(self.__dict__))
 
     def __setattr__(self, name, value):
-        if value is None and name in dir(self):
-            delattr(self, name)
+        if value is None:
+            if name in self.__dict__:
+                delattr(self, name)
         else:
+            self._unshare()
             object.__setattr__(self, name, value)
 
     def __getattr__(self, name):
-        if name not in dir(self):
-            return None
-        return object.__getattribute__(self, name)
+        # This is only called if the attribute is not found via the usual look-up
+        if name == '_shared':
+            return object.__getattribute__(self, name)
+        return None
 
     def __delattr__(self, name):
+        self._unshare()
         object.__delattr__(self, name)
 
     def __getstate__(self):
         return self.__dict__
 
     def __setstate__(self, d):
+        object.__setattr__(self, '_shared', False)
         self.__dict__.update(d)
 
+    def _share(self):
+        """
+        Create a copy that shares the attribute storage with this object
+
+        This is a cheap alternative to :meth:`clone`. The attribute storage is
+        copied only when either of the objects is modified.
+        """
+        obj = object.__new__(type(self))
+        object.__setattr__(obj, '__dict__', self.__dict__)
+        object.__setattr__(obj, '_shared', True)
+        object.__setattr__(self, '_shared', True)
+        return obj
+
+    def _unshare(self):
+        """
+        Create a private copy of the attribute storage, if it is shared with another object
+        """
+        if self._shared:
+            object.__setattr__(self, '__dict__', self.__dict__.copy())
+            object.__setattr__(self, '_shared', False)
+
     def __repr__(self):
         parameters = [str(self.dtype)]
         for k, v in self.__dict__.items():
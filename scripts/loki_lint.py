@@ -130,9 +130,12 @@ def rules(ctx, with_title, sort_by):  # pylint: disable=unused-argument
               help='Use a Scheduler to plan source file traversal.')
 @click.option('--junitxml', type=click.Path(dir_okay=False, writable=True),
               help='Enable output in JUnit XML format to the given file.')
+@click.option('--cache-dir', type=click.Path(file_okay=False, writable=True),
+              help=('Cache lint results in the given directory and reuse them for '
+                    'unchanged files in subsequent runs.'))
 @click.pass_context
 def check(ctx, include, exclude, basedir, config, fix, backup_suffix, worker,
-          write_violations_file, scheduler, junitxml):
+          write_violations_file, scheduler, junitxml, cache_dir):
     yaml.add_constructor('!include', yaml_include_constructor, yaml.SafeLoader)
     config_values = yaml.safe_load(config) if config else {}
     if ctx.obj['DEBUG']:
@@ -200,6 +203,8 @@ def check(ctx, include, exclude, basedir, config, fix, backup_suffix, worker,
         config_values['violations_file'] = write_violations_file
     if junitxml:
         config_values['junitxml_file'] = junitxml
+    if cache_dir:
+        config_values['cache_dir'] = cache_dir
 
     with Timer(logger=info, text='Files checking completed in {:.2f}s'):
         checked_count = lint_files(rule_list, config_values)
@@ -121,12 +121,14 @@ def cli(debug):
               help="Recursively derive explicit shape dimension for argument arrays")
 @click.option('--eliminate-dead-code/--no-eliminate-dead-code', default=True,
               help='Perform dead code elimination, where unreachable branches are trimmed from the code.')
+@click.option('--num-workers', type=int, default=None,
+              help='Number of workers to use for parsing and writing source files (default: sequential).')
 def convert(
         mode, config, build, source, header, cpp, directive, include, define, omni_include, xmod,
         data_offload, remove_openmp, assume_deviceptr, frontend, trim_vector_sections,
         global_var_offload, remove_derived_args, inline_members, inline_marked,
         resolve_sequence_association, resolve_sequence_association_inlined_calls,
-        derive_argument_array_shape, eliminate_dead_code
+        derive_argument_array_shape, eliminate_dead_code, num_workers
 ):
     """
     Batch-processing mode for Fortran-to-Fortran transformations that
@@ -172,7 +174,8 @@ def convert(
     paths = [Path(p).resolve() for p in as_tuple(source)]
     paths += [Path(h).resolve().parent for h in as_tuple(header)]
     scheduler = Scheduler(
-        paths=paths, config=config, frontend=frontend, definitions=definitions, **build_args
+        paths=paths, config=config, frontend=frontend, definitions=definitions,
+        num_workers=num_workers, **build_args
     )
 
     # Pull dimension definition from configuration
@@ -239,15 +242,13 @@ def convert(
         ))
 
     if mode in ['scc', 'scc-hoist', 'scc-stack']:
-        # Apply the basic SCC transformation set
-        scheduler.process( SCCBaseTransformation(
-            horizontal=horizontal, directive=directive
-        ))
-        scheduler.process( SCCDevectorTransformation(
-            horizontal=horizontal, trim_vector_sections=trim_vector_sections
-        ))
-        scheduler.process( SCCDemoteTransformation(horizontal=horizontal))
-        scheduler.process( SCCRevectorTransformation(horizontal=horizontal))
+        # Apply the basic SCC transformation set in a single traversal
+        scheduler.process_pipeline([
+            SCCBaseTransformation(horizontal=horizontal, directive=directive),
+            SCCDevectorTransformation(horizontal=horizontal, trim_vector_sections=trim_vector_sections),
+            SCCDemoteTransformation(horizontal=horizontal),
+            SCCRevectorTransformation(horizontal=horizontal)
+        ])
 
     if mode == 'scc-hoist':
         # Apply recursive hoisting of local temporary arrays.
@@ -311,10 +312,12 @@ def convert(
         scheduler.process( DependencyTransformation(suffix=f'_{mode.upper()}', module_suffix='_MOD') )
 
     # Write out all modified source files into the build directory
-    scheduler.process(transformation=FileWriteTransformation(
+    file_write_trafo = FileWriteTransformation(
         builddir=build, mode=mode, cuf='cuf' in mode,
-        include_module_var_imports=global_var_offload
-    ))
+        include_module_var_imports=global_var_offload, workers=num_workers
+    )
+    scheduler.process(transformation=file_write_trafo)
+    file_write_trafo.wait()
 
 
 @cli.command('plan')
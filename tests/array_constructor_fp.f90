@@ -0,0 +1,20 @@
+SUBROUTINE array_constructor (dim, zarr1, zarr2, narr1, narr2, narr3, narr4, narr5)
+  IMPLICIT NONE
+  INTEGER, INTENT(IN) :: dim
+  REAL(KIND=8), INTENT(INOUT) :: zarr1(dim + 1)
+  REAL(KIND=8), INTENT(INOUT) :: zarr2(3)
+  INTEGER, INTENT(INOUT) :: narr1(dim)
+  INTEGER, INTENT(INOUT) :: narr2(10)
+  INTEGER, INTENT(INOUT) :: narr3(3)
+  INTEGER, INTENT(INOUT) :: narr4(2, 2)
+  INTEGER, INTENT(INOUT) :: narr5(10)
+  INTEGER :: i
+  
+  zarr1 = (/ 3.6, ( 3.6 / I, I = 1,dim ) /)
+  narr1 = (/ ( I, I = 1,DIM ) /)
+  narr2 = (/ 1, 0, ( I, I = -1,-6,-1 ), -7, -8 /)
+  narr3 = (/ INTEGER :: 1, 2., 3d0 /)    ! A default integer array
+  zarr2 = (/ REAL(KIND=8) :: 1, 2, 3._8 /)    ! A real(8) array
+  narr4 = RESHAPE((/ 1, 2, 3, 4 /), shape=(/ 2, 2 /))
+  narr5 = (/ ( I, I = 30,48,2 ) /)
+END SUBROUTINE array_constructor
@@ -0,0 +1,15 @@
+SUBROUTINE associates_expr (in, out)
+  IMPLICIT NONE
+  INTEGER, INTENT(IN) :: in(3)
+  INTEGER, INTENT(OUT) :: out(3)
+  
+  out(:) = 0
+  
+  ASSOCIATE (a=>1 + 3)
+  out(:) = out(:) + a
+  END ASSOCIATE
+  
+  ASSOCIATE (b=>2*in(:) + in(:))
+  out(:) = out(:) + b(:)
+  END ASSOCIATE
+END SUBROUTINE associates_expr
@@ -0,0 +1,11 @@
+SUBROUTINE cycle_stmt (var)
+  IMPLICIT NONE
+  INTEGER, INTENT(OUT) :: var
+  INTEGER :: i
+  
+  var = 0
+  DO i=1,10
+    IF (var > 5) CYCLE
+    var = var + 1
+  END DO
+END SUBROUTINE cycle_stmt
@@ -0,0 +1,9 @@
+SUBROUTINE goto_stmt (var)
+  IMPLICIT NONE
+  INTEGER, INTENT(OUT) :: var
+  var = 3
+  GO TO 1234
+  var = 5
+1234 RETURN
+  var = 7
+END SUBROUTINE goto_stmt
@@ -0,0 +1,10 @@
+SUBROUTINE inline_conditionals (in1, in2, out1, out2)
+  INTEGER, INTENT(IN) :: in1, in2
+  INTEGER, INTENT(OUT) :: out1, out2
+  
+  out1 = in1
+  out2 = in2
+  
+  IF (in1 < 0) out1 = 0
+  IF (in2 > 5) out2 = 5
+END SUBROUTINE inline_conditionals
@@ -0,0 +1,9 @@
+SUBROUTINE loop_labeled_continue (out)
+  INTEGER, INTENT(OUT) :: out
+  INTEGER :: j
+  
+  out = 1
+  DO 101 j=1,10
+    out = out + 1
+101 CONTINUE
+END SUBROUTINE loop_labeled_continue
@@ -0,0 +1,20 @@
+SUBROUTINE loop_nest_fixed (in1, in2, out1, out2)
+  
+  INTEGER, PARAMETER :: jprb = SELECTED_REAL_KIND(13, 300)
+  REAL(KIND=jprb), INTENT(IN), DIMENSION(3, 2) :: in1, in2
+  REAL(KIND=jprb), INTENT(INOUT) :: out1(3, 2), out2(2)
+  INTEGER :: i, j
+  
+  DO j=1,2
+    DO i=1,3
+      out1(i, j) = in1(i, j) + in2(i, j)
+    END DO
+  END DO
+  
+  DO j=1,2
+    out2(j) = 0.
+    DO i=1,3
+      out2(j) = out2(j) + in1(i, j)*in2(i, j)
+    END DO
+  END DO
+END SUBROUTINE loop_nest_fixed
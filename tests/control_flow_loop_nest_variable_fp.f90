@@ -0,0 +1,21 @@
+SUBROUTINE loop_nest_variable (dim1, dim2, in1, in2, out1, out2)
+  INTEGER, PARAMETER :: jprb = SELECTED_REAL_KIND(13, 300)
+  INTEGER, INTENT(IN) :: dim1, dim2
+  REAL(KIND=jprb), INTENT(IN), DIMENSION(dim1, dim2) :: in1, in2
+  REAL(KIND=jprb), INTENT(INOUT) :: out1(dim1, dim2), out2(dim2)
+  
+  INTEGER :: i, j
+  
+  DO j=1,dim2
+    DO i=1,dim1
+      out1(i, j) = in1(i, j) + in2(i, j)
+    END DO
+  END DO
+  
+  DO j=1,dim2
+    out2(j) = 0.
+    DO i=1,dim1
+      out2(j) = out2(j) + in1(i, j)*in2(i, j)
+    END DO
+  END DO
+END SUBROUTINE loop_nest_variable
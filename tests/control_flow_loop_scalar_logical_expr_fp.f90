@@ -0,0 +1,8 @@
+SUBROUTINE loop_scalar_logical_expr (outvar)
+  INTEGER, INTENT(OUT) :: outvar
+  
+  outvar = 0
+  DO WHILE (outvar < 5)
+    outvar = outvar + 1
+  END DO
+END SUBROUTINE loop_scalar_logical_expr
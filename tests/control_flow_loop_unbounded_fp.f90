@@ -0,0 +1,11 @@
+SUBROUTINE loop_unbounded (out)
+  INTEGER, INTENT(OUT) :: out
+  
+  out = 1
+  DO
+    out = out + 1
+    IF (out > 5) THEN
+      EXIT
+    END IF
+  END DO
+END SUBROUTINE loop_unbounded
@@ -0,0 +1,16 @@
+SUBROUTINE select_case (cmd, out1)
+  IMPLICIT NONE
+  INTEGER, INTENT(IN) :: cmd
+  INTEGER, INTENT(OUT) :: out1
+  
+  SELECT CASE (cmd)
+  CASE (0)
+    out1 = 0
+  CASE (1:9)
+    out1 = 1
+  CASE (10, 11)
+    out1 = 2
+  CASE DEFAULT
+    out1 = -1
+  END SELECT
+END SUBROUTINE select_case
@@ -0,0 +1,32 @@
+SUBROUTINE select_case (cmd, out1)
+  IMPLICIT NONE
+  INTEGER, INTENT(IN) :: cmd
+  INTEGER, INTENT(OUT) :: out1
+  
+  out1 = -1000
+  
+  ! comment 1
+  ! comment 2
+  SELECT CASE (cmd)
+  CASE (0)
+    out1 = 0
+    ! comment 3
+  CASE (1:9)
+    out1 = 1
+    SELECT CASE (cmd)
+    CASE (2:3)
+      out1 = out1 + 100
+    CASE (4:5)
+      out1 = out1 + 200
+    END SELECT
+    ! comment 4
+    ! comment 5
+    
+    ! comment 6
+  CASE (10, 11)
+    out1 = 2
+    ! comment 7
+  CASE DEFAULT
+    out1 = -1
+  END SELECT
+END SUBROUTINE select_case
@@ -0,0 +1,33 @@
+MODULE derived_types_mod
+  INTEGER, PARAMETER :: jprb = SELECTED_REAL_KIND(13, 300)
+  
+  TYPE deferred
+    REAL(KIND=jprb), ALLOCATABLE :: scalar, vector(:), matrix(:, :)
+    REAL(KIND=jprb), ALLOCATABLE :: red_herring
+  END TYPE deferred
+  CONTAINS
+  
+  SUBROUTINE alloc_deferred (item)
+    TYPE(deferred), INTENT(INOUT) :: item
+    ALLOCATE (item%vector(3))
+    ALLOCATE (item%matrix(3, 3))
+  END SUBROUTINE alloc_deferred
+  
+  SUBROUTINE free_deferred (item)
+    TYPE(deferred), INTENT(INOUT) :: item
+    DEALLOCATE (item%vector)
+    DEALLOCATE (item%matrix)
+  END SUBROUTINE free_deferred
+  
+  SUBROUTINE array_indexing_deferred (item)
+    TYPE(deferred), INTENT(INOUT) :: item
+    REAL(KIND=jprb) :: vals(3) = (/ 1., 2., 3. /)
+    INTEGER :: i
+    
+    item%vector(:) = 666.
+    
+    DO i=1,3
+      item%matrix(:, i) = vals(i)
+    END DO
+  END SUBROUTINE array_indexing_deferred
+END MODULE derived_types_mod
@@ -0,0 +1,20 @@
+MODULE derived_types_mod
+  INTEGER, PARAMETER :: jprb = SELECTED_REAL_KIND(13, 300)
+  
+  TYPE explicit
+    REAL(KIND=jprb) :: scalar, vector(3), matrix(3, 3)
+    REAL(KIND=jprb) :: red_herring
+  END TYPE explicit
+  CONTAINS
+  
+  SUBROUTINE array_indexing_explicit (item)
+    TYPE(explicit), INTENT(INOUT) :: item
+    REAL(KIND=jprb) :: vals(3) = (/ 1., 2., 3. /)
+    INTEGER :: i
+    
+    item%vector(:) = 666.
+    DO i=1,3
+      item%matrix(:, i) = vals(i)
+    END DO
+  END SUBROUTINE array_indexing_explicit
+END MODULE derived_types_mod
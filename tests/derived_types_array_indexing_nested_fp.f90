@@ -0,0 +1,27 @@
+MODULE derived_types_mod
+  INTEGER, PARAMETER :: jprb = SELECTED_REAL_KIND(13, 300)
+  
+  TYPE explicit
+    REAL(KIND=jprb) :: scalar, vector(3), matrix(3, 3)
+    REAL(KIND=jprb) :: red_herring
+  END TYPE explicit
+  
+  TYPE nested
+    REAL(KIND=jprb) :: a_scalar, a_vector(3)
+    TYPE(explicit) :: another_item
+  END TYPE nested
+  CONTAINS
+  
+  SUBROUTINE array_indexing_nested (item)
+    TYPE(nested), INTENT(INOUT) :: item
+    REAL(KIND=jprb) :: vals(3) = (/ 1., 2., 3. /)
+    INTEGER :: i
+    
+    item%a_vector(:) = 666.
+    item%another_item%vector(:) = 999.
+    
+    DO i=1,3
+      item%another_item%matrix(:, i) = vals(i)
+    END DO
+  END SUBROUTINE array_indexing_nested
+END MODULE derived_types_mod
@@ -0,0 +1,52 @@
+MODULE derived_types_mod
+  INTEGER, PARAMETER :: jprb = SELECTED_REAL_KIND(13, 300)
+  
+  TYPE explicit
+    REAL(KIND=jprb) :: scalar, vector(3), matrix(3, 3)
+    REAL(KIND=jprb) :: red_herring
+  END TYPE explicit
+  
+  TYPE deferred
+    REAL(KIND=jprb), ALLOCATABLE :: scalar, vector(:), matrix(:, :)
+    REAL(KIND=jprb), ALLOCATABLE :: red_herring
+  END TYPE deferred
+  CONTAINS
+  
+  SUBROUTINE alloc_deferred (item)
+    TYPE(deferred), INTENT(INOUT) :: item
+    ALLOCATE (item%vector(3))
+    ALLOCATE (item%matrix(3, 3))
+  END SUBROUTINE alloc_deferred
+  
+  SUBROUTINE free_deferred (item)
+    TYPE(deferred), INTENT(INOUT) :: item
+    DEALLOCATE (item%vector)
+    DEALLOCATE (item%matrix)
+  END SUBROUTINE free_deferred
+  
+  SUBROUTINE associates (item)
+    TYPE(explicit), INTENT(INOUT) :: item
+    TYPE(deferred) :: item2
+    
+    item%scalar = 17.0
+    
+    ASSOCIATE (vector2=>item%matrix(:, 1))
+    vector2(:) = 3.
+    item%matrix(:, 3) = vector2(:)
+    END ASSOCIATE
+    
+    ASSOCIATE (vector=>item%vector)
+    item%vector(2) = vector(1)
+    vector(3) = item%vector(1) + vector(2)
+    vector(1) = 1.
+    END ASSOCIATE
+    
+    CALL alloc_deferred(item2)
+    
+    ASSOCIATE (vec=>item2%vector(2))
+    vec = 1.
+    END ASSOCIATE
+    
+    CALL free_deferred(item2)
+  END SUBROUTINE associates
+END MODULE derived_types_mod
@@ -0,0 +1,19 @@
+MODULE derived_types_mod
+  INTEGER, PARAMETER :: jprb = SELECTED_REAL_KIND(13, 300)
+  
+  TYPE case_sensitive
+    REAL(KIND=jprb) :: u, v, T
+    REAL(KIND=jprb) :: q, A
+  END TYPE case_sensitive
+  CONTAINS
+  
+  SUBROUTINE check_case (item)
+    TYPE(case_sensitive), INTENT(INOUT) :: item
+    
+    item%u = 1.0
+    item%v = 2.0
+    item%t = 3.0
+    item%q = -1.0
+    item%A = -5.0
+  END SUBROUTINE check_case
+END MODULE derived_types_mod
@@ -0,0 +1,55 @@
+MODULE derived_types_mod
+  INTEGER, PARAMETER :: jprb = SELECTED_REAL_KIND(13, 300)
+  
+  TYPE deferred
+    REAL(KIND=jprb), ALLOCATABLE :: scalar, vector(:), matrix(:, :)
+    REAL(KIND=jprb), ALLOCATABLE :: red_herring
+  END TYPE deferred
+  CONTAINS
+  
+  SUBROUTINE alloc_deferred (item)
+    TYPE(deferred), INTENT(INOUT) :: item
+    ALLOCATE (item%vector(3))
+    ALLOCATE (item%matrix(3, 3))
+  END SUBROUTINE alloc_deferred
+  
+  SUBROUTINE free_deferred (item)
+    TYPE(deferred), INTENT(INOUT) :: item
+    DEALLOCATE (item%vector)
+    DEALLOCATE (item%matrix)
+  END SUBROUTINE free_deferred
+  
+  SUBROUTINE deferred_array (item)
+    TYPE(deferred), INTENT(INOUT) :: item
+    TYPE(deferred), ALLOCATABLE :: item2(:)
+    REAL(KIND=jprb) :: vals(3) = (/ 1., 2., 3. /)
+    INTEGER :: i, j
+    
+    ALLOCATE (item2(4))
+    
+    DO j=1,4
+      CALL alloc_deferred(item2(j))
+      
+      item2(j)%vector(:) = 666.
+      
+      DO i=1,3
+        item2(j)%matrix(:, i) = vals(i)
+      END DO
+    END DO
+    
+    item%vector(:) = 0.
+    item%matrix(:, :) = 0.
+    
+    DO j=1,4
+      item%vector(:) = item%vector(:) + item2(j)%vector(:)
+      
+      DO i=1,3
+        item%matrix(:, i) = item%matrix(:, i) + item2(j)%matrix(:, i)
+      END DO
+      
+      CALL free_deferred(item2(j))
+    END DO
+    
+    DEALLOCATE (item2)
+  END SUBROUTINE deferred_array
+END MODULE derived_types_mod
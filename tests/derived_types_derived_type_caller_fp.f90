@@ -0,0 +1,34 @@
+MODULE derived_types_mod
+  INTEGER, PARAMETER :: jprb = SELECTED_REAL_KIND(13, 300)
+  
+  TYPE explicit
+    REAL(KIND=jprb) :: scalar, vector(3), matrix(3, 3)
+    REAL(KIND=jprb) :: red_herring
+  END TYPE explicit
+  CONTAINS
+  
+  SUBROUTINE simple_loops (item)
+    TYPE(explicit), INTENT(INOUT) :: item
+    INTEGER :: i, j, n
+    
+    n = 3
+    DO i=1,n
+      item%vector(i) = item%vector(i) + item%scalar
+    END DO
+    
+    DO j=1,n
+      DO i=1,n
+        item%matrix(i, j) = item%matrix(i, j) + item%scalar
+      END DO
+    END DO
+  END SUBROUTINE simple_loops
+  
+  SUBROUTINE derived_type_caller (item)
+    ! simple call to another routine specifying a derived type as argument
+    TYPE(explicit), INTENT(INOUT) :: item
+    
+    item%red_herring = 42.
+    CALL simple_loops(item)
+  END SUBROUTINE derived_type_caller
+  
+END MODULE derived_types_mod
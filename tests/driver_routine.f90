@@ -0,0 +1,9 @@
+SUBROUTINE driver_routine (nlon, nlev, a, b)
+  USE kernel_mod, ONLY: kernel_routine
+  INTEGER, INTENT(IN) :: nlon, nlev
+  INTEGER, INTENT(INOUT) :: a(nlon, nlev)
+  INTEGER, INTENT(INOUT) :: b(nlon, nlev)
+  
+  CALL kernel_routine(nlon, nlev, a, b)
+  
+END SUBROUTINE driver_routine
@@ -0,0 +1,8 @@
+SUBROUTINE arithmetic_expr (v1, v2, v3, v4, v5, v6)
+  INTEGER, PARAMETER :: jprb = SELECTED_REAL_KIND(13, 300)
+  REAL(KIND=jprb), INTENT(IN) :: v1, v2, v3, v4
+  REAL(KIND=jprb), INTENT(OUT) :: v5, v6
+  
+  v5 = (v1 + v2)*(v3 - v4)
+  v6 = (v1**v2) - (v3 / v4)
+END SUBROUTINE arithmetic_expr
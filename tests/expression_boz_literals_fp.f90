@@ -0,0 +1,10 @@
+SUBROUTINE boz_literals (n1, n2, n3, n4, n5, n6)
+  INTEGER, INTENT(OUT) :: n1, n2, n3, n4, n5, n6
+  
+  n1 = INT(B'00000')
+  n2 = INT(b"101010")
+  n3 = INT(O'737')
+  n4 = INT(o"007")
+  n5 = INT(Z'CAFE')
+  n6 = INT(z"babe")
+END SUBROUTINE boz_literals
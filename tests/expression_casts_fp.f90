@@ -0,0 +1,9 @@
+SUBROUTINE casts (v1, v2, v3, v4, v5)
+  INTEGER, PARAMETER :: jprb = SELECTED_REAL_KIND(13, 300)
+  INTEGER, INTENT(IN) :: v1
+  REAL(KIND=jprb), INTENT(IN) :: v2, v3
+  REAL(KIND=jprb), INTENT(OUT) :: v4, v5
+  
+  v4 = REAL(v1, kind=jprb)    ! Test a plain cast
+  v5 = REAL(v1, kind=jprb)*MAX(v2, v3)    ! Cast as part of expression
+END SUBROUTINE casts
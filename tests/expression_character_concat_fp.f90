@@ -0,0 +1,9 @@
+SUBROUTINE character_concat (string)
+  CHARACTER(LEN=10) :: tmp_str1, tmp_str2
+  CHARACTER(LEN=12), INTENT(OUT) :: string
+  
+  tmp_str1 = 'Hel' // 'lo'
+  tmp_str2 = 'wor' // 'l' // 'd'
+  string = TRIM(tmp_str1) // ' ' // TRIM(tmp_str2)
+  string = TRIM(string) // '!'
+END SUBROUTINE character_concat
@@ -0,0 +1,7 @@
+SUBROUTINE complex_literals (c1, c2, c3)
+  COMPLEX, INTENT(OUT) :: c1, c2, c3
+  
+  c1 = (1.0, -1.0)
+  c2 = (3, 2E8)
+  c3 = (21_2, 4._8)
+END SUBROUTINE complex_literals
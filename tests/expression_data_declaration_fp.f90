@@ -0,0 +1,24 @@
+SUBROUTINE data_declaration (data_out)
+  IMPLICIT NONE
+  INTEGER, INTENT(OUT), DIMENSION(5, 4) :: data_out
+  INTEGER, DIMENSION(5, 4) :: data1, data2
+  INTEGER, DIMENSION(3) :: data3
+  INTEGER :: i, j
+  
+  DATA data1 / 20*5 /
+  
+  DATA data2(i, j)
+i
+1
+5
+j
+1
+4 / 20*3 /
+  
+  DATA data3(1)
+data3(3)
+data3(2) / 1, 2, 3 /
+  
+  data_out(:, :) = data1(:, :) + data2(:, :)
+  data_out(1:3, 1) = data3
+END SUBROUTINE data_declaration
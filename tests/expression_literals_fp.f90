@@ -0,0 +1,13 @@
+SUBROUTINE literals (v1, v2, v3, v4, v5, v6)
+  INTEGER, PARAMETER :: jprb = SELECTED_REAL_KIND(13, 300)
+  REAL(KIND=jprb), INTENT(OUT) :: v1, v2, v3
+  REAL(KIND=SELECTED_REAL_KIND(13, 300)), INTENT(OUT) :: v4, v5, v6
+  
+  v1 = 66
+  v2 = 66.0
+  v3 = 2.3
+  v4 = 2.4_jprb
+  v5 = REAL(6, kind=jprb) + REAL(1, kind=SELECTED_REAL_KIND(13, 300))
+  v6 = REAL(3.5, kind=jprb)
+  v6 = INT(3.5)
+END SUBROUTINE literals
@@ -0,0 +1,22 @@
+SUBROUTINE logical_array (dim, arr, out)
+  INTEGER, PARAMETER :: jprb = SELECTED_REAL_KIND(13, 300)
+  INTEGER, INTENT(IN) :: dim
+  REAL(KIND=jprb), INTENT(IN) :: arr(dim)
+  REAL(KIND=jprb), INTENT(OUT) :: out(dim)
+  LOGICAL :: mask(dim)
+  INTEGER :: i
+  
+  mask(:) = .true.
+  mask(1) = .false.
+  mask(2) = .false.
+  
+  DO i=1,dim
+    ! Use a logical array and a relational
+    ! containing an array in a single expression
+    IF (mask(i) .and. arr(i) > 1.) THEN
+      out(i) = 3.
+    ELSE
+      out(i) = 1.
+    END IF
+  END DO
+END SUBROUTINE logical_array
@@ -0,0 +1,15 @@
+SUBROUTINE logicals (t, f, vand_t, vand_f, vor_t, vor_f, vnot_t, vnot_f, vtrue, vfalse, veq, vneq)
+  LOGICAL, INTENT(IN) :: t, f
+  LOGICAL, INTENT(OUT) :: vand_t, vand_f, vor_t, vor_f, vnot_t, vnot_f, vtrue, vfalse, veq, vneq
+  
+  vand_t = t .and. t
+  vand_f = t .and. f
+  vor_t = t .or. f
+  vor_f = f .or. f
+  vnot_t = .not.f
+  vnot_f = .not.t
+  vtrue = .true.
+  vfalse = .false.
+  veq = 3 == 4
+  vneq = 3 /= 4
+END SUBROUTINE logicals
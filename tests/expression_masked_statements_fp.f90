@@ -0,0 +1,20 @@
+SUBROUTINE expression_masked_statements (length, vec1, vec2, vec3)
+  INTEGER, PARAMETER :: jprb = SELECTED_REAL_KIND(13, 300)
+  INTEGER, INTENT(IN) :: length
+  REAL(KIND=jprb), INTENT(INOUT), DIMENSION(length) :: vec1, vec2, vec3
+  
+  WHERE (vec1(:) > 5.0_jprb)
+    vec1(:) = 7.0_jprb
+    vec1(:) = 5.0_jprb
+  END WHERE
+  
+  WHERE (vec2(:) < -0.d1)
+    vec2(:) = -1.0_jprb
+  ELSEWHERE (vec2(:) > 0.d1)
+    vec2(:) = 1.0_jprb
+  ELSEWHERE
+    vec2(:) = 0.0_jprb
+  END WHERE
+  
+  WHERE (0.0_jprb < vec3(:) .and. vec3(:) < 3.0_jprb) vec3(:) = 1.0_jprb
+END SUBROUTINE expression_masked_statements
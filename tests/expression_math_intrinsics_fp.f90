@@ -0,0 +1,12 @@
+SUBROUTINE math_intrinsics (v1, v2, vmin, vmax, vabs, vexp, vsqrt, vlog)
+  INTEGER, PARAMETER :: jprb = SELECTED_REAL_KIND(13, 300)
+  REAL(KIND=jprb), INTENT(IN) :: v1, v2
+  REAL(KIND=jprb), INTENT(OUT) :: vmin, vmax, vabs, vexp, vsqrt, vlog
+  
+  vmin = MIN(v1, v2)
+  vmax = MAX(v1, v2)
+  vabs = ABS(v1 - v2)
+  vexp = EXP(v1 + v2)
+  vsqrt = SQRT(v1 + v2)
+  vlog = LOG(v1 + v2)
+END SUBROUTINE math_intrinsics
@@ -0,0 +1,31 @@
+
+SUBROUTINE simple_expr (v1, v2, v3, v4, v5, v6)
+  ! simple floating point arithmetic
+  INTEGER, PARAMETER :: jprb = SELECTED_REAL_KIND(13, 300)
+  REAL(KIND=jprb), INTENT(IN) :: v1, v2, v3, v4
+  REAL(KIND=jprb), INTENT(OUT) :: v5, v6
+  
+  v5 = (v1 + v2)*(v3 - v4)
+  v6 = (v1**v2) - (v3 / v4)
+END SUBROUTINE simple_expr
+
+SUBROUTINE very_long_statement (scalar, res)
+  INTEGER, INTENT(IN) :: scalar
+  INTEGER, INTENT(OUT) :: res
+  
+  res = 5*scalar + scalar - scalar + scalar - scalar + (scalar - scalar + scalar - scalar) - 1 + 2 - 3 + 4 - 5 + 6 - 7 + 8 - (9 + &
+  &  10 - 9) + 10 - 8 + 7 - 6 + 5 - 4 + 3 - 2 + 1
+END SUBROUTINE very_long_statement
+
+SUBROUTINE nested_call_inline_call (v1, v2, v3)
+  INTEGER, PARAMETER :: jprb = SELECTED_REAL_KIND(13, 300)
+  INTEGER, INTENT(IN) :: v1
+  REAL(KIND=jprb), INTENT(OUT) :: v2
+  INTEGER, INTENT(OUT) :: v3
+  REAL(KIND=jprb) :: tmp1, tmp2
+  
+  tmp1 = REAL(1, kind=jprb)
+  CALL simple_expr(tmp1, ABS(-2.0_jprb), 3.0_jprb, REAL(v1, kind=jprb), v2, tmp2)
+  v2 = ABS(tmp2 - v2)
+  CALL very_long_statement(INT(v2), v3)
+END SUBROUTINE nested_call_inline_call
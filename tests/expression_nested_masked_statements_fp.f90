@@ -0,0 +1,19 @@
+SUBROUTINE expression_nested_masked_statements (length, vec1)
+  INTEGER, PARAMETER :: jprb = SELECTED_REAL_KIND(13, 300)
+  INTEGER, INTENT(IN) :: length
+  REAL(KIND=jprb), INTENT(INOUT), DIMENSION(length) :: vec1
+  
+  WHERE (vec1(:) >= 4.0_jprb)
+    WHERE (vec1(:) > 6.0_jprb)
+      vec1(:) = 6.0_jprb
+    ELSEWHERE
+      vec1(:) = 4.0_jprb
+    END WHERE
+  ELSEWHERE
+    WHERE (vec1(:) < 2.0_jprb)
+      vec1(:) = 0.0_jprb
+    ELSEWHERE
+      vec1(:) = 2.0_jprb
+    END WHERE
+  END WHERE
+END SUBROUTINE expression_nested_masked_statements
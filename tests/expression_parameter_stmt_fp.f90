@@ -0,0 +1,9 @@
+SUBROUTINE parameter_stmt (out1)
+  IMPLICIT NONE
+  INTEGER, PARAMETER :: jprb = SELECTED_REAL_KIND(13, 300)
+  REAL(KIND=jprb) :: param
+  PARAMETER(param = 2.0)
+  REAL(KIND=jprb), INTENT(OUT) :: out1
+  
+  out1 = param
+END SUBROUTINE parameter_stmt
@@ -0,0 +1,12 @@
+SUBROUTINE pointer_nullify ()
+  IMPLICIT NONE
+  CHARACTER(LEN=64), POINTER, DIMENSION(:) :: charp => NULL()
+  CHARACTER(LEN=64), POINTER :: pp => NULL()
+  ALLOCATE (charp(3))
+  charp(:) = '_ptr_'
+  pp => charp(1)
+  pp = '_other_ptr_'
+  NULLIFY (pp)
+  DEALLOCATE (charp)
+  charp => NULL()
+END SUBROUTINE pointer_nullify
@@ -0,0 +1,7 @@
+SUBROUTINE very_long_statement (scalar, res)
+  INTEGER, INTENT(IN) :: scalar
+  INTEGER, INTENT(OUT) :: res
+  
+  res = 5*scalar + scalar - scalar + scalar - scalar + (scalar - scalar + scalar - scalar) - 1 + 2 - 3 + 4 - 5 + 6 - 7 + 8 - (9 + &
+  &  10 - 9) + 10 - 8 + 7 - 6 + 5 - 4 + 3 - 2 + 1
+END SUBROUTINE very_long_statement
@@ -0,0 +1,44 @@
+MODULE alloc_mod
+  INTEGER, PARAMETER :: jprb = SELECTED_REAL_KIND(13, 300)
+  
+  TYPE explicit
+    REAL(KIND=jprb) :: scalar, vector(3), matrix(3, 3)
+    REAL(KIND=jprb) :: red_herring
+  END TYPE explicit
+  
+  TYPE deferred
+    REAL(KIND=jprb), ALLOCATABLE :: scalar, vector(:), matrix(:, :)
+    REAL(KIND=jprb), ALLOCATABLE :: red_herring
+  END TYPE deferred
+  
+  CONTAINS
+  
+  SUBROUTINE alloc_deferred (item)
+    TYPE(deferred), INTENT(INOUT) :: item
+    INTEGER :: stat
+    ALLOCATE (item%vector(3), STAT=stat)
+    ALLOCATE (item%matrix(3, 3))
+  END SUBROUTINE alloc_deferred
+  
+  SUBROUTINE free_deferred (item)
+    TYPE(deferred), INTENT(INOUT) :: item
+    INTEGER :: stat
+    DEALLOCATE (item%vector, STAT=stat)
+    DEALLOCATE (item%matrix)
+  END SUBROUTINE free_deferred
+  
+  SUBROUTINE check_alloc_source (item, item2)
+    TYPE(explicit), INTENT(INOUT) :: item
+    TYPE(deferred), INTENT(INOUT) :: item2
+    REAL(KIND=jprb), ALLOCATABLE :: vector(:), vector2(:)
+    
+    ALLOCATE (vector, SOURCE=item%vector)
+    vector(:) = vector(:) + item%scalar
+    item%vector(:) = vector(:)
+    
+    ALLOCATE (vector2, SOURCE=item2%vector)
+    ! Try mold here when supported by fparser
+    vector2(:) = item2%scalar
+    item2%vector(:) = vector2(:)
+  END SUBROUTINE check_alloc_source
+END MODULE alloc_mod
@@ -0,0 +1,5 @@
+MODULE iso_fortran_env
+  USE, INTRINSIC :: iso_c_binding, ONLY: int16 => c_int16_t
+  IMPLICIT NONE
+  INTEGER, PARAMETER :: int8 = int16
+END MODULE iso_fortran_env
@@ -0,0 +1,17 @@
+MODULE kernel_mod
+  IMPLICIT NONE
+  CONTAINS
+  SUBROUTINE kernel_routine (nlon, nlev, a, b)
+    INTEGER, INTENT(IN) :: nlon, nlev
+    INTEGER, INTENT(INOUT) :: a(nlon, nlev)
+    INTEGER, INTENT(INOUT) :: b(nlon, nlev)
+    INTEGER :: i, j
+    
+    DO j=1,nlon
+      DO i=1,nlev
+        a(i, j) = i*10 + j
+        b(i, j) = i*10 + j + 1
+      END DO
+    END DO
+  END SUBROUTINE kernel_routine
+END MODULE kernel_mod
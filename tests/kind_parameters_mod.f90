@@ -0,0 +1,4 @@
+MODULE kind_parameters_mod
+  IMPLICIT NONE
+  INTEGER, PARAMETER :: jprb = SELECTED_REAL_KIND(13, 300)
+END MODULE kind_parameters_mod
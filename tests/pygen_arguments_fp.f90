@@ -0,0 +1,30 @@
+SUBROUTINE pygen_arguments (n, array, array_io, a, b, c, a_io, b_io, c_io)
+  USE iso_fortran_env, ONLY: real32, real64
+  IMPLICIT NONE
+  
+  INTEGER, INTENT(IN) :: n
+  REAL(KIND=real64), INTENT(INOUT) :: array(n)
+  REAL(KIND=real64), INTENT(OUT) :: array_io(n)
+  
+  INTEGER, INTENT(OUT) :: a
+  REAL(KIND=real32), INTENT(OUT) :: b
+  REAL(KIND=real64), INTENT(OUT) :: c
+  INTEGER, INTENT(INOUT) :: a_io
+  REAL(KIND=real32), INTENT(INOUT) :: b_io
+  REAL(KIND=real64), INTENT(INOUT) :: c_io
+  
+  INTEGER :: i
+  
+  DO i=1,n
+    array(i) = 3.
+    array_io(i) = array_io(i) + 3.
+  END DO
+  
+  a = 2**3
+  b = 3.2_real32
+  c = 4.1_real64
+  
+  a_io = a_io + 2
+  b_io = b_io + REAL(3.2, kind=real32)
+  c_io = c_io + 4.1
+END SUBROUTINE pygen_arguments
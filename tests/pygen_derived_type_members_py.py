@@ -0,0 +1,10 @@
+import numpy as np
+def pygen_derived_type_members_py(n: np.int32, myobject):
+  
+  
+  
+  for i in range(1, n + 1):
+    tmp = myobject.vector[i - 1] + myobject.scalar
+    myobject.vector[i - 1] = tmp
+  
+  return 
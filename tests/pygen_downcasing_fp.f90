@@ -0,0 +1,19 @@
+SUBROUTINE pygen_downcasing (N, scalar, vector)
+  USE iso_fortran_env, ONLY: real64
+  IMPLICIT NONE
+  INTEGER, INTENT(IN) :: N
+  REAL(KIND=real64), INTENT(INOUT) :: scalar
+  REAL(KIND=real64), INTENT(INOUT) :: vector(n)
+  
+  INTEGER :: i
+  REAL(KIND=real64) :: a, tmp
+  
+  REAL(KIND=real64) :: sTmT_F
+  sTmT_F(a) = a + 2.
+  
+  DO i=1,n
+    tmp = stmt_F(scalar)
+    veCtor(i) = vecTor(i) + tmp
+  END DO
+  
+END SUBROUTINE pygen_downcasing
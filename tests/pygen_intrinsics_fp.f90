@@ -0,0 +1,15 @@
+SUBROUTINE pygen_intrinsics (v1, v2, v3, v4, vmin, vmax, vabs, vmin_nested, vmax_nested, vexp, vsqrt, vsign)
+  ! Test supported intrinsic functions
+  USE iso_fortran_env, ONLY: real64
+  REAL(KIND=real64), INTENT(IN) :: v1, v2, v3, v4
+  REAL(KIND=real64), INTENT(OUT) :: vmin, vmax, vabs, vmin_nested, vmax_nested, vexp, vsqrt, vsign
+  
+  vmin = MIN(v1, v2)
+  vmax = MAX(v1, v2)
+  vabs = ABS(v1 - v2)
+  vmin_nested = MIN(MIN(MAX(v1, -1._real64), v2), MIN(v3, v4))
+  vmax_nested = MAX(MAX(v1, v2), MAX(v3, v4))
+  vexp = EXP(v2)
+  vsqrt = SQRT(v2)
+  vsign = SIGN(v4, v1 - v2)
+END SUBROUTINE pygen_intrinsics
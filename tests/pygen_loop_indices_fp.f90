@@ -0,0 +1,22 @@
+SUBROUTINE pygen_loop_indices (n, idx, mask1, mask2, mask3)
+  ! Test to ensure loop indexing translates correctly
+  USE iso_fortran_env, ONLY: real64
+  INTEGER, INTENT(IN) :: n, idx
+  INTEGER, INTENT(INOUT) :: mask1(n), mask2(n)
+  REAL(KIND=real64), INTENT(INOUT) :: mask3(n)
+  
+  INTEGER :: i
+  
+  DO i=1,n
+    IF (i < idx) THEN
+      mask1(i) = 1
+    END IF
+    
+    IF (i == idx) THEN
+      mask1(i) = 2
+    END IF
+    
+    mask2(i) = i
+  END DO
+  mask3(n) = 3.0
+END SUBROUTINE pygen_loop_indices
@@ -0,0 +1,20 @@
+SUBROUTINE pygen_simple_loops (n, m, scalar, vector, tensor)
+  USE iso_fortran_env, ONLY: real64
+  IMPLICIT NONE
+  INTEGER, INTENT(IN) :: n, m
+  REAL(KIND=real64), INTENT(INOUT) :: scalar
+  REAL(KIND=real64), INTENT(INOUT) :: vector(n), tensor(n, m)
+  
+  INTEGER :: i, j
+  
+  ! For testing, the operation is:
+  DO i=1,n
+    vector(i) = vector(i) + tensor(i, 1) + 1.0
+  END DO
+  
+  DO j=1,m
+    DO i=1,n
+      tensor(i, j) = 10.*j + i
+    END DO
+  END DO
+END SUBROUTINE pygen_simple_loops
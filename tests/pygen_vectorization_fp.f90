@@ -0,0 +1,16 @@
+SUBROUTINE pygen_vectorization (n, m, scalar, v1, v2)
+  USE iso_fortran_env, ONLY: real64
+  IMPLICIT NONE
+  INTEGER, INTENT(IN) :: n, m
+  REAL(KIND=real64), INTENT(INOUT) :: scalar
+  REAL(KIND=real64), INTENT(INOUT) :: v1(n), v2(n)
+  
+  REAL(KIND=real64) :: matrix(n, m)
+  
+  INTEGER :: i
+  
+  v1(:) = scalar + 1.0
+  matrix(:, 1:m) = scalar + 2.
+  v2(:n) = matrix(:, 2)
+  v2(1) = 1.
+END SUBROUTINE pygen_vectorization
@@ -0,0 +1,6 @@
+MODULE region_to_call_mod
+  IMPLICIT NONE
+  INTEGER, PARAMETER :: param = 1
+  INTEGER :: arr1(10)
+  INTEGER :: arr2(10)
+END MODULE region_to_call_mod
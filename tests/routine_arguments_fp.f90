@@ -0,0 +1,22 @@
+SUBROUTINE routine_arguments (x, y, vector, matrix)
+  ! Test internal argument handling
+  INTEGER, PARAMETER :: jprb = SELECTED_REAL_KIND(13, 300)
+  INTEGER, INTENT(IN) :: x, y
+  REAL(KIND=jprb), INTENT(INOUT), DIMENSION(x) :: vector
+  REAL(KIND=jprb), INTENT(INOUT) :: matrix(x, y)
+  
+  INTEGER :: i, j
+  REAL(KIND=jprb), DIMENSION(x) :: local_vector
+  REAL(KIND=jprb) :: local_matrix(x, y)
+  
+  DO i=1,x
+    local_vector(i) = i*10.
+    DO j=1,y
+      local_matrix(i, j) = local_vector(i) + j*2.
+    END DO
+  END DO
+  
+  vector(:) = local_vector(:)
+  matrix(:, :) = local_matrix(:, :)
+  
+END SUBROUTINE routine_arguments
@@ -0,0 +1,15 @@
+SUBROUTINE routine_arguments_multiline (x, y, scalar, vector, matrix)
+  ! Test multiline dummy arguments with comments
+  ! Of course, not one...
+  ! but two comment lines
+  INTEGER, PARAMETER :: jprb = SELECTED_REAL_KIND(13, 300)
+  INTEGER, INTENT(IN) :: x, y
+  REAL(KIND=jprb), INTENT(IN) :: scalar
+  REAL(KIND=jprb), INTENT(INOUT) :: vector(x), matrix(x, y)
+  INTEGER :: i
+  
+  DO i=1,x
+    vector(i) = vector(i) + scalar
+    matrix(i, :) = i*vector(i)
+  END DO
+END SUBROUTINE routine_arguments_multiline
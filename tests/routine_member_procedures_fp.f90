@@ -0,0 +1,36 @@
+SUBROUTINE routine_member_procedures (in1, in2, out1, out2)
+  ! Test member subroutine and function
+  IMPLICIT NONE
+  INTEGER, INTENT(IN) :: in1, in2
+  INTEGER, INTENT(OUT) :: out1, out2
+  INTEGER :: localvar
+  
+  localvar = in2
+  
+  CALL member_procedure(in1, out1)
+  out2 = member_function(out1)
+  CONTAINS
+  SUBROUTINE member_procedure (in1, out1)
+    ! This member procedure shadows some variables and uses
+    ! a variable from the parent scope
+    IMPLICIT NONE
+    INTEGER, INTENT(IN) :: in1
+    INTEGER, INTENT(OUT) :: out1
+    
+    out1 = 5*in1 + localvar
+  END SUBROUTINE member_procedure
+  
+  ! Below is disabled because f90wrap (wrongly) exhibits that
+  ! symbol to the public, which causes double defined symbols
+  ! upon compilation.
+  
+  FUNCTION member_function (in2)
+    ! This function is just included to test that functions
+    ! are also possible
+    IMPLICIT NONE
+    INTEGER, INTENT(IN) :: in2
+    INTEGER :: member_function
+    
+    member_function = 3*in2 + 2
+  END FUNCTION member_function
+END SUBROUTINE routine_member_procedures
@@ -0,0 +1,13 @@
+SUBROUTINE routine_simple (x, y, scalar, vector, matrix)
+  ! This is the docstring
+  INTEGER, PARAMETER :: jprb = SELECTED_REAL_KIND(13, 300)
+  INTEGER, INTENT(IN) :: x, y
+  REAL(KIND=jprb), INTENT(IN) :: scalar
+  REAL(KIND=jprb), INTENT(INOUT) :: vector(x), matrix(x, y)
+  INTEGER :: i
+  
+  DO i=1,x
+    vector(i) = vector(i) + scalar
+    matrix(i, :) = i*vector(i)
+  END DO
+END SUBROUTINE routine_simple
@@ -0,0 +1,18 @@
+SUBROUTINE routine_variables_local (x, y, maximum)
+  ! Test local variables and types
+  INTEGER, PARAMETER :: jprb = SELECTED_REAL_KIND(13, 300)
+  INTEGER, INTENT(IN) :: x, y
+  REAL(KIND=jprb), INTENT(OUT) :: maximum
+  
+  INTEGER :: i, j
+  REAL(KIND=jprb), DIMENSION(x) :: vector
+  REAL(KIND=jprb) :: matrix(x, y)
+  
+  DO i=1,x
+    vector(i) = i*10.
+    DO j=1,y
+      matrix(i, j) = vector(i) + j*2.
+    END DO
+  END DO
+  maximum = matrix(x, y)
+END SUBROUTINE routine_variables_local
@@ -0,0 +1,66 @@
+MODULE sourcefile_cpp_stmt_func_mod_fp
+  
+  IMPLICIT NONE
+  
+  ! originally declared in parkind1.F90
+  INTEGER, PARAMETER :: JPIM = SELECTED_INT_KIND(9)
+  INTEGER, PARAMETER :: JPRB = SELECTED_REAL_KIND(13, 300)
+  
+  CONTAINS
+  
+  SUBROUTINE sourcefile_cpp_stmt_func (KIDIA, KFDIA, KLON, KLEV, ZFOEEW)
+    INTEGER(KIND=JPIM), INTENT(IN) :: KLON, KLEV
+    INTEGER(KIND=JPIM), INTENT(IN) :: KIDIA
+    INTEGER(KIND=JPIM), INTENT(IN) :: KFDIA
+    REAL(KIND=JPRB), INTENT(OUT) :: ZFOEEW(KLON, KLEV)
+    
+    INTEGER(KIND=JPIM) :: JK, JL
+    
+    REAL(KIND=JPRB) :: ZTP1(KLON, KLEV)
+    REAL(KIND=JPRB) :: PAP(KLON, KLEV)
+    REAL(KIND=JPRB) :: ZALFA
+    
+    ! originally declared in yomcst.F90
+    REAL(KIND=JPRB) :: RTT = 1._JPRB
+    
+    ! originally declared in yoethf.F90
+    REAL(KIND=JPRB) :: R2ES = 2._JPRB
+    REAL(KIND=JPRB) :: R3LES = 3._JPRB
+    REAL(KIND=JPRB) :: R3IES = 3._JPRB
+    REAL(KIND=JPRB) :: R4LES = 4._JPRB
+    REAL(KIND=JPRB) :: R4IES = 4._JPRB
+    !*
+    ! ---------------------------------------------------
+    
+    !   Sample of statement functions externalized into a
+    !   header file similar to how they are included into
+    !   Fortran source code in the IFS.
+    !
+    !   This is an excerpt from fcttre.func.h
+    !
+    ! ---------------------------------------------------
+    REAL(KIND=JPRB) :: FOEDELTA
+    REAL(KIND=JPRB) :: PTARE
+    FOEDELTA(PTARE) = MAX(0.0_JPRB, SIGN(1.0_JPRB, PTARE - RTT))
+    
+    REAL(KIND=JPRB) :: FOEEWMO, FOEELIQ, FOEEICE
+    FOEEWMO(PTARE) = R2ES*EXP(R3LES*(PTARE - RTT) / (PTARE - R4LES))
+    FOEELIQ(PTARE) = R2ES*EXP(R3LES*(PTARE - RTT) / (PTARE - R4LES))
+    FOEEICE(PTARE) = R2ES*EXP(R3IES*(PTARE - RTT) / (PTARE - R4IES))
+    
+    ! ---------------------------------------------------
+    ! initialize with some stupid values
+    PAP(:, :) = 8._JPRB
+    ZTP1(:, :) = 1._JPRB
+    
+    DO JK=1,KLEV
+      DO JL=KIDIA,KFDIA
+        ZALFA = FOEDELTA(ZTP1(JL, JK))
+        
+        ! this should essentially become: min((zalfa * 2 + (1-zalfa) * 2))/8,0.5) === 0.25
+        ZFOEEW(JL, JK) = MIN((ZALFA*FOEELIQ(ZTP1(JL, JK)) + (1.0_JPRB - ZALFA)*FOEEICE(ZTP1(JL, JK))) / PAP(JL, JK), 0.5_JPRB)
+      END DO
+    END DO
+  END SUBROUTINE sourcefile_cpp_stmt_func
+  
+END MODULE sourcefile_cpp_stmt_func_mod_fp
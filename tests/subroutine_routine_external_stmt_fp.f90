@@ -0,0 +1,55 @@
+SUBROUTINE routine_external_stmt (invar, sub1, sub2, sub3, outvar, func1, func2, func3)
+  IMPLICIT NONE
+  INTEGER, INTENT(IN) :: invar
+  EXTERNAL :: sub1
+  EXTERNAL :: sub2, sub3
+  INTEGER, INTENT(OUT) :: outvar
+  INTEGER, EXTERNAL :: func1, func2
+  INTEGER, EXTERNAL :: func3
+  INTEGER :: tmp
+  
+  CALL sub1(tmp)
+  outvar = invar + tmp    ! invar + 1
+  CALL sub2(tmp)
+  outvar = outvar + tmp + func1()    ! (invar + 1) + 1 + 6
+  CALL sub3(tmp)
+  outvar = outvar + tmp + func2()    ! (invar + 8) + 4 + 2
+  tmp = func3()
+  outvar = outvar + tmp    ! (invar + 14) + 2
+END SUBROUTINE routine_external_stmt
+
+SUBROUTINE routine_call_external_stmt (invar, outvar)
+  IMPLICIT NONE
+  INTEGER, INTENT(IN) :: invar
+  INTEGER, INTENT(OUT) :: outvar
+  
+  INTERFACE
+    SUBROUTINE other_external_subroutine (outvar)
+      INTEGER, INTENT(OUT) :: outvar
+    END SUBROUTINE other_external_subroutine
+  END INTERFACE
+  
+  INTERFACE
+    FUNCTION other_external_function ()
+      INTEGER :: other_external_function
+    END FUNCTION other_external_function
+  END INTERFACE
+  
+  CALL routine_external_stmt(invar, external_subroutine, external_subroutine, other_external_subroutine, outvar,  &
+  & other_external_function, external_function, external_function)
+  
+  CONTAINS
+  
+  SUBROUTINE external_subroutine (outvar)
+    IMPLICIT NONE
+    INTEGER, INTENT(OUT) :: outvar
+    outvar = 1
+  END SUBROUTINE external_subroutine
+  
+  FUNCTION external_function ()
+    IMPLICIT NONE
+    INTEGER :: external_function
+    external_function = 2
+  END FUNCTION external_function
+  
+END SUBROUTINE routine_call_external_stmt
@@ -0,0 +1,17 @@
+SUBROUTINE subroutine_stmt_func_fp (a, b)
+  IMPLICIT NONE
+  INTEGER, INTENT(IN) :: a
+  INTEGER, INTENT(OUT) :: b
+  INTEGER :: array(a)
+  INTEGER :: i, j, plus, minus
+  plus(i, j) = i + j
+  minus(i, j) = i - j
+  INTEGER :: mult
+  INTEGER :: tmp
+  mult(i, j) = i*j
+  
+  array(a) = a
+  tmp = plus(a, 5)
+  tmp = minus(tmp, 1)
+  b = mult(2, tmp)
+END SUBROUTINE subroutine_stmt_func_fp
@@ -16,6 +16,7 @@ from loki import (
 from loki.analyse import (
     dataflow_analysis_attached, read_after_write_vars, loop_carried_dependencies
 )
+from loki.analyse.analyse_dataflow import SymbolIndex, SymbolBitset
 
 @pytest.mark.parametrize('frontend', available_frontends())
 def test_analyse_live_symbols(frontend):
@@ -593,3 +594,52 @@ end subroutine associate_test
         assert assigns[0].defines_symbols == {'e'}
         assert assigns[1].defines_symbols == {'f'}
         assert assigns[2].defines_symbols == {'d0'}
+
+
+@pytest.mark.parametrize('frontend', available_frontends())
+def test_analyse_symbol_bitsets(frontend):
+    fcode = """
+subroutine analyse_symbol_bitsets(n, a, b)
+  integer, intent(in) :: n
+  real, intent(in) :: a(n)
+  real, intent(out) :: b(n)
+  integer :: i
+  real :: tmp = 0.
+
+  do i=1,n
+    tmp = a(i) + tmp
+    b(i) = tmp
+  end do
+end subroutine analyse_symbol_bitsets
+    """.strip()
+    routine = Subroutine.from_source(fcode, frontend=frontend)
+    loop = FindNodes(Loop).visit(routine.body)[0]
+    assignments = FindNodes(Assignment).visit(routine.body)
+
+    # Symbols are interned in the index and decoded from bitsets
+    index = SymbolIndex()
+    bits = index.encode(routine.variables)
+    assert index.encode(routine.variables[::-1]) == bits
+    assert index.decode(bits) == set(routine.variables)
+    assert index.decode(bits & ~index.encode(('n',))) == set(routine.variables[1:])
+    assert not index.decode(0)
+
+    with dataflow_analysis_attached(routine):
+        # Bitsets are converted to sets of symbols on first access
+        assert isinstance(loop.__dict__['_uses_symbols'], SymbolBitset)
+        uses_symbols = loop.uses_symbols
+        assert isinstance(uses_symbols, set)
+        assert loop.uses_symbols is uses_symbols
+        assert uses_symbols == {'n', 'a', 'tmp'}
+        assert loop.defines_symbols == {'tmp', 'b'}
+        assert loop_carried_dependencies(loop) == {'tmp'}
+
+        # All nodes share the same index
+        assert assignments[0].__dict__['_live_symbols'].index is loop.__dict__['_live_symbols'].index
+        assert assignments[0].live_symbols == {'n', 'a', 'i', 'tmp'}
+        assert assignments[1].live_symbols == {'n', 'a', 'i', 'tmp'}
+
+        # The spec does not see its own definitions as live
+        assert routine.spec.live_symbols == {'n', 'a'}
+        assert routine.spec.defines_symbols == {'tmp'}
+        assert routine.body.live_symbols == {'n', 'a', 'tmp'}
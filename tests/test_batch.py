@@ -16,7 +16,7 @@ import pytest
 from loki import (
     HAVE_FP, HAVE_OFP, REGEX, RegexParserClass, as_tuple, gettempdir,
     FileItem, ModuleItem, ProcedureItem, TypeDefItem, ProcedureBindingItem, ExternalItem,
-    InterfaceItem, SGraph, SchedulerConfig, ItemFactory,
+    InterfaceItem, SGraph, SFilter, SchedulerConfig, ItemFactory,
     Sourcefile, Subroutine, Section, TypeDef, RawSource, Import, CallStatement, Scalar, ProcedureSymbol
 )
 
@@ -935,6 +935,42 @@ def test_item_graph(here, comp1_expected_dependencies):
     # plt.savefig('test_item_graph.png')
 
 
+def test_item_factory_module_member_index(here):
+    """
+    Test the look-up of module members via the :attr:`ItemFactory.module_member_index`
+    """
+    proj = here/'sources/projBatch'
+    item_factory = ItemFactory()
+    for path in [f for ext in ['.f90', '.F90'] for f in proj.glob(f'**/*{ext}')]:
+        relative_path = str(path.relative_to(proj))
+        file_item = get_item(FileItem, path, relative_path, RegexParserClass.ProgramUnitClass)
+        item_factory.item_cache[relative_path] = file_item
+        item_factory.item_cache.update(
+            (item.name, item) for item in file_item.create_definition_items(item_factory=item_factory)
+        )
+    assert not item_factory.module_member_index
+
+    # The first look-up without module candidates indexes all modules
+    items = item_factory.get_or_create_module_definitions_from_candidates('t', None)
+    assert items == (item_factory.item_cache['t_mod#t'],)
+    assert item_factory.module_member_index['t'] == ('t_mod',)
+    assert item_factory.module_member_index['mod_proc'] == ('other_mod',)
+    assert set(item_factory.module_member_index['T_PROC']) == {'t_mod'}
+    assert 'foobar' not in item_factory.module_member_index
+
+    items = item_factory.get_or_create_module_definitions_from_candidates('mod_proc', None, only=ProcedureItem)
+    assert items == (item_factory.item_cache['other_mod#mod_proc'],)
+    assert not item_factory.get_or_create_module_definitions_from_candidates('mod_proc', None, only=TypeDefItem)
+    assert not item_factory.get_or_create_module_definitions_from_candidates('mod_proc', None, module_names=['t_mod'])
+
+    # Removed modules are indexed again on the next look-up
+    item_factory.remove_module_from_index('other_mod')
+    assert 'mod_proc' not in item_factory.module_member_index
+    items = item_factory.get_or_create_module_definitions_from_candidates('mod_proc', None)
+    assert items == (item_factory.item_cache['other_mod#mod_proc'],)
+    assert item_factory.module_member_index['mod_proc'] == ('other_mod',)
+
+
 @pytest.mark.parametrize('seed,dependencies_fixture', [
     ('#comp1', 'comp1_expected_dependencies'),
     ('other_mod#mod_proc', 'mod_proc_expected_dependencies'),
@@ -1188,6 +1224,58 @@ def test_sgraph_filegraph(here, default_config, file_dependencies):
         for dependency in dependencies
     }
 
+
+def test_sgraph_cached_depths_successors(monkeypatch):
+    """
+    Test that :any:`SGraph` memoizes depths and successors, and that
+    these are invalidated upon graph modification
+    """
+    num_items = 5000
+    items = [ProcedureItem(f'#routine{i}', source=None) for i in range(num_items)]
+    interfaces = [InterfaceItem(f'intf_mod#intf{i}', source=None) for i in range(num_items // 2)]
+
+    # Create a synthetic binary tree, with every other edge routed via an interface
+    sgraph = SGraph()
+    sgraph.add_nodes(items + interfaces)
+    for i in range(1, num_items):
+        parent, child = items[(i-1) // 2], items[i]
+        if i % 2:
+            sgraph.add_edges([(parent, interfaces[i // 2]), (interfaces[i // 2], child)])
+        else:
+            sgraph.add_edge((parent, child))
+
+    topological_generations = nx.topological_generations
+    num_calls = 0
+
+    def counting_topological_generations(graph):
+        nonlocal num_calls
+        num_calls += 1
+        return topological_generations(graph)
+
+    # Emulate the scheduler's processing loop
+    traversal = list(SFilter(sgraph, item_filter=ProcedureItem))
+    assert len(traversal) == num_items
+    monkeypatch.setattr(nx, 'topological_generations', counting_topological_generations)
+    for item in traversal:
+        successors = sgraph.successors(item, item_filter=ProcedureItem)
+        assert sgraph.successors(item, item_filter=ProcedureItem) is successors
+        assert len(successors) <= 3
+        assert sgraph.depths[item] >= 0
+    assert num_calls == 1
+
+    assert sgraph.depths[items[0]] == 0
+    assert sgraph.depths[items[1]] == 2
+    assert sgraph.depths[items[2]] == 1
+    assert sgraph.successors(items[0]) == (interfaces[0], items[1], items[2])
+
+    # Modifying the graph invalidates the caches
+    new_item = ProcedureItem('#new_routine', source=None)
+    sgraph.add_edge((items[0], new_item))
+    assert sgraph.successors(items[0]) == (interfaces[0], items[1], items[2], new_item)
+    assert sgraph.depths[new_item] == 1
+    assert num_calls == 2
+
+
 def discover_proj_typebound_item_factory(here, scheduler_config):
     proj = here/'sources/projTypeBound'
     suffixes = ['.f90', '.F90']
@@ -5,10 +5,14 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
+import json
+import os
 from pathlib import Path
+import sys
+import time
 import pytest
 
-from loki.build import Obj, Lib, Builder
+from loki.build import Obj, Lib, Builder, Compiler
 
 
 @pytest.fixture(scope='module', name='path')
@@ -102,6 +106,164 @@ def test_build_obj_dependencies(builder):
     # assert test.library_test(1, 2, 3) == 12
 
 
+@pytest.mark.parametrize('workers', [1, 2])
+def test_build_lib_schedule(tmp_path, workers):
+    """
+    Test that objects are compiled as soon as their dependencies are
+    compiled, with long dependency chains being started first.
+    """
+    script = tmp_path/'compile.py'
+    script.write_text(
+        'import sys, time\nstart = time.time()\ntime.sleep(0.1)\n'
+        'with open(sys.argv[1], "w") as f:\n    f.write(f"{start} {time.time()}")\n'
+    )
+
+    class TimingCompiler(Compiler):
+        """
+        Fake compiler that records start and end time of each compilation
+        """
+
+        def compile_args(self, source, target=None, include_dirs=None, mod_dir=None, mode='F90'):
+            return [sys.executable, str(script), str(target)]
+
+        def link(self, objs, target, shared=True, cwd=None):
+            pass
+
+    # A chain of three modules and three independent modules
+    prefix = f'sched{workers}'
+    fcode = {
+        f'{prefix}_base': f'module {prefix}_base\nend module {prefix}_base\n',
+        f'{prefix}_mid': f'module {prefix}_mid\nuse {prefix}_base\nend module {prefix}_mid\n',
+        f'{prefix}_top': f'module {prefix}_top\nuse {prefix}_mid\nend module {prefix}_top\n',
+    }
+    for i in range(3):
+        fcode[f'{prefix}_indep{i}'] = f'module {prefix}_indep{i}\nend module {prefix}_indep{i}\n'
+    for name, code in fcode.items():
+        (tmp_path/f'{name}.f90').write_text(code)
+
+    builder = Builder(
+        source_dirs=tmp_path, build_dir=tmp_path/'build', compiler=TimingCompiler(), workers=workers
+    )
+    objs = [Obj(source_path=tmp_path/f'{name}.f90') for name in reversed(fcode)]
+    lib = Lib(name=prefix, objs=objs, shared=False)
+    lib.build(builder=builder)
+
+    assert set(lib.build_times) == set(fcode)
+    times = {
+        name: tuple(float(t) for t in (builder.build_dir/f'{name}.o').read_text().split())
+        for name in fcode
+    }
+
+    # Dependencies are complete before dependents start
+    assert times[f'{prefix}_base'][1] <= times[f'{prefix}_mid'][0]
+    assert times[f'{prefix}_mid'][1] <= times[f'{prefix}_top'][0]
+
+    if workers == 1:
+        # The longest dependency chain is compiled first
+        order = sorted(times, key=lambda name: times[name][0])
+        assert order[:2] == [f'{prefix}_base', f'{prefix}_mid']
+
+
+def test_build_dependency_graph_cache(tmp_path):
+    """
+    Test the dependency graph construction and the persistent cache
+    of dependency scans.
+    """
+    names = [f'depcache_{i}' for i in range(4)]
+    for i, name in enumerate(names):
+        uses = ''.join(f'use {dep}\n' for dep in names[:i])
+        (tmp_path/f'{name}.f90').write_text(f'module {name}\n{uses}end module {name}\n')
+
+    # Without a cache directory, nothing is stored
+    builder = Builder(source_dirs=tmp_path, build_dir=tmp_path/'build')
+    objs = [Obj(source_path=tmp_path/f'{name}.f90') for name in names]
+    graph = builder.get_dependency_graph(objs[-1:])
+    assert set(graph.nodes) == set(objs)
+    assert len(graph.edges) == 6
+    assert set(graph.successors(objs[-1])) == set(objs[:-1])
+    assert not list(tmp_path.glob('**/.loki_*.json'))
+
+    # Dependency scans are stored by source hash
+    builder = Builder(source_dirs=tmp_path, build_dir=tmp_path/'build', cache_dir=tmp_path/'cache')
+    graph = builder.get_dependency_graph(objs[-1:])
+    assert len(graph.edges) == 6
+    with (tmp_path/'cache/.loki_dependencies.json').open() as f:
+        cache = json.load(f)
+    assert len(cache) == len(objs)
+    for i, obj in enumerate(objs):
+        assert cache[obj.source_hash]['uses'] == names[:i]
+
+    # Only the scans of sources used by a builder are stored
+    builder = Builder(source_dirs=tmp_path, build_dir=tmp_path/'build', cache_dir=tmp_path/'cache')
+    builder.get_dependency_graph(objs[:1])
+    with (tmp_path/'cache/.loki_dependencies.json').open() as f:
+        cache = json.load(f)
+    assert list(cache) == [objs[0].source_hash]
+
+
+def test_build_content_hash(tmp_path):
+    """
+    Test that objects with unchanged source content and compile arguments
+    are not recompiled in content-hash mode, even if the source file is newer.
+    """
+    log = tmp_path/'compile.log'
+    script = tmp_path/'compile.py'
+    script.write_text(
+        'import sys\nopen(sys.argv[1], "w").close()\n'
+        f'with open({str(log)!r}, "a") as f:\n    f.write(sys.argv[1] + "\\n")\n'
+    )
+
+    class LoggingCompiler(Compiler):
+        """
+        Fake compiler that logs every compilation
+        """
+
+        def __init__(self, flags=None):
+            super().__init__()
+            self.flags = flags or []
+
+        def compile_args(self, source, target=None, include_dirs=None, mod_dir=None, mode='F90'):
+            return [sys.executable, str(script), str(target), *self.flags]
+
+    source = tmp_path/'content_hash_mod.f90'
+    source.write_text('module content_hash_mod\nend module content_hash_mod\n')
+
+    offset = 10
+
+    def _regenerate(content=None):
+        # Rewrite the content with a newer modification time
+        nonlocal offset
+        source.write_text(source.read_text() if content is None else content)
+        future = time.time() + offset
+        os.utime(source, (future, future))
+        offset += 10
+
+    def _build(content_hash, flags=None):
+        builder = Builder(
+            source_dirs=tmp_path, build_dir=tmp_path/'build', compiler=LoggingCompiler(flags),
+            content_hash=content_hash
+        )
+        Obj(source_path=source).build(builder=builder)
+        return len(log.read_text().splitlines())
+
+    assert _build(content_hash=True) == 1
+    assert _build(content_hash=True) == 1
+
+    _regenerate()
+    assert _build(content_hash=True) == 1
+
+    # Changed source content within the same process
+    _regenerate('module content_hash_mod\nimplicit none\nend module content_hash_mod\n')
+    assert _build(content_hash=True) == 2
+
+    # Changed compile arguments
+    _regenerate()
+    assert _build(content_hash=True, flags=['-O3']) == 3
+
+    _regenerate()
+    assert _build(content_hash=False) == 4
+
+
 def test_build_binary(builder):
     """
     Test basic binary compilation from objects and libs.
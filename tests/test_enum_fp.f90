@@ -0,0 +1,16 @@
+SUBROUTINE test_enum (out)
+  IMPLICIT NONE
+  
+  ! Comment 1
+  ENUM, BIND(C)
+    ENUMERATOR :: RED = 4
+    ENUMERATOR :: BLUE = 9
+    ENUMERATOR :: YELLOW
+  END ENUM
+  ! Comment 2
+  ! Comment 3
+  
+  INTEGER, INTENT(OUT) :: out
+  
+  out = RED + BLUE + YELLOW
+END SUBROUTINE test_enum
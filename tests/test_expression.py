@@ -23,7 +23,8 @@ from loki import (
     FindVariables, FindNodes, SubstituteExpressions, Scope, BasicType, SymbolAttributes,
     parse_fparser_expression, Sum, DerivedType, ProcedureType, ProcedureSymbol,
     DeferredTypeSymbol, Module, HAVE_FP, FindExpressions, LiteralList, FindInlineCalls,
-    AttachScopesMapper, FindTypedSymbols, Reference, Dereference
+    AttachScopesMapper, FindTypedSymbols, Reference, Dereference, LokiStringifyMapper,
+    config_override
 )
 from loki.expression import symbols
 from loki.tools import gettempdir, filehash
@@ -1551,3 +1552,36 @@ end subroutine some_routine
     c_str = cgen(routine).replace(' ', '')
     assert '(&renamed_var_reference)=1' in c_str
     assert '(*renamed_var_dereference)=2' in c_str
+
+
+def test_expression_canonical_key_cached(monkeypatch):
+    """
+    Test that hashing and comparing expression nodes stringifies each node
+    only once, while retaining case-insensitive string comparison semantics
+    """
+    scope = Scope()
+    var = Variable(name='Var', scope=scope)
+    expr = Sum((var, Variable(name='a', dimensions=(IntLiteral(1),), scope=scope)))
+
+    calls = []
+    map_sum = LokiStringifyMapper.map_sum
+    def counting_map_sum(self, *args, **kwargs):
+        calls.append(args[0])
+        return map_sum(self, *args, **kwargs)
+    monkeypatch.setattr(LokiStringifyMapper, 'map_sum', counting_map_sum)
+
+    assert expr == 'var + A(1)'
+    assert hash(expr) == hash('var+a(1)')
+    assert {expr: 1}[Sum((var.clone(), Variable(name='A', dimensions=(IntLiteral(1),), scope=scope)))] == 1
+    assert len(calls) == 2
+    assert expr != 'var + a(2)'
+    assert len(calls) == 2
+
+    # The cached key honours the case-sensitivity setting
+    with config_override({'case-sensitive': True}):
+        assert var == 'Var'
+        assert var != 'var'
+        assert expr != 'var + a(1)'
+        assert expr == 'Var + a(1)'
+    assert var == 'var'
+    assert len(calls) == 2
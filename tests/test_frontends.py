@@ -27,8 +27,10 @@ from loki import (
     config, REGEX, Sourcefile, Import, RawSource, CallStatement,
     RegexParserClass, ProcedureType, DerivedType, Comment, Pragma,
     PreprocessorDirective, config_override, Section, CommentBlock,
-    Assignment, VariableDeclaration, ProcedureDeclaration, gettempdir
+    Assignment, VariableDeclaration, ProcedureDeclaration, gettempdir,
+    sanitize_input, get_fparser_parser, parse_fparser_expression, HAVE_FP
 )
+from loki.frontend import regex_completion_counter
 from loki.expression import symbols as sym
 
 
@@ -44,13 +46,6 @@ def fixture_reset_frontend_mode():
     config['frontend-strict-mode'] = original_frontend_mode
 
 
-@pytest.fixture(name='reset_regex_frontend_timeout')
-def fixture_reset_regex_frontend_timeout():
-    original_timeout = config['regex-frontend-timeout']
-    yield
-    config['regex-frontend-timeout'] = original_timeout
-
-
 @pytest.mark.parametrize('frontend', available_frontends())
 def test_check_alloc_opts(here, frontend):
     """
@@ -773,6 +768,72 @@ def test_regex_sourcefile_from_file_parser_classes(here):
     assert not sourcefile['bar']._incomplete
 
 
+def test_regex_incremental_make_complete():
+    """
+    Verify that adding parser classes in :meth:`ProgramUnit.make_complete` matches
+    only the previously unmatched source fragments and yields the same IR as a
+    parse with all parser classes
+    """
+    fcode = """
+module some_mod
+    use other_mod, only: other_type
+    implicit none
+
+    type my_type
+        integer :: val
+        type(other_type) :: other
+    contains
+        procedure :: proc => my_proc
+    end type my_type
+
+    integer :: glob
+contains
+    subroutine my_proc(this)
+        use proc_mod, only: proc_var
+        class(my_type), intent(inout) :: this
+        call other_proc(this%val)
+    end subroutine my_proc
+end module some_mod
+    """.strip()
+
+    def get_nodes(module):
+        routine = module['my_proc']
+        return [
+            (type(node).__name__, node.source and node.source.lines)
+            for node in module.spec.body + module.typedef_map['my_type'].body + routine.spec.body
+            if not isinstance(node, RawSource)
+        ]
+
+    reference = Module.from_source(fcode, frontend=REGEX, parser_classes=RegexParserClass.AllClasses)
+
+    module = Module.from_source(fcode, frontend=REGEX, parser_classes=RegexParserClass.ProgramUnitClass)
+    assert not module.imports and not module.typedefs
+
+    counter = regex_completion_counter.copy()
+    parser_classes = RegexParserClass.ProgramUnitClass
+    for new_classes in (
+        RegexParserClass.InterfaceClass | RegexParserClass.TypeDefClass,
+        RegexParserClass.ImportClass,
+        RegexParserClass.DeclarationClass,
+        RegexParserClass.CallClass,
+    ):
+        parser_classes |= new_classes
+        module.make_complete(frontend=REGEX, parser_classes=parser_classes)
+    module.make_complete(frontend=REGEX, parser_classes=parser_classes)
+    counter = regex_completion_counter - counter
+    assert counter == {'incremental': 4, 'skipped': 1}
+
+    assert get_nodes(module) == get_nodes(reference)
+    assert module.imported_symbols == ('other_type',)
+    assert module['my_proc'].imported_symbols == ('proc_var',)
+    assert [str(var) for var in module.variables] == ['glob']
+    assert [str(call.name) for call in FindNodes(CallStatement).visit(module['my_proc'].ir)] == ['other_proc']
+
+    # The procedure binding must not override the type of the member procedure
+    proc = module.typedef_map['my_type'].variable_map['proc']
+    assert proc.type.bind_names[0].type.dtype.procedure is module['my_proc']
+
+
 def test_regex_raw_source():
     """
     Verify that unparsed source appears in-between matched objects
@@ -916,32 +977,77 @@ END SUBROUTINE SOME_ROUTINE
     assert directives[1].text == '#endif'
 
 
-@pytest.mark.usefixtures('reset_regex_frontend_timeout')
-def test_regex_timeout():
+def test_regex_bare_end():
     """
-    This source fails to parse because of missing SUBROUTINE in END
-    statement, and the test verifies that a timeout is encountered
+    Verify that program units closed by a bare ``END`` statement are
+    matched and do not swallow subsequent program units
     """
     fcode = """
 subroutine some_routine(a)
   real, intent(in) :: a
 end
+
+subroutine other_routine(b)
+  real, intent(in) :: b
+  if (b > 0.) then
+    b = 0.
+  end if
+end subroutine other_routine
+
+function some_function(c)
+  real, intent(in) :: c
+  real :: some_function
+  some_function = c
+END
     """.strip()
 
-    # Test timeout
-    config['regex-frontend-timeout'] = 1
     start = perf_counter()
-    with pytest.raises(RuntimeError) as exc:
-        _ = Sourcefile.from_source(fcode, frontend=REGEX)
-    stop = perf_counter()
-    assert .9 < stop - start < 1.1
-    assert 'REGEX frontend timeout of 1 s exceeded' in str(exc.value)
-
-    # Test it works fine with proper Fortran:
-    fcode += ' subroutine'
     source = Sourcefile.from_source(fcode, frontend=REGEX)
-    assert len(source.subroutines) == 1
-    assert source.subroutines[0].name == 'some_routine'
+    assert perf_counter() - start < 1.
+    assert [routine.name for routine in source.subroutines] == ['some_routine', 'other_routine', 'some_function']
+    assert [routine.source.lines for routine in source.subroutines] == [(1, 3), (5, 10), (12, 16)]
+    assert source.subroutines[2].is_function
+
+
+def test_regex_nested_contains():
+    """
+    Verify that the member procedures of a program unit are matched as part
+    of it, also when subsequent program units have members, too
+    """
+    fcode = """
+subroutine routine_a
+contains
+  subroutine member_a
+  end subroutine member_a
+end subroutine routine_a
+subroutine routine_b
+  interface
+    subroutine ext(x)
+      real :: x
+    end subroutine ext
+  end interface
+contains
+  subroutine member_b
+  contains
+    function inner()
+      integer :: inner
+    end function inner
+  end subroutine member_b
+end subroutine routine_b
+subroutine routine_c
+end subroutine routine_c
+    """.strip()
+
+    source = Sourcefile.from_source(fcode, frontend=REGEX)
+    assert [routine.name for routine in source.subroutines] == ['routine_a', 'routine_b', 'routine_c']
+    routine_a, routine_b, routine_c = source.subroutines
+    assert routine_a.source.lines == (1, 5)
+    assert [member.name for member in routine_a.members] == ['member_a']
+    assert routine_b.source.lines == (6, 19)
+    assert [intf.symbols for intf in routine_b.interfaces] == [('ext',)]
+    assert [member.name for member in routine_b.members] == ['member_b']
+    assert [member.name for member in routine_b.members[0].members] == ['inner']
+    assert routine_c.source.lines == (20, 21)
 
 
 def test_regex_module_imports():
@@ -1939,3 +2045,78 @@ end module some_mod
 
 
 # TODO: Add tests for source sanitizer with other frontends
+
+
+def test_source_sanitize_prefilter():
+    """
+    Test that source sanitisation only filters the lines selected by the
+    rule's prefilter, and that line numbers and line endings are preserved
+    """
+    fcode = (
+        'subroutine some_routine(input_path)\r\n'
+        '@PROCESS NOOPT\n'
+        '  integer :: fu\r'
+        '  Open(NewUnit=fu, file=input_path)\n'
+        '  write(*,*) __FILE__, __LINE__\n'
+        '  open(unit=fu, file=input_path, convert=\'BIG_ENDIAN\')\n'
+        'end subroutine some_routine'
+    )
+
+    source, pp_info = sanitize_input(fcode, frontend=FP)
+    assert source == (
+        'subroutine some_routine(input_path)\r\n'
+        '\n'
+        '  integer :: fu\r'
+        '  Open(fu, file=input_path)\n'
+        '  write(*,*) "__FILE__", 0\n'
+        '  open(unit=fu, file=input_path)\n'
+        'end subroutine some_routine'
+    )
+
+    assert list(pp_info['IBM_DIRECTIVES']) == [2]
+    assert list(pp_info['OPEN_NEWUNIT']) == [4]
+    assert list(pp_info['STRING_PP_DIRECTIVES']) == [5]
+    assert pp_info['INTEGER_PP_DIRECTIVES'] == {5: [('__LINE__', '0')]}
+    assert list(pp_info['CONVERT_ENDIAN']) == [6]
+    assert pp_info['CONVERT_ENDIAN'][6][0]['convert'] == ', convert=\'BIG_ENDIAN\''
+
+
+@pytest.mark.skipif(not HAVE_FP, reason='Fparser is not available')
+def test_fparser_parser_reuse(monkeypatch):
+    """
+    Test that the fparser class hierarchy is set up only once and recreated
+    only if it has been modified elsewhere
+    """
+    # pylint: disable=import-outside-toplevel
+    from fparser.two.parser import ParserFactory
+    from loki.frontend import fparser as fparser_frontend
+
+    parser = get_fparser_parser()
+    assert get_fparser_parser() is parser
+
+    # Parsing sources and expressions does not set up the class hierarchy again
+    calls = []
+    create = ParserFactory.create
+    def counting_create(self, std=None):
+        calls.append(std)
+        return create(self, std=std)
+    monkeypatch.setattr(fparser_frontend.ParserFactory, 'create', counting_create)
+
+    routine = Subroutine.from_source("""
+subroutine routine_parser_reuse(n, a)
+  integer, intent(in) :: n
+  real, intent(inout) :: a(n)
+  a(1:n) = 2. * a(1:n)
+end subroutine routine_parser_reuse
+""".strip(), frontend=FP)
+    expr = parse_fparser_expression('a(1) + n', scope=routine)
+    assert str(expr) == 'a(1) + n'
+    assert not calls
+
+    # Set up a different class hierarchy
+    ParserFactory().create(std='f2003')
+    assert calls == ['f2003']
+    assert get_fparser_parser() is parser
+    assert calls == ['f2003', 'f2008']
+    assert get_fparser_parser() is parser
+    assert calls == ['f2003', 'f2008']
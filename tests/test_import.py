@@ -0,0 +1,84 @@
+# (C) Copyright 2018- ECMWF.
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+"""
+Tests for the lazily populated top-level ``loki`` namespace.
+"""
+
+from importlib import import_module
+from pathlib import Path
+import subprocess
+import sys
+import types
+
+import loki
+
+
+def _public_exports(module):
+    """
+    The names that are exported from :data:`module` by a star import,
+    excluding modules and classes or functions imported from other packages
+    """
+    names = getattr(module, '__all__', None)
+    if names is None:
+        names = [name for name in vars(module) if not name.startswith('_')]
+    external_types = (type, types.FunctionType, types.BuiltinFunctionType)
+    return [
+        name for name in names
+        if not isinstance(getattr(module, name), types.ModuleType) and not (
+            isinstance(getattr(module, name), external_types) and
+            not getattr(module, name).__module__.startswith('loki')
+        )
+    ]
+
+
+def test_lazy_exports():
+    """
+    Test that the lazy export table of the top-level namespace
+    matches the names exported by each subpackage
+    """
+    for package, names in loki._lazy_exports.items():  # pylint: disable=protected-access
+        module = import_module(f'loki.{package}')
+        assert getattr(loki, package) is module
+
+        # All names in the table are provided by the subpackage
+        for name in names:
+            assert getattr(loki, name) is getattr(module, name)
+
+        # All public names of the subpackage are available in the namespace
+        for name in _public_exports(module):
+            assert getattr(loki, name) is getattr(module, name)
+            assert name in loki.__all__
+            assert name in dir(loki)
+
+
+def test_lazy_import():
+    """
+    Test that ``import loki`` does not import any of the lazy subpackages
+    or their dependencies
+    """
+    cmd = [sys.executable, '-X', 'importtime', '-c', 'import loki']
+    result = subprocess.run(
+        cmd, cwd=Path(loki.__file__).parent.parent, capture_output=True, text=True, check=True
+    )
+
+    # Cumulative import time in microseconds per imported module
+    import_times = {}
+    for line in result.stderr.splitlines()[1:]:
+        _, cumulative, name = line.split('|')
+        import_times[name.strip()] = int(cumulative)
+
+    lazy_modules = [f'loki.{package}' for package in loki._lazy_exports]  # pylint: disable=protected-access
+    assert not set(import_times) & set(lazy_modules + ['networkx'])
+
+    # Attribute access imports only the required subpackage
+    cmd = [sys.executable, '-c', (
+        'import sys, loki; loki.Dimension; '
+        'assert "loki.dimension" in sys.modules; '
+        'assert "loki.batch" not in sys.modules and "loki.lint" not in sys.modules'
+    )]
+    subprocess.run(cmd, cwd=Path(loki.__file__).parent.parent, check=True)
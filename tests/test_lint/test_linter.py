@@ -6,15 +6,18 @@
 # nor does it submit to any jurisdiction.
 
 import importlib
+import inspect
 from pathlib import Path
-from shutil import rmtree
+from shutil import copy, rmtree
+import sys
+from textwrap import dedent
 import xml.etree.ElementTree as ET
 import pytest
 from fparser.two.utils import FortranSyntaxError
 
-from loki import Sourcefile, Assignment, FindNodes, FindVariables, gettempdir
+from loki import Sourcefile, Assignment, CallStatement, FindNodes, FindVariables, gettempdir
 from loki.lint import (
-    GenericHandler, Reporter, Linter, GenericRule,
+    GenericHandler, DefaultHandler, ViolationFileHandler, Reporter, Linter, GenericRule,
     LinterTransformation, lint_files, LazyTextfile
 )
 
@@ -330,6 +333,103 @@ end module linter_disable_config_mod
 
     assert reporter.handlers_reports[handler] == [count]
 
+
+def test_linter_check_fused():
+    '''Make sure that the single-pass check of rules with node types
+    gives the same reports as checking each rule in turn.'''
+
+    class AssignmentNodesRule(GenericRule):
+        docs = {'id': '13.37'}
+
+        node_types = (Assignment,)
+
+        @classmethod
+        def check_nodes(cls, subroutine, nodes, rule_report, config, **kwargs):  # pylint: disable=unused-argument
+            for node in nodes:
+                rule_report.add(f'{cls.__name__}_{subroutine.name}_{node.lhs}', node)
+
+    class CallNodesRule(GenericRule):
+        docs = {'id': '23.42'}
+
+        node_types = (CallStatement,)
+
+        @classmethod
+        def check_subroutine(cls, subroutine, rule_report, config, **kwargs):  # pylint: disable=unused-argument
+            rule_report.add(f'{cls.__name__}_{subroutine.name}', subroutine)
+
+        @classmethod
+        def check_nodes(cls, subroutine, nodes, rule_report, config, **kwargs):  # pylint: disable=unused-argument
+            rule_report.add(f'{cls.__name__}_{subroutine.name}_{len(nodes)}', subroutine)
+
+    class ModuleRule(GenericRule):
+
+        @classmethod
+        def check_module(cls, module, rule_report, config):  # pylint: disable=unused-argument
+            rule_report.add(f'{cls.__name__}_{module.name}', module)
+
+    class TestHandler(GenericHandler):
+        def handle(self, file_report):
+            return [
+                (report.rule.__name__, [problem.msg for problem in report.problem_reports])
+                for report in file_report.reports
+            ]
+
+        def output(self, handler_reports):
+            pass
+
+    fcode = """
+module linter_check_fused_mod
+    implicit none
+contains
+    subroutine routine_a
+        integer :: a, b
+        a = 1
+        if (a > 0) then
+            b = a
+            call routine_b(b)
+        end if
+    contains
+        subroutine member
+            ! loki-lint: disable=13.37
+            integer :: c
+            c = 2
+            call routine_b(c)
+        end subroutine member
+    end subroutine routine_a
+
+    subroutine routine_b(d)
+        integer, intent(inout) :: d
+        d = d + 1
+    end subroutine routine_b
+end module linter_check_fused_mod
+    """.strip()
+    sourcefile = Sourcefile.from_source(fcode)
+    rule_list = [AssignmentNodesRule, CallNodesRule, ModuleRule]
+
+    reports = {}
+    for fused in (True, False):
+        handler = TestHandler()
+        reporter = Reporter(handlers=[handler])
+        linter = Linter(reporter, rule_list, config={'fused': fused})
+        file_report = linter.check(sourcefile)
+        assert all(report.elapsed_sec >= 0 for report in file_report.reports)
+        reports[fused] = reporter.handlers_reports[handler]
+
+    assert reports[True] == reports[False]
+    assert reports[True] == [[
+        ('AssignmentNodesRule', [
+            'AssignmentNodesRule_routine_a_a', 'AssignmentNodesRule_routine_a_b',
+            'AssignmentNodesRule_routine_b_d'
+        ]),
+        ('CallNodesRule', [
+            'CallNodesRule_routine_a', 'CallNodesRule_routine_a_1',
+            'CallNodesRule_member', 'CallNodesRule_member_1',
+            'CallNodesRule_routine_b', 'CallNodesRule_routine_b_0'
+        ]),
+        ('ModuleRule', ['ModuleRule_linter_check_fused_mod'])
+    ]]
+
+
 class PicklableTestHandler(GenericHandler):
 
     def __init__(self, basedir, target):
@@ -428,6 +528,93 @@ def test_linter_lint_files_glob(here, rules, counter, exclude, files, max_worker
     target_file_name.unlink(missing_ok=True)
 
 
+def test_linter_lint_files_cache(here, tmp_path, monkeypatch):
+    '''Make sure that cached reports are replayed for unchanged files
+    without parsing them, and that changes to files or rule configuration
+    invalidate the cache.'''
+
+    class AssignmentRule(GenericRule):
+        config = {'prefix': 'Assignment'}
+
+        node_types = (Assignment,)
+
+        @classmethod
+        def check_nodes(cls, subroutine, nodes, rule_report, config, **kwargs):  # pylint: disable=unused-argument
+            for node in nodes:
+                rule_report.add(f'{config["prefix"]} to {node.lhs}', node)
+
+    class RoutineRule(GenericRule):
+
+        @classmethod
+        def check_subroutine(cls, subroutine, rule_report, config, **kwargs):  # pylint: disable=unused-argument
+            rule_report.add('Routine', subroutine)
+
+    basedir = tmp_path/'src'
+    basedir.mkdir()
+    for path in ('module/compute_l1_mod.f90', 'module/compute_l2_mod.f90', 'source/another_l1.F90'):
+        copy(here.parent/'sources/projA'/path, basedir)
+
+    parsed = []
+    from_file = Sourcefile.from_file
+
+    def _from_file(filename, *args, **kwargs):
+        parsed.append(Path(filename).name)
+        return from_file(filename, *args, **kwargs)
+
+    monkeypatch.setattr(Sourcefile, 'from_file', _from_file)
+
+    def _lint(rules=(AssignmentRule, RoutineRule), **kwargs):
+        messages = []
+        config = {
+            'basedir': str(basedir), 'include': ['*.f90', '*.F90'],
+            'cache_dir': str(tmp_path/'cache'), **kwargs
+        }
+        handlers = [
+            DefaultHandler(target=messages.append, basedir=basedir),
+            ViolationFileHandler(target=messages.append, basedir=basedir, use_line_hashes=True)
+        ]
+        parsed.clear()
+        assert lint_files(list(rules), config, handlers=handlers) == 3
+        return messages
+
+    reference = _lint()
+    assert sorted(parsed) == ['another_l1.F90', 'compute_l1_mod.f90', 'compute_l2_mod.f90']
+    assert any('Assignment to' in msg for msg in reference)
+    assert any('in routine "compute_l1"' in msg for msg in reference)
+
+    # All reports are replayed from the cache
+    assert _lint() == reference
+    assert not parsed
+
+    # Only the modified file is parsed again
+    another_l1 = basedir/'another_l1.F90'
+    another_l1.write_text(another_l1.read_text() + '\n')
+    assert _lint() == reference
+    assert parsed == ['another_l1.F90']
+
+    # Changed rule configuration invalidates all cache entries
+    messages = _lint(AssignmentRule={'prefix': 'Write'})
+    assert len(parsed) == 3
+    assert messages == [msg.replace('Assignment to', 'Write to') for msg in reference]
+
+    # Changed rule implementations invalidate all cache entries
+    rule_file = tmp_path/'lint_cache_rules.py'
+    rule_file.write_text(f'from loki.lint import GenericRule\n\n\n{dedent(inspect.getsource(RoutineRule))}')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    rules = (AssignmentRule, importlib.import_module('lint_cache_rules').RoutineRule)
+    try:
+        assert _lint(rules) == messages
+        assert len(parsed) == 3
+        assert _lint(rules) == messages
+        assert not parsed
+
+        rule_file.write_text(rule_file.read_text() + '\n# Modified rule\n')
+        assert _lint(rules) == messages
+        assert len(parsed) == 3
+    finally:
+        sys.modules.pop('lint_cache_rules', None)
+
+
 @pytest.mark.parametrize('routines,files', [
     ({'driverA': {'role': 'driver'}}, [
         'module/driverA_mod.f90',
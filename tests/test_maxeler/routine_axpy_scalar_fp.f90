@@ -0,0 +1,10 @@
+SUBROUTINE routine_axpy_scalar (a, x, y)
+  ! A simple standard routine that computes x = a * x + y for
+  ! scalar arguments
+  USE iso_fortran_env, ONLY: real64
+  IMPLICIT NONE
+  REAL(KIND=real64), INTENT(IN) :: a, y
+  REAL(KIND=real64), INTENT(INOUT) :: x
+  
+  x = a*x + y
+END SUBROUTINE routine_axpy_scalar
@@ -0,0 +1,10 @@
+SUBROUTINE routine_copy_scalar (x, y)
+  ! A simple routine that copies the value of x to y
+  USE iso_fortran_env, ONLY: real64
+  IMPLICIT NONE
+  ! integer, parameter :: jprb = selected_real_kind(13,300)
+  REAL(KIND=real64), INTENT(IN) :: x
+  REAL(KIND=real64), INTENT(OUT) :: y
+  
+  y = x
+END SUBROUTINE routine_copy_scalar
@@ -0,0 +1,13 @@
+SUBROUTINE routine_copy_stream (length, scalar, vector_in, vector_out)
+  IMPLICIT NONE
+  ! A simple standard looking routine to test argument declarations
+  ! and generator toolchain
+  INTEGER, INTENT(IN) :: length, scalar, vector_in(length)
+  INTEGER, INTENT(OUT) :: vector_out(length)
+  INTEGER :: i
+  
+!$loki dataflow
+  DO i=1,length
+    vector_out(i) = vector_in(i) + scalar
+  END DO
+END SUBROUTINE routine_copy_stream
@@ -0,0 +1,20 @@
+SUBROUTINE routine_fixed_loop (scalar, vector, vector_out, tensor, tensor_out)
+  USE iso_fortran_env, ONLY: real64
+  IMPLICIT NONE
+  INTEGER :: n = 6, m = 4
+  REAL(KIND=real64), INTENT(IN) :: scalar
+  REAL(KIND=real64), INTENT(IN) :: tensor(6, 4), vector(6)
+  REAL(KIND=real64), INTENT(OUT) :: tensor_out(4, 6), vector_out(6)
+  INTEGER :: i, j
+  
+  ! For testing, the operation is:
+  DO i=1,n
+    vector_out(i) = vector(i) + tensor(i, 1) + 1.0
+  END DO
+  
+  DO j=1,n
+    DO i=1,m
+      tensor_out(i, j) = tensor(j, i)
+    END DO
+  END DO
+END SUBROUTINE routine_fixed_loop
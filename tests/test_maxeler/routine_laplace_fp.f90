@@ -0,0 +1,37 @@
+SUBROUTINE routine_laplace (h, data_in, data_out)
+  USE iso_fortran_env, ONLY: real64
+  IMPLICIT NONE
+  INTEGER :: m = 32, n = 32
+  !  real(kind=real64), intent(in) :: h, rhs(m*n), data_in(m*n)
+  !  real(kind=real64), intent(out) :: data_out(m*n)
+  REAL(KIND=real64), INTENT(IN) :: h, data_in(32*32)
+  REAL(KIND=real64), INTENT(OUT) :: data_out(32*32)
+  INTEGER :: i, i_mod_n
+  REAL(KIND=real64) :: north, south, east, west
+  
+!$loki dataflow
+  DO i=1,m*n
+    i_mod_n = MOD(i, n)
+    IF (i_mod_n /= 0) THEN
+      north = data_in(i + 1)
+    ELSE
+      north = 0
+    END IF
+    IF (i_mod_n /= 1) THEN
+      south = data_in(i - 1)
+    ELSE
+      south = 0
+    END IF
+    IF (i > n) THEN
+      west = data_in(i - n)
+    ELSE
+      west = 0
+    END IF
+    IF (i <= (m - 1)*n) THEN
+      east = data_in(i + n)
+    ELSE
+      east = 0
+    END IF
+    data_out(i) = (north + south + east + west - 4*data_in(i)) / (h*h)
+  END DO
+END SUBROUTINE routine_laplace
@@ -0,0 +1,27 @@
+SUBROUTINE routine_moving_average (length, data_in, data_out)
+  USE iso_fortran_env, ONLY: real64
+  IMPLICIT NONE
+  INTEGER, INTENT(IN) :: length
+  REAL(KIND=real64), INTENT(IN) :: data_in(length)
+  REAL(KIND=real64), INTENT(OUT) :: data_out(length)
+  INTEGER :: i
+  REAL(KIND=real64) :: prev, next, divisor
+  
+!$loki dataflow
+  DO i=1,length
+    divisor = 1.0
+    IF (i > 1) THEN
+      prev = data_in(i - 1)
+      divisor = divisor + 1.0
+    ELSE
+      prev = 0
+    END IF
+    IF (i < length) THEN
+      next = data_in(i + 1)
+      divisor = divisor + 1.0
+    ELSE
+      next = 0
+    END IF
+    data_out(i) = (prev + data_in(i) + next) / divisor
+  END DO
+END SUBROUTINE routine_moving_average
@@ -179,6 +179,10 @@ end module my_type_mod
     assert module.contains == loads(dumps(module.contains))
     assert module == loads(dumps(module))
 
+    # Ensure the type definition is re-attached to the module, also after repeated pickle-cycles
+    module_new = loads(dumps(loads(dumps(module))))
+    assert module_new['a_type'].parent is module_new
+
 
 @pytest.mark.parametrize('frontend', available_frontends(xfail=[(OMNI, 'No external module available')]))
 def test_pickle_subroutine_with_member(frontend):
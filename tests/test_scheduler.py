@@ -64,7 +64,8 @@ from loki import (
     gettempdir, ProcedureSymbol, Item, ProcedureItem, ProcedureBindingItem, InterfaceItem,
     ProcedureType, DerivedType, TypeDef, Scalar, Array, FindInlineCalls,
     Import, flatten, as_tuple, TypeDefItem, SFilter, CaseInsensitiveDict, Comment,
-    ModuleWrapTransformation, Dimension, PreprocessorDirective, ExternalItem
+    ModuleWrapTransformation, Dimension, PreprocessorDirective, ExternalItem,
+    FileItem, ModuleItem, DiscoveryIndex, RegexParserClass, SGraph
 )
 
 pytestmark = pytest.mark.skipif(not HAVE_FP and not HAVE_OFP, reason='Fparser and OFP not available')
@@ -580,6 +581,56 @@ def test_scheduler_process(here, config, frontend, seed):
         assert comment.text == f'! {role}'
 
 
+def test_scheduler_process_pipeline(here, config, frontend):
+    """
+    Test that a pipeline of transformations yields the same result as
+    individual calls to :meth:`Scheduler.process`, and that consecutive
+    transformations with the same traversal properties are fused
+    """
+    projA = here/'sources/projA'
+
+    class RecordTransformation(Transformation):
+
+        def __init__(self, tag, record, reverse=False):
+            self.tag = tag
+            self.record = record
+            self.reverse_traversal = reverse
+
+        def transform_subroutine(self, routine, **kwargs):
+            self.record += [(self.tag, kwargs['item'].name)]
+            routine.body.prepend(Comment(f'! {self.tag}'))
+
+    def make_pipeline(record):
+        return [
+            RecordTransformation('a', record), RecordTransformation('b', record),
+            RecordTransformation('c', record, reverse=True)
+        ]
+
+    scheduler = Scheduler(paths=projA, includes=projA/'include', config=config,
+                          seed_routines=['driverA'], frontend=frontend)
+    record = []
+    for transformation in make_pipeline(record):
+        scheduler.process(transformation)
+
+    pipeline_scheduler = Scheduler(paths=projA, includes=projA/'include', config=config,
+                                   seed_routines=['driverA'], frontend=frontend)
+    pipeline_record = []
+    pipeline_scheduler.process_pipeline(make_pipeline(pipeline_record))
+
+    # Each transformation is applied to the same items in the same order
+    for tag in 'abc':
+        assert [n for t, n in pipeline_record if t == tag] == [n for t, n in record if t == tag]
+
+    # The first two transformations are fused and applied item by item
+    items = [n for t, n in record if t == 'a']
+    assert len(items) > 1
+    assert pipeline_record[:2*len(items)] == [(t, n) for n in items for t in 'ab']
+    assert pipeline_record[2*len(items):] == record[2*len(items):]
+
+    for item in SFilter(pipeline_scheduler.sgraph, item_filter=ProcedureItem):
+        assert item.ir.to_fortran() == scheduler[item.name].ir.to_fortran()
+
+
 @pytest.mark.skipif(not graphviz_present(), reason='Graphviz is not installed')
 @pytest.mark.parametrize('seed', ['driverE_single', 'driverE_mod#driverE_single'])
 def test_scheduler_process_filter(here, config, frontend, seed):
@@ -1108,6 +1159,103 @@ def test_scheduler_dependencies_ignore(here, preprocess, frontend):
     assert schedulerB['ext_kernel_test_mod#ext_kernel_test'].source.all_subroutines[0].name == 'ext_kernel_test'
 
 
+def test_scheduler_rediscovery_incremental(here, frontend):
+    """
+    Test that the dependency graph is updated incrementally after a
+    transformation that creates items, without scanning all source paths again
+    """
+    projA = here/'sources/projA'
+    projB = here/'sources/projB'
+
+    config = SchedulerConfig.from_dict({
+        'default': {
+            'role': 'kernel', 'expand': True, 'strict': True, 'enable_imports': True
+        },
+        'routines': {
+            'driverB': {'role': 'driver'},
+        }
+    })
+
+    scheduler = Scheduler(
+        paths=[projA, projB], includes=projA/'include', config=config, frontend=frontend
+    )
+
+    def failing_discover():
+        raise RuntimeError('Full rediscovery triggered')
+
+    scheduler._discover = failing_discover
+
+    for transformation in (
+        ModuleWrapTransformation(module_suffix='_mod'),
+        DependencyTransformation(suffix='_test', module_suffix='_mod')
+    ):
+        scheduler.process(transformation)
+
+    assert 'kernelb_test_mod#kernelb_test' in scheduler.items
+    assert 'ext_driver_test_mod#ext_driver_test' in scheduler.items
+    assert 'kernelb_mod#kernelb' not in scheduler.items
+
+    # The incrementally updated graph matches a graph that is re-built from the seeds
+    sgraph = SGraph.from_seed(scheduler.seeds, scheduler.item_factory, scheduler.config)
+    assert set(scheduler.items) == set(sgraph.items)
+    assert {(a.name, b.name) for a, b in scheduler.dependencies} == {
+        (a.name, b.name) for a, b in sgraph.dependencies
+    }
+
+    # The original files of the renamed items have been scanned again
+    item_cache = scheduler.item_factory.item_cache
+    assert item_cache['kernelb_mod'].source.all_subroutines[0].name == 'kernelB'
+    assert item_cache['kernelb_test_mod#kernelb_test'].source.all_subroutines[0].name == 'kernelB_test'
+
+
+def test_scheduler_rediscovery_new_module_procedure(tmp_path, frontend):
+    """
+    Test that a module procedure added by a transformation is found via
+    an unqualified import after the incremental rediscovery
+    """
+    (tmp_path/'mod_a.F90').write_text("""
+module mod_a
+contains
+subroutine a
+end subroutine a
+end module mod_a
+""".strip())
+    (tmp_path/'driver.F90').write_text("""
+subroutine driver
+use mod_a
+call a
+end subroutine driver
+""".strip())
+
+    config = SchedulerConfig.from_dict({
+        'default': {
+            'role': 'kernel', 'expand': True, 'strict': True, 'enable_imports': True
+        },
+        'routines': {
+            'driver': {'role': 'driver'},
+        }
+    })
+    scheduler = Scheduler(paths=[tmp_path], config=config, frontend=frontend)
+    assert 'mod_a#b' not in scheduler.items
+
+    class AddModuleProcedure(Transformation):
+
+        creates_items = True
+
+        def transform_subroutine(self, routine, **kwargs):
+            if routine.name == 'a':
+                module = routine.parent
+                new_routine = routine.clone(name='b', parent=module)
+                module.contains.append(new_routine)
+            elif routine.name == 'driver':
+                call = CallStatement(name=ProcedureSymbol('b', scope=routine), arguments=())
+                routine.body.append(call)
+
+    scheduler.process(AddModuleProcedure())
+    assert 'mod_a#b' in scheduler.items
+    assert ('#driver', 'mod_a#b') in {(a.name, b.name) for a, b in scheduler.dependencies}
+
+
 def test_scheduler_cmake_planner(here, frontend):
     """
     Test the plan generation feature over a call hierarchy spanning two
@@ -2291,6 +2439,157 @@ def test_scheduler_depths(here, config, frontend):
     assert scheduler.sgraph.depths == expected_depths
 
 
+def test_scheduler_parallel_parse(here, config, frontend):
+    """
+    Test that the full parse with multiple worker processes yields the
+    same IR as the sequential parse, with references in items retained
+    """
+    projA = here/'sources/projA'
+
+    scheduler = Scheduler(
+        paths=projA, includes=projA/'include', config=config,
+        seed_routines=['driverA'], frontend=frontend
+    )
+    parallel_scheduler = Scheduler(
+        paths=projA, includes=projA/'include', config=config,
+        seed_routines=['driverA'], frontend=frontend, num_workers=2
+    )
+
+    assert set(parallel_scheduler.items) == set(scheduler.items)
+    assert set(parallel_scheduler.dependencies) == set(scheduler.dependencies)
+
+    for item in parallel_scheduler.file_graph:
+        assert not item.source._incomplete
+        assert item.source.to_fortran() == scheduler.item_factory.item_cache[item.name].source.to_fortran()
+
+    for item in SFilter(parallel_scheduler.sgraph, item_filter=ProcedureItem):
+        assert item.source is parallel_scheduler.item_factory.item_cache[item.name].source
+        assert item.ir.to_fortran() == scheduler[item.name].ir.to_fortran()
+
+        # Make sure calls have been enriched with the program units in the main process
+        dependency_map = CaseInsensitiveDict(
+            (item_.local_name, item_) for item_ in parallel_scheduler.sgraph.successors(item)
+        )
+        for call in FindNodes(CallStatement).visit(item.ir.body):
+            if call_item := dependency_map.get(str(call.name)):
+                assert call.routine is call_item.ir
+
+
+def test_scheduler_discovery_index(here, config, frontend):
+    """
+    Test that unchanged files are not re-scanned during discovery
+    when a discovery index is used
+    """
+    projA = here/'sources/projA'
+    workdir = gettempdir()/'test_scheduler_discovery_index'
+    if workdir.exists():
+        rmtree(workdir)
+    index_path = workdir/'discovery.json'
+
+    scheduler = Scheduler(
+        paths=projA, includes=projA/'include', config=config, seed_routines=['driverA'],
+        frontend=frontend, discovery_index=index_path
+    )
+    assert index_path.exists()
+
+    # Count the files that are read during the second discovery
+    parsed_files = []
+    from_file = Sourcefile.from_file
+
+    def counting_from_file(filename, *args, **kwargs):
+        parsed_files.append(str(filename).lower())
+        return from_file(filename, *args, **kwargs)
+
+    Sourcefile.from_file = counting_from_file
+    try:
+        indexed_scheduler = Scheduler(
+            paths=projA, includes=projA/'include', config=config, seed_routines=['driverA'],
+            frontend=frontend, discovery_index=index_path
+        )
+    finally:
+        Sourcefile.from_file = from_file
+
+    assert set(indexed_scheduler.items) == set(scheduler.items)
+    assert set(indexed_scheduler.dependencies) == set(scheduler.dependencies)
+
+    # Only files in the dependency graph have been read
+    file_items = [
+        item for item in indexed_scheduler.item_factory.item_cache.values()
+        if isinstance(item, FileItem)
+    ]
+    graph_files = {item.name for item in indexed_scheduler.file_graph}
+    assert len(file_items) > len(graph_files)
+    assert set(parsed_files) == graph_files
+    for item in file_items:
+        assert item._source_is_loaded == (item.name in graph_files)
+
+    for item in indexed_scheduler.file_graph:
+        assert not item.source._incomplete
+        assert item.source.to_fortran() == scheduler.item_factory.item_cache[item.name].source.to_fortran()
+
+    # Items for the program units in unparsed files have been created from the index
+    assert set(indexed_scheduler.item_factory.item_cache) <= set(scheduler.item_factory.item_cache)
+    assert all(
+        item.name in indexed_scheduler.item_factory.item_cache
+        for item in scheduler.item_factory.item_cache.values()
+        if isinstance(item, (FileItem, ModuleItem)) or item.name.startswith('#')
+    )
+
+    rmtree(workdir)
+
+
+def test_discovery_index():
+    """
+    Test lookup and invalidation of entries in the :any:`DiscoveryIndex`
+    """
+    fcode = """
+module discovery_mod
+contains
+subroutine discovery_routine
+end subroutine discovery_routine
+end module discovery_mod
+
+subroutine discovery_ext
+end subroutine discovery_ext
+"""
+    workdir = gettempdir()/'test_discovery_index'
+    workdir.mkdir(exist_ok=True)
+    filepath = workdir/'discovery.F90'
+    filepath.write_text(fcode)
+    frontend_args = {'frontend': REGEX, 'parser_classes': RegexParserClass.ProgramUnitClass}
+
+    index = DiscoveryIndex(workdir/'index.json')
+    assert index.lookup(filepath, frontend_args) is None
+    index.update(filepath, Sourcefile.from_file(filepath, **frontend_args), frontend_args)
+    index.write()
+
+    expected = {'modules': {'discovery_mod': None}, 'procedures': ['discovery_ext']}
+    index = DiscoveryIndex(workdir/'index.json')
+    assert index.lookup(filepath, frontend_args) == expected
+
+    # Module members are recorded once the module definitions have been parsed
+    source = Sourcefile.from_file(filepath, **frontend_args)
+    source['discovery_mod'].make_complete(
+        frontend=REGEX, parser_classes=RegexParserClass.InterfaceClass | RegexParserClass.TypeDefClass
+    )
+    index.update(filepath, source, frontend_args)
+    expected['modules']['discovery_mod'] = ['discovery_routine']
+    assert index.lookup(filepath, frontend_args) == expected
+
+    # Different frontend arguments invalidate the entry
+    assert index.lookup(filepath, {**frontend_args, 'preprocess': True}) is None
+
+    # Touching the file with the same content keeps the entry
+    filepath.write_text(fcode)
+    assert index.lookup(filepath, frontend_args) == expected
+
+    # Modifying the file invalidates the entry
+    filepath.write_text(fcode.replace('discovery_ext', 'other_ext'))
+    assert index.lookup(filepath, frontend_args) is None
+
+    rmtree(workdir)
+
+
 def test_scheduler_disable_wildcard(here, config):
 
     fcode_mod = """
@@ -465,3 +465,50 @@ def test_fortran_reader_empty(fcode):
     assert isinstance(source, Source)
     assert source.lines == (1, 1)
     assert source.string == ''
+
+
+def test_fortran_reader_sanitize():
+    """Test the sanitization of free-form source in :any:`FortranReader`"""
+    fcode = """
+subroutine routine(a, b) ! Comment
+#ifdef FLAG
+  integer, intent(inout) :: a ; real :: b(2)
+#endif
+#define MACRO(x) \\
+  x
+  character(len=*), parameter :: s = 'it''s ! not a comment' // "a;b"   ! Comment
+  character(len=*), parameter :: t = 'abc&
+! Comment between continuation lines
+
+    &def'
+10 continue
+  outer: do a=1,2
+    call sub(a, &  ! Comment after continuation
+      & b(1), &
+      b(2)) ; 20 b(1) = 1.0 ; b(2) = (1.0 ; 2.0)
+  end do outer
+end subroutine routine
+""".strip()
+    reader = FortranReader(fcode)
+    assert [(item.line, item.span, item.label, item.name) for item in reader.sanitized_lines] == [
+        ('subroutine routine(a, b)', (1, 1), None, None),
+        ('#ifdef FLAG', (2, 2), None, None),
+        ('integer, intent(inout) :: a', (3, 3), None, None),
+        ('real :: b(2)', (3, 3), None, None),
+        ('#endif', (4, 4), None, None),
+        ('#define MACRO(x)   x', (5, 6), None, None),
+        ('character(len=*), parameter :: s = \'it\'\'s ! not a comment\' // "a;b"', (7, 7), None, None),
+        ("character(len=*), parameter :: t = 'abcdef'", (8, 11), None, None),
+        ('continue', (12, 12), 10, None),
+        ('do a=1,2', (13, 13), None, 'outer'),
+        ('call sub(a,  b(1),       b(2))', (14, 16), None, None),
+        ('b(1) = 1.0', (14, 16), 20, None),
+        ('b(2) = (1.0 ; 2.0)', (14, 16), None, None),
+        ('end do outer', (17, 17), None, None),
+        ('end subroutine routine', (18, 18), None, None),
+    ]
+    assert reader.sanitized_string == '\n'.join(item.line for item in reader.sanitized_lines)
+
+    # The sanitized lines are shared between readers for the same source
+    assert FortranReader(fcode).sanitized_lines == reader.sanitized_lines
+    assert all(a is b for a, b in zip(FortranReader(fcode).sanitized_lines, reader.sanitized_lines))
@@ -6,6 +6,7 @@
 # nor does it submit to any jurisdiction.
 
 from pathlib import Path
+from shutil import rmtree
 from subprocess import CalledProcessError
 import pytest
 import numpy as np
@@ -14,8 +15,10 @@ from conftest import jit_compile, clean_test, available_frontends
 from loki import (
     Sourcefile, OFP, OMNI, FP, REGEX, FindNodes, PreprocessorDirective,
     Intrinsic, Assignment, Import, fgen, ProcedureType, ProcedureSymbol,
-    StatementFunction, Comment, CommentBlock, RawSource, Scalar
+    StatementFunction, Comment, CommentBlock, RawSource, Scalar,
+    config_override, gettempdir
 )
+import loki.sourcefile
 
 
 @pytest.fixture(scope='module', name='here')
@@ -351,3 +354,63 @@ end subroutine myroutine
     assert '! Comment outside' in code
     assert '! Comment inside' in code
     assert '! Other comment outside' in code
+
+
+@pytest.mark.parametrize('frontend', available_frontends())
+def test_sourcefile_parse_cache(here, frontend, monkeypatch):
+    """
+    Test that the persistent parse cache skips the frontend for unchanged files
+    """
+    cache_dir = gettempdir()/f'test_sourcefile_parse_cache_{frontend}'
+    rmtree(cache_dir, ignore_errors=True)
+    filepath = here/'sources/sourcefile.f90'
+
+    with config_override({'parse-cache-dir': str(cache_dir)}):
+        source = Sourcefile.from_file(filepath, frontend=frontend)
+        assert len(list(cache_dir.glob('*.pickle'))) == 1
+
+        # The lazy full parse does not use the cache, as it updates existing program units
+        for _ in range(2):
+            lazy_source = Sourcefile.from_file(filepath, frontend=REGEX)
+            routines = lazy_source.all_subroutines
+            lazy_source.make_complete(frontend=frontend)
+            assert all(a is b for a, b in zip(routines, lazy_source.all_subroutines))
+            assert not any(routine._incomplete for routine in routines)
+        assert len(list(cache_dir.glob('*.pickle'))) == 1
+
+        def _fail(*args, **kwargs):
+            raise RuntimeError('Frontend should not be called')
+
+        for name in ('parse_omni_source', 'parse_ofp_source', 'parse_fparser_source'):
+            monkeypatch.setattr(loki.sourcefile, name, _fail)
+
+        # The direct full parse is served from the cache
+        cached_source = Sourcefile.from_file(filepath, frontend=frontend)
+        assert cached_source.to_fortran() == source.to_fortran()
+        assert cached_source.path == filepath
+
+        # Different frontend arguments create a separate cache entry
+        with pytest.raises(RuntimeError):
+            Sourcefile.from_file(filepath, frontend=frontend, defines=['SOME_DEFINE'])
+
+    rmtree(cache_dir)
+
+
+@pytest.mark.parametrize('frontend', available_frontends())
+def test_sourcefile_parse_cache_includes(tmp_path, frontend):
+    """
+    Test that the persistent parse cache captures the content of included files
+    """
+    header = tmp_path/'parse_cache_header.h'
+    filepath = tmp_path/'parse_cache_includes.F90'
+    filepath.write_text("""
+module parse_cache_includes
+#include "parse_cache_header.h"
+end module parse_cache_includes
+""".strip())
+
+    with config_override({'parse-cache-dir': str(tmp_path/'cache')}):
+        for value in (1, 2):
+            header.write_text(f'integer, parameter :: n = {value}\n')
+            source = Sourcefile.from_file(filepath, frontend=frontend, preprocess=True, includes=[tmp_path])
+            assert source['parse_cache_includes'].variable_map['n'].initial == value
@@ -443,6 +443,63 @@ integer :: c
     )
 
 
+@pytest.mark.parametrize('frontend', available_frontends())
+def test_routine_variables_cached(frontend):
+    """
+    Test that derived properties are cached and invalidated upon modification of the IR
+    """
+    fcode = """
+subroutine routine_variables_cached(n, a)
+  use iso_fortran_env, only: real64
+  integer, intent(in) :: n
+  real(kind=real64), intent(inout) :: a(n)
+  integer :: i
+  do i=1,n
+    a(i) = 1.0
+  end do
+end subroutine routine_variables_cached
+"""
+    routine = Subroutine.from_source(fcode, frontend=frontend)
+    variables = routine.variables
+    assert routine.variables is variables
+    assert routine.variable_map is routine.variable_map
+    assert routine.imports is routine.imports
+    assert [str(v) for v in variables] in (['n', 'a(n)', 'i'], ['n', 'a(1:n)', 'i'])
+
+    # Modifying the IR elsewhere does not change the derived properties
+    routine.body.prepend(Assignment(lhs=routine.variable_map['i'], rhs=routine.variable_map['n']))
+    assert [str(v) for v in routine.variables] == [str(v) for v in variables]
+
+    # In-place modification of the spec invalidates the cache
+    routine.spec.append(VariableDeclaration(symbols=(Scalar(name='j', scope=routine),)))
+    assert routine.variables is not variables
+    assert 'j' in routine.variable_map
+
+    # Updating a declaration invalidates the cache
+    decl = routine.declarations[-1]
+    decl._update(symbols=(Scalar(name='k', scope=routine),))
+    assert 'j' not in routine.variable_map
+    assert 'k' in routine.variable_map
+
+    # Replacing the spec invalidates the cache
+    imports = routine.imports
+    routine.spec = Transformer({imports[0]: None}).visit(routine.spec)
+    assert not routine.imports
+    assert 'real64' not in routine.import_map
+
+    # Using the setter for variables updates the cache
+    routine.variables = routine.variables[:-1]
+    assert 'k' not in routine.variable_map
+
+    # Replacing the spec with a structurally equal clone invalidates the cache
+    declarations = routine.declarations
+    routine.spec = routine.spec.clone(body=tuple(node.clone() for node in routine.spec.body))
+    assert all(any(decl is node for node in routine.spec.body) for decl in routine.declarations)
+    assert not any(decl is new_decl for decl, new_decl in zip(declarations, routine.declarations))
+    routine.declarations[-1]._update(symbols=(Scalar(name='m', scope=routine),))
+    assert fgen(routine.spec).splitlines()[-1].endswith(':: m')
+
+
 @pytest.mark.parametrize('frontend', available_frontends())
 def test_routine_variables_find(frontend):
     """
@@ -28,7 +28,7 @@ from loki.config import config_override
 from loki.tools import (
     JoinableStringList, truncate_string, binary_insertion_sort, is_subset,
     optional, yaml_include_constructor, execute, timeout, dict_override,
-    LokiTempdir
+    LokiTempdir, DiskCache, gettempdir
 )
 
 
@@ -389,3 +389,35 @@ def test_loki_tempdir(here):
     # But the parent directory should not be deleted
     assert test_tmpdir.exists()
     test_tmpdir.rmdir()
+
+
+def test_disk_cache():
+    cache_dir = gettempdir()/'test_disk_cache'
+    cache = DiskCache(cache_dir, max_size=3500)
+    cache.clear()
+
+    # Keys are derived from the content
+    assert cache.make_key('a', 1) == cache.make_key('a', 1)
+    assert cache.make_key('a', 1) != cache.make_key('a', 2)
+
+    # Store and load some entries
+    assert cache.load(cache.make_key('a')) is None
+    for name in 'abc':
+        cache.store(cache.make_key(name), name * 1000)
+        sleep(0.01)
+    assert cache.load(cache.make_key('a')) == 'a' * 1000
+    assert cache.size < 3500
+
+    # Make 'b' the least-recently used entry, and force an eviction
+    sleep(0.01)
+    assert cache.load(cache.make_key('c')) == 'c' * 1000
+    cache.store(cache.make_key('d'), 'd' * 1000)
+    assert cache.size <= 3500
+    assert cache.load(cache.make_key('b')) is None
+    assert cache.load(cache.make_key('a')) == 'a' * 1000
+    assert cache.load(cache.make_key('c')) == 'c' * 1000
+    assert cache.load(cache.make_key('d')) == 'd' * 1000
+
+    cache.clear()
+    assert cache.size == 0
+    cache_dir.rmdir()
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 import pytest
 
@@ -446,3 +447,44 @@ end subroutine rick
     # Check error behaviour if no item provided
     with pytest.raises(ValueError):
         FileWriteTransformation(builddir=here).apply(source=source)
+
+
+@pytest.mark.parametrize('workers', [None, 0, 1, 2])
+def test_transformation_file_write_if_changed(here, workers):
+    """Verify that only changed files are written and that writes are counted"""
+
+    fcode = """
+subroutine rick()
+  print *, "PRINT ME!"
+end subroutine rick
+"""
+    source = Sourcefile.from_source(fcode)
+    source.path = Path('rick.F90')
+    item = ProcedureItem(name='#rick', source=source)
+
+    ricks_path = here/f'rick.{workers}.F90'
+    if ricks_path.exists():
+        ricks_path.unlink()
+
+    trafo = FileWriteTransformation(builddir=here, mode=str(workers), workers=workers)
+    trafo.apply(source=source, item=item)
+    assert trafo.wait() == 1
+    assert ricks_path.exists()
+    assert trafo.num_files == 1
+
+    # An identical rewrite leaves the file untouched
+    os.utime(ricks_path, (0, 0))
+    trafo.apply(source=source, item=item)
+    assert trafo.wait() == 1
+    assert trafo.num_files == 2
+    assert ricks_path.stat().st_mtime == 0
+
+    # A modified source replaces the file
+    source['rick'].name = 'roll'
+    trafo.apply(source=source, item=item)
+    assert trafo.wait() == 2
+    assert trafo.num_files == 3
+    assert ricks_path.stat().st_mtime > 0
+    assert 'subroutine roll' in ricks_path.read_text().lower()
+    assert not list(here.glob(f'.{ricks_path.name}.*'))
+    ricks_path.unlink()
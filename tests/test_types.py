@@ -13,7 +13,7 @@ from conftest import available_frontends
 from loki import (
     OFP, OMNI, Sourcefile, Module, Subroutine, BasicType,
     SymbolAttributes, DerivedType, TypeDef, FCodeMapper,
-    DataType, fgen, ProcedureType, FindNodes, ProcedureDeclaration
+    DataType, fgen, ProcedureType, FindNodes, ProcedureDeclaration, SymbolTable
 )
 from loki.expression import symbols as sym
 
@@ -94,6 +94,48 @@ def test_symbol_attributes_compare():
     assert not someint.compare(somereal)
 
 
+def test_symbol_attributes_copy_on_write():
+    """
+    Test that symbol table entries are shared on look-up and only
+    copied when modified
+    """
+    table = SymbolTable()
+    _type = SymbolAttributes('integer', intent='in')
+    table['a'] = _type
+
+    # Look-ups share the attribute storage with the table entry
+    lookup = table.lookup('a')
+    assert lookup == _type
+    assert lookup.__dict__ is dict.__getitem__(table, 'a').__dict__
+    assert table['a'].__dict__ is lookup.__dict__
+    assert table.get('a').__dict__ is lookup.__dict__
+
+    # Modifying a looked-up entry does not alter the table
+    lookup.intent = 'out'
+    lookup.shape = (1,)
+    assert table['a'].intent == 'in'
+    assert table['a'].shape is None
+    assert lookup.intent == 'out'
+
+    # Modifying the original object does not alter the table
+    _type.intent = None
+    assert _type.intent is None
+    assert table['a'].intent == 'in'
+
+    # Modifying a table entry in place does not alter previous look-ups
+    lookup = table.lookup('a')
+    entry = dict.__getitem__(table, 'a')
+    delattr(entry, 'intent')
+    assert table['a'].intent is None
+    assert lookup.intent == 'in'
+
+    # Entries of a cloned table are independent
+    clone = table.clone()
+    dict.__getitem__(clone, 'a').optional = True
+    assert clone['a'].optional
+    assert table['a'].optional is None
+
+
 @pytest.mark.parametrize('frontend', available_frontends(xfail=[
   (OFP, 'OFP needs preprocessing to support contiguous keyword'
 )]))
@@ -5,6 +5,7 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
+from concurrent.futures import ThreadPoolExecutor
 import pytest
 from pymbolic.primitives import Expression
 
@@ -16,7 +17,8 @@ from loki import (
     FindNodes, FindVariables, ExpressionFinder,
     ExpressionCallbackMapper, ExpressionRetriever, Stringifier, Transformer,
     NestedTransformer, MaskedTransformer, NestedMaskedTransformer, SubstituteExpressions,
-    is_parent_of, is_child_of, fgen, FindScopes, Intrinsic
+    is_parent_of, is_child_of, fgen, FindScopes, Intrinsic, trusted_node_construction,
+    config_override
 )
 
 
@@ -758,6 +760,63 @@ end subroutine routine_simple
     assert all(c in conds for c in conds_no_rebuild)
 
 
+@pytest.mark.parametrize('frontend', available_frontends())
+def test_transformer_share_unchanged(frontend):
+    """
+    Test that the transformer rebuilds only nodes on the path to
+    replaced nodes with ``share_unchanged``
+    """
+    fcode = """
+subroutine routine_share_unchanged (x, y, scalar, vector, matrix)
+  integer, intent(in) :: x, y
+  real, intent(in) :: scalar
+  real, intent(inout) :: vector(x), matrix(x, y)
+  integer :: i, j
+
+  do i=1, x
+    vector(i) = vector(i) + scalar
+    do j=1, y
+      if (j > i) then
+        matrix(i, j) = real(i * j) + 1.
+      else
+        matrix(i, j) = i * vector(j)
+      end if
+    end do
+  end do
+  vector(1) = 0.
+end subroutine routine_share_unchanged
+"""
+    routine = Subroutine.from_source(fcode, frontend=frontend)
+    assignments = FindNodes(Assignment).visit(routine.body)
+    loops = FindNodes(Loop).visit(routine.body)
+    cond = FindNodes(Conditional).visit(routine.body)[0]
+    assert len(assignments) == 4
+
+    # An empty mapper returns the original tree
+    assert Transformer({}, share_unchanged=True).visit(routine.body) is routine.body
+    assert Transformer({}).visit(routine.body) is not routine.body
+
+    # Replace the statement in the body of the conditional
+    stmt = cond.body[0]
+    new_stmt = Assignment(stmt.lhs, FloatLiteral(2.))
+    body = Transformer({stmt: new_stmt}, share_unchanged=True).visit(routine.body)
+
+    # Only the nodes on the path to the replaced node are rebuilt
+    new_assignments = FindNodes(Assignment).visit(body)
+    new_loops = FindNodes(Loop).visit(body)
+    new_cond = FindNodes(Conditional).visit(body)[0]
+    assert str(new_assignments[1]) == str(new_stmt)
+    assert new_assignments[1] is not assignments[1]
+    assert all(new_assignments[i] is assignments[i] for i in (0, 2, 3))
+    assert not any(new is old for new, old in zip(new_loops, loops))
+    assert new_cond is not cond
+    assert new_cond.else_body[0] is cond.else_body[0]
+
+    # The original tree is unchanged
+    assert FindNodes(Assignment).visit(routine.body) == assignments
+    assert cond.body[0] is stmt
+
+
 @pytest.mark.parametrize('frontend', available_frontends())
 def test_transformer_multinode_keys(frontend):
     """
@@ -796,6 +855,137 @@ end subroutine routine_simple
     assert len(FindNodes(Assignment).visit(transformed)) == 4
 
 
+@pytest.mark.parametrize('frontend', available_frontends())
+def test_transformer_multinode_keys_many(frontend):
+    """
+    Test one-to-many and multi-node substitutions with many mapper entries,
+    including keys that match nodes injected by earlier entries
+    """
+    fcode = """
+subroutine routine_multinode_many (n, a)
+  integer, intent(in) :: n
+  real, intent(inout) :: a(n)
+
+  a(1) = 1.
+  a(2) = 2.
+  a(3) = 3.
+  a(4) = 4.
+  a(5) = 5.
+  a(6) = 6.
+end subroutine routine_multinode_many
+"""
+    routine = Subroutine.from_source(fcode, frontend=frontend)
+    assigns = FindNodes(Assignment).visit(routine.body)
+    assert len(assigns) == 6
+
+    # Prepend a marker to every assignment, and use unrelated keys to fill the mapper
+    markers = [Intrinsic(text=f'! before {i}') for i in range(6)]
+    mapper = {assign: (marker, assign) for assign, marker in zip(assigns, markers)}
+    mapper.update({Intrinsic(text=f'! unused {i}'): None for i in range(100)})
+    body = Transformer(mapper).visit(routine.body)
+    text = [str(n) for n in body.body if isinstance(n, (Assignment, Intrinsic))]
+    assert text == [str(n) for pair in zip(markers, assigns) for n in pair]
+
+    # Swap pairs of consecutive assignments
+    mapper = {(assigns[i], assigns[i+1]): (assigns[i+1], assigns[i]) for i in range(0, 6, 2)}
+    body = Transformer(mapper).visit(routine.body)
+    assert [str(n.lhs) for n in FindNodes(Assignment).visit(body)] == [
+        'a(2)', 'a(1)', 'a(4)', 'a(3)', 'a(6)', 'a(5)'
+    ]
+
+    # Injected nodes are matched by later keys but not by earlier keys
+    marker = Intrinsic(text='! marker')
+    mapper = {
+        (marker, assigns[0]): (Intrinsic(text='! early'),),
+        assigns[0]: (marker, assigns[0]),
+        assigns[2]: (marker, assigns[2]),
+        (marker, assigns[2]): (Intrinsic(text='! late'), assigns[2]),
+    }
+    body = Transformer(mapper).visit(routine.body)
+    text = [n.text for n in FindNodes(Intrinsic).visit(body)]
+    assert text == ['! marker', '! late']
+
+    # Mapper entries added between visits are picked up
+    transformer = Transformer({assigns[1]: None})
+    assert len(FindNodes(Assignment).visit(transformer.visit(routine.body))) == 5
+    transformer.mapper[(assigns[3], assigns[4])] = None
+    assert len(FindNodes(Assignment).visit(transformer.visit(routine.body))) == 3
+
+    # Replacing a mapper entry with another one between visits is picked up
+    transformer = Transformer({assigns[1]: None})
+    assert len(FindNodes(Assignment).visit(transformer.visit(routine.body))) == 5
+    transformer.mapper.pop(assigns[1])
+    transformer.mapper[assigns[2]] = None
+    body = transformer.visit(Section(body=assigns[:3]))
+    assert [str(n.lhs) for n in FindNodes(Assignment).visit(body)] == ['a(1)', 'a(2)']
+
+
+@pytest.mark.parametrize('frontend', available_frontends())
+def test_transformer_trusted_node_construction(frontend):
+    """
+    Test that transformers and frontends skip the validation of node
+    constructor arguments unless disabled via the config
+    """
+    fcode = """
+subroutine routine_trusted (n, a, mask)
+  integer, intent(in) :: n
+  real, intent(inout) :: a(n)
+  logical, intent(in) :: mask(n)
+  integer :: i
+
+  do i=1,n
+    if (mask(i)) then
+      a(i) = 1.
+    end if
+  end do
+  where (mask)
+    a = 2.
+  elsewhere
+    a = 3.
+  end where
+end subroutine routine_trusted
+"""
+    # Validation converts arguments to the declared types, trusted construction does not
+    assert Intrinsic(text='continue', label=10).label == '10'
+    with trusted_node_construction():
+        assert Intrinsic(text='continue', label=10).label == 10
+        with config_override({'trusted-node-construction': False}):
+            with trusted_node_construction():
+                assert Intrinsic(text='continue', label=10).label == 10
+    assert Intrinsic(text='continue', label=10).label == '10'
+
+    with config_override({'trusted-node-construction': False}):
+        with trusted_node_construction():
+            assert Intrinsic(text='continue', label=10).label == '10'
+
+    # Trusted construction applies only to the current thread
+    with trusted_node_construction():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(Intrinsic, text='continue', label=10).result().label == '10'
+
+    # Nodes rebuilt by transformers are not validated, but nodes created
+    # in the visit methods of user-defined transformers are
+    class LabelTransformer(Transformer):
+
+        def visit_Assignment(self, o, **kwargs):
+            return o.clone(label=10)
+
+    routine = Subroutine.from_source(fcode, frontend=frontend)
+    assignment = FindNodes(Assignment).visit(routine.body)[0]
+    assert Transformer()._rebuild(assignment, assignment.children, label=10).label == 10
+    with config_override({'trusted-node-construction': False}):
+        assert Transformer()._rebuild(assignment, assignment.children, label=10).label == '10'
+    body = LabelTransformer().visit(routine.body)
+    assert FindNodes(Assignment).visit(body)[0].label == '10'
+
+    # The frontend creates the same IR in both modes
+    with config_override({'trusted-node-construction': False}):
+        validated = Subroutine.from_source(fcode, frontend=frontend)
+    assert validated.to_fortran() == routine.to_fortran()
+    assert validated.body == routine.body
+    assert validated.spec == routine.spec
+
+
 @pytest.mark.parametrize('frontend', available_frontends())
 def test_masked_transformer(frontend):
     """
@@ -0,0 +1,15 @@
+SUBROUTINE transform_demote_dimension_arguments (vec1, vec2, matrix, n, m)
+  IMPLICIT NONE
+  INTEGER, INTENT(IN) :: n, m
+  INTEGER, INTENT(INOUT), DIMENSION(n) :: vec1, vec2
+  INTEGER, INTENT(INOUT), DIMENSION(n, m) :: matrix
+  INTEGER, DIMENSION(n) :: vec_tmp
+  INTEGER :: i, j
+  
+  DO i=1,n
+    DO j=1,m
+      vec_tmp(i) = vec1(i) + vec2(i)
+      matrix(i, j) = matrix(i, j) + vec_tmp(i)
+    END DO
+  END DO
+END SUBROUTINE transform_demote_dimension_arguments
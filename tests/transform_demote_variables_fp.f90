@@ -0,0 +1,32 @@
+SUBROUTINE transform_demote_variables (scalar, vector, matrix, n, m)
+  IMPLICIT NONE
+  INTEGER, INTENT(IN) :: n, m
+  INTEGER, INTENT(INOUT) :: scalar, vector(n), matrix(n, n)
+  INTEGER :: tmp_scalar, tmp_vector(n, m), tmp_matrix(n, m, n)
+  INTEGER :: jl, jk, jm
+  
+  DO jl=1,n
+    DO jm=1,m
+      tmp_vector(jl, jm) = scalar + jl
+    END DO
+  END DO
+  
+  DO jm=1,m
+    DO jl=1,n
+      scalar = jl
+      vector(jl) = tmp_vector(jl, jm) + tmp_vector(jl, jm)
+      
+      DO jk=1,n
+        tmp_matrix(jk, jm, jl) = vector(jl) + jk
+      END DO
+    END DO
+  END DO
+  
+  DO jk=1,n
+    DO jm=1,m
+      DO jl=1,n
+        matrix(jk, jl) = tmp_matrix(jk, jm, jl)
+      END DO
+    END DO
+  END DO
+END SUBROUTINE transform_demote_variables
@@ -0,0 +1,30 @@
+SUBROUTINE transform_flatten_arrays (x1, x2, x3, x4, l1, l2, l3, l4)
+  IMPLICIT NONE
+  INTEGER :: i1, i2, i3, i4, c1, c2, c3, c4
+  INTEGER, INTENT(IN) :: l1, l2, l3, l4
+  INTEGER, INTENT(INOUT) :: x1(5:l1 + 5 - 1)
+  INTEGER, INTENT(INOUT) :: x2(5:l2 + 5 - 1, 5:l1 + 5 - 1)
+  INTEGER, INTENT(INOUT) :: x3(5:l3 + 5 - 1, 5:l2 + 5 - 1, 5:l1 + 5 - 1)
+  INTEGER, INTENT(INOUT) :: x4(5:l4 + 5 - 1, 5:l3 + 5 - 1, 5:l2 + 5 - 1, 5:l1 + 5 - 1)
+  c1 = 1
+  c2 = 1
+  c3 = 1
+  c4 = 1
+  DO i1=5,l1 + 5 - 1
+    x1(i1) = c1
+    DO i2=5,l2 + 5 - 1
+      x2(i2, i1) = c2*10 + c1
+      DO i3=5,l3 + 5 - 1
+        x3(i3, i2, i1) = c3*100 + c2*10 + c1
+        DO i4=5,l4 + 5 - 1
+          x4(i4, i3, i2, i1) = c4*1000 + c3*100 + c2*10 + c1
+          c4 = c4 + 1
+        END DO
+        c3 = c3 + 1
+      END DO
+      c2 = c2 + 1
+    END DO
+    c1 = c1 + 1
+  END DO
+  
+END SUBROUTINE transform_flatten_arrays
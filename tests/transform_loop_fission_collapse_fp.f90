@@ -0,0 +1,22 @@
+SUBROUTINE transform_loop_fission_collapse (a, n)
+  INTEGER, INTENT(OUT) :: a(n, n + 1)
+  INTEGER, INTENT(IN) :: n
+  INTEGER :: j, k, tmp, tmp2
+  
+  tmp = 0
+  DO j=1,n + 1
+    tmp = j
+    tmp2 = 0
+!$loki loop-fission promote( tmp )
+    DO k=1,n
+      tmp2 = tmp + k
+!$loki loop-fission collapse( 2 ) promote( tmp2 )
+      a(k, j) = tmp2
+!$loki loop-fission
+      a(k, j) = a(k, j) - 1
+!$loki loop-fission collapse( 2 )
+      a(k, j) = -1 + a(k, j)
+    END DO
+    tmp = 0
+  END DO
+END SUBROUTINE transform_loop_fission_collapse
@@ -0,0 +1,13 @@
+SUBROUTINE transform_loop_fission_multiple (a, b, c, n)
+  INTEGER, INTENT(OUT) :: a(n), b(n), c(n)
+  INTEGER, INTENT(IN) :: n
+  INTEGER :: j
+  
+  DO j=1,n
+    a(j) = j
+!$loki loop-fission
+    b(j) = n - j
+!$loki loop-fission
+    c(j) = a(j) + b(j)
+  END DO
+END SUBROUTINE transform_loop_fission_multiple
@@ -0,0 +1,24 @@
+SUBROUTINE transform_loop_fission_multiple_promote (a, b, klon, klev, nclv)
+  INTEGER, INTENT(INOUT) :: a(klon, klev), b(klon, klev, nclv)
+  INTEGER, INTENT(IN) :: klon, klev, nclv
+  INTEGER :: jm, jk, jl, zsupsat(klon), zqxn(klon, nclv)
+  
+  DO jk=1,klev
+    zsupsat(:) = 0
+    DO jl=1,klon
+      zsupsat(jl) = jl
+    END DO
+!$loki loop-fission
+    DO jm=1,nclv
+      DO jl=1,klon
+        zqxn(jl, jm) = jm + jl
+      END DO
+    END DO
+!$loki loop-fission promote( ZSUPSAT )
+    a(:, jk) = zsupsat(:)
+!$loki loop-fission promote( zQxN )
+    DO jm=1,nclv
+      b(:, jk, jm) = zqxn(:, jm)
+    END DO
+  END DO
+END SUBROUTINE transform_loop_fission_multiple_promote
@@ -0,0 +1,13 @@
+SUBROUTINE transform_loop_fission_nested (a, b, n)
+  INTEGER, INTENT(OUT) :: a(n), b(n)
+  INTEGER, INTENT(IN) :: n
+  INTEGER :: j, k
+  
+  DO j=1,n + 1
+    IF (j <= n) THEN
+      a(j) = j
+!$loki loop-fission
+      b(j) = n - j
+    END IF
+  END DO
+END SUBROUTINE transform_loop_fission_nested
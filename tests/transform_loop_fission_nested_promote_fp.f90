@@ -0,0 +1,16 @@
+SUBROUTINE transform_loop_fission_nested_promote (a, b, n)
+  INTEGER, INTENT(OUT) :: a(n), b(n)
+  INTEGER, INTENT(IN) :: n
+  INTEGER :: j, k, zqxfg(5)
+  
+  DO j=1,n + 1
+    zqxfg(2) = j
+!$loki loop-fission promote( zqxfg )
+    IF (j <= n) THEN
+      IF (zqxfg(2) <= n) THEN
+        a(j) = zqxfg(2)
+        b(j) = n - zqxfg(2)
+      END IF
+    END IF
+  END DO
+END SUBROUTINE transform_loop_fission_nested_promote
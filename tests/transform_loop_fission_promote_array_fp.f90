@@ -0,0 +1,14 @@
+SUBROUTINE transform_loop_fission_promote_array (a, klon, klev)
+  INTEGER, INTENT(INOUT) :: a(klon, klev)
+  INTEGER, INTENT(IN) :: klon, klev
+  INTEGER :: jk, jl, zsupsat(klon)
+  
+  DO jk=1,klev
+    zsupsat(:) = 0
+    DO jl=1,klon
+      zsupsat(jl) = jl
+    END DO
+!$loki loop-fission promote( ZSUPSAT )
+    a(:, jk) = zsupsat(:)
+  END DO
+END SUBROUTINE transform_loop_fission_promote_array
@@ -0,0 +1,17 @@
+SUBROUTINE transform_loop_fission_promote_conflicting_lengths (a, b, n)
+  INTEGER, INTENT(OUT) :: a(n), b(n + 1)
+  INTEGER, INTENT(IN) :: n
+  INTEGER :: j, tmp
+  
+  DO j=1,n
+    tmp = j - 1
+!$loki loop-fission promote( tmp )
+    a(j) = tmp + 1
+  END DO
+  
+  DO j=1,n + 1
+    tmp = j - 1
+!$loki loop-fission promote( tmp )
+    b(j) = n - tmp
+  END DO
+END SUBROUTINE transform_loop_fission_promote_conflicting_lengths
@@ -0,0 +1,12 @@
+SUBROUTINE transform_loop_fission_promote (a, b, n)
+  INTEGER, INTENT(OUT) :: a(n), b(n)
+  INTEGER, INTENT(IN) :: n
+  INTEGER :: j, tmp
+  
+  DO j=1,n
+    a(j) = j
+    tmp = j - 1
+!$loki loop-fission promote( tmp )
+    b(j) = n - tmp
+  END DO
+END SUBROUTINE transform_loop_fission_promote
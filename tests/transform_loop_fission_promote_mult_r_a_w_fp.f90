@@ -0,0 +1,25 @@
+SUBROUTINE transform_loop_fission_promote_mult_r_a_w (a, b, klon, klev, nclv)
+  INTEGER, INTENT(INOUT) :: a(klon, klev), b(klon, klev, nclv)
+  INTEGER, INTENT(IN) :: klon, klev, nclv
+  INTEGER :: jm, jk, jl, zsupsat(klon), zqxn(nclv, klon)
+  ! Note the shape of zqxn, which is the reverse of the iteration space
+  
+  DO jk=1,klev
+    zsupsat(:) = 0
+    DO jl=1,klon
+      zsupsat(jl) = jl
+    END DO
+!$loki loop-fission
+    DO jm=1,nclv
+      DO jl=1,klon
+        zqxn(jm, jl) = jm + jl
+      END DO
+    END DO
+!$loki loop-fission
+    a(:, jk) = zsupsat(:)
+!$loki loop-fission
+    DO jm=1,nclv
+      b(:, jk, jm) = zqxn(jm, :)
+    END DO
+  END DO
+END SUBROUTINE transform_loop_fission_promote_mult_r_a_w
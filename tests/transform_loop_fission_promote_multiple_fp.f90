@@ -0,0 +1,15 @@
+SUBROUTINE transform_loop_fission_promote_multiple (a, klon, klev)
+  INTEGER, INTENT(INOUT) :: a(klon, klev)
+  INTEGER, INTENT(IN) :: klon, klev
+  INTEGER :: jk, jl, zsupsat(klon), tmp
+  
+  DO jk=1,klev
+    zsupsat(:) = 0
+    DO jl=1,klon
+      zsupsat(jl) = jl
+    END DO
+    tmp = jk
+!$loki loop-fission promote( ZSUPSAT, tmp )
+    a(:, jk) = zsupsat(:) + tmp
+  END DO
+END SUBROUTINE transform_loop_fission_promote_multiple
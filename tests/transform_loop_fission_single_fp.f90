@@ -0,0 +1,11 @@
+SUBROUTINE transform_loop_fission_single (a, b, n)
+  INTEGER, INTENT(OUT) :: a(n), b(n)
+  INTEGER, INTENT(IN) :: n
+  INTEGER :: j
+  
+  DO j=1,n
+    a(j) = j
+!$loki loop-fission
+    b(j) = n - j
+  END DO
+END SUBROUTINE transform_loop_fission_single
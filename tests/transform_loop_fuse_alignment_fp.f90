@@ -0,0 +1,15 @@
+SUBROUTINE transform_loop_fuse_alignment (a, b, n)
+  INTEGER, INTENT(OUT) :: a(n), b(n)
+  INTEGER, INTENT(IN) :: n
+  INTEGER :: i
+  
+!$loki loop-fusion group( 1 )
+  DO i=1,n
+    a(i) = i
+  END DO
+  
+!$loki loop-fusion group( 1 )
+  DO i=0,n - 1
+    b(i + 1) = n - i
+  END DO
+END SUBROUTINE transform_loop_fuse_alignment
@@ -0,0 +1,19 @@
+SUBROUTINE transform_loop_fuse_collapse (a, b, klon, klev)
+  INTEGER, INTENT(INOUT) :: a(klon, klev), b(klon, klev)
+  INTEGER, INTENT(IN) :: klon, klev
+  INTEGER :: jk, jl
+  
+!$loki loop-fusion collapse( 2 )
+  DO jk=1,klev
+    DO jl=1,klon
+      a(jl, jk) = jk
+    END DO
+  END DO
+  
+!$loki loop-fusion collapse( 2 )
+  DO jk=1,klev
+    DO jl=1,klon
+      b(jl, jk) = jl + jk
+    END DO
+  END DO
+END SUBROUTINE transform_loop_fuse_collapse
@@ -0,0 +1,19 @@
+SUBROUTINE transform_loop_fuse_collapse_nonmatching (a, b, klon, klev)
+  INTEGER, INTENT(INOUT) :: a(klon, klev + 1), b(klon + 1, klev)
+  INTEGER, INTENT(IN) :: klon, klev
+  INTEGER :: jk, jl
+  
+!$loki loop-fusion collapse( 2 )
+  DO jk=1,klev + 1
+    DO jl=1,klon
+      a(jl, jk) = jk
+    END DO
+  END DO
+  
+!$loki loop-fusion collapse( 2 )
+  DO jk=1,klev
+    DO jl=1,klon + 1
+      b(jl, jk) = jl + jk
+    END DO
+  END DO
+END SUBROUTINE transform_loop_fuse_collapse_nonmatching
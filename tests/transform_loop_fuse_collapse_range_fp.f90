@@ -0,0 +1,19 @@
+SUBROUTINE transform_loop_fuse_collapse_range (a, b, klon, klev)
+  INTEGER, INTENT(INOUT) :: a(klon, klev + 1), b(klon + 1, klev)
+  INTEGER, INTENT(IN) :: klon, klev
+  INTEGER :: jk, jl, start = 15
+  
+!$loki loop-fusion collapse( 2 )
+  DO jk=1,klev + 1
+    DO jl=1,klon
+      a(jl, jk) = jk
+    END DO
+  END DO
+  
+!$loki loop-fusion collapse( 2 ) range( 1:1+klev,1:klon+1 )
+  DO jk=start,klev
+    DO jl=1,klon + 1
+      b(jl, jk) = jl + jk
+    END DO
+  END DO
+END SUBROUTINE transform_loop_fuse_collapse_range
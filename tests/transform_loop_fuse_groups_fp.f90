@@ -0,0 +1,32 @@
+SUBROUTINE transform_loop_fuse_groups (a, b, c, n)
+  INTEGER, INTENT(OUT) :: a(n), b(n), c(n)
+  INTEGER, INTENT(IN) :: n
+  INTEGER :: i
+  
+  c(1) = 1
+  
+!$loki loop-fusion group( g1 )
+  DO i=1,n
+    a(i) = i
+  END DO
+  
+!$loki loop-fusion group( g1 )
+  DO i=1,n
+    b(i) = n - i + 1
+  END DO
+  
+!$loki loop-fusion group( loop-group2 )
+  DO i=1,n
+    a(i) = a(i) + 1
+  END DO
+  
+!$loki loop-fusion group( loop-group2 )
+  DO i=1,n
+    b(i) = b(i) + 1
+  END DO
+  
+!$loki loop-fusion group( g1 ) range( 1:n )
+  DO i=2,n
+    c(i) = c(i - 1) + 1
+  END DO
+END SUBROUTINE transform_loop_fuse_groups
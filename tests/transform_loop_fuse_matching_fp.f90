@@ -0,0 +1,15 @@
+SUBROUTINE transform_loop_fuse_matching (a, b, n)
+  INTEGER, INTENT(OUT) :: a(n), b(n)
+  INTEGER, INTENT(IN) :: n
+  INTEGER :: i
+  
+!$loki loop-fusion
+  DO i=1,n
+    a(i) = i
+  END DO
+  
+!$loki loop-fusion
+  DO i=1,n
+    b(i) = n - i + 1
+  END DO
+END SUBROUTINE transform_loop_fuse_matching
@@ -0,0 +1,15 @@
+SUBROUTINE transform_loop_fuse_nonmatching_lower_annotated (a, b, nclv, klev)
+  INTEGER, INTENT(OUT) :: a(klev), b(klev)
+  INTEGER, INTENT(IN) :: nclv, klev
+  INTEGER :: jl
+  
+!$loki loop-fusion group( 1 )
+  DO jl=1,klev
+    a(jl) = jl
+  END DO
+  
+!$loki loop-fusion group( 1 ) range( 1:klev )
+  DO jl=nclv,klev
+    b(jl) = jl - nclv
+  END DO
+END SUBROUTINE transform_loop_fuse_nonmatching_lower_annotated
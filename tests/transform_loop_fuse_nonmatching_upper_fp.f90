@@ -0,0 +1,15 @@
+SUBROUTINE transform_loop_fuse_nonmatching_upper (a, b, klev)
+  INTEGER, INTENT(OUT) :: a(klev), b(klev + 1)
+  INTEGER, INTENT(IN) :: klev
+  INTEGER :: jl
+  
+!$loki loop-fusion group( 1 )
+  DO jl=1,klev
+    a(jl) = jl
+  END DO
+  
+!$loki loop-fusion group( 1 )
+  DO jl=1,klev + 1
+    b(jl) = 2*jl
+  END DO
+END SUBROUTINE transform_loop_fuse_nonmatching_upper
@@ -0,0 +1,23 @@
+SUBROUTINE transform_loop_fuse_subranges (a, b, n)
+  INTEGER, INTENT(OUT) :: a(n), b(n)
+  INTEGER, INTENT(IN) :: n
+  INTEGER :: i, j
+  
+  a(:) = 0
+  b(:) = 0
+  
+!$loki loop-fusion
+  DO i=1,n
+    a(i) = a(i) + i
+  END DO
+  
+!$loki loop-fusion range( 1:n )
+  DO j=1,15
+    b(j) = b(j) + n - j + 1
+  END DO
+  
+!$loki loop-fusion range( 1:n )
+  DO i=16,n
+    b(i) = b(i) + n - i + 1
+  END DO
+END SUBROUTINE transform_loop_fuse_subranges
@@ -0,0 +1,21 @@
+SUBROUTINE transform_loop_fusion_fission (a, b, klon, klev)
+  INTEGER, INTENT(INOUT) :: a(klon, klev), b(klon, klev)
+  INTEGER, INTENT(IN) :: klon, klev
+  INTEGER :: jk, jl, zsupsat(klon)
+  
+!$loki loop-fusion
+  DO jk=1,klev
+    DO jl=1,klon
+      a(jl, jk) = jk
+    END DO
+  END DO
+  
+!$loki loop-fusion
+  DO jk=1,klev
+    DO jl=1,klon
+      zsupsat(jl) = jl
+    END DO
+!$loki loop-fission promote( zsupsat )
+    b(:, jk) = a(:, jk) + zsupsat(:)
+  END DO
+END SUBROUTINE transform_loop_fusion_fission
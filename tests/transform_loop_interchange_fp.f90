@@ -0,0 +1,26 @@
+SUBROUTINE transform_loop_interchange (a, m, n, nclv)
+  INTEGER, INTENT(OUT) :: a(m, n, nclv)
+  INTEGER, INTENT(IN) :: m, n, nclv
+  INTEGER :: i, j, k
+  
+!$loki loop-interchange( j, i, k )
+!$loki some-pragma
+  DO k=1,nclv
+!$loki more-pragma
+    DO i=1,n
+!$loki other-pragma
+      DO j=1,m
+        a(j, i, k) = i + j + k
+      END DO
+    END DO
+  END DO
+  
+  ! This loop is to make sure everything else stays as is
+  DO k=1,nclv
+    DO i=1,n
+      DO j=1,m
+        a(j, i, k) = a(j, i, k) - 3
+      END DO
+    END DO
+  END DO
+END SUBROUTINE transform_loop_interchange
@@ -0,0 +1,19 @@
+SUBROUTINE transform_loop_interchange_plain (a, m, n)
+  INTEGER, INTENT(OUT) :: a(m, n)
+  INTEGER, INTENT(IN) :: m, n
+  INTEGER :: i, j
+  
+!$loki loop-interchange
+  DO i=1,n
+    DO j=1,m
+      a(j, i) = i + j
+    END DO
+  END DO
+  
+  ! This loop is to make sure everything else stays as is
+  DO i=1,n
+    DO j=1,m
+      a(j, i) = a(j, i) - 2
+    END DO
+  END DO
+END SUBROUTINE transform_loop_interchange_plain
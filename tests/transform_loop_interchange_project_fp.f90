@@ -0,0 +1,12 @@
+SUBROUTINE transform_loop_interchange_project (a, m, n)
+  INTEGER, INTENT(INOUT) :: a(m, n)
+  INTEGER, INTENT(IN) :: m, n
+  INTEGER :: i, j
+  
+!$loki loop-interchange
+  DO i=1,n
+    DO j=i,m
+      a(j, i) = i + j
+    END DO
+  END DO
+END SUBROUTINE transform_loop_interchange_project
@@ -0,0 +1,11 @@
+SUBROUTINE transform_promote_variable_scalar (ret)
+  IMPLICIT NONE
+  INTEGER, INTENT(OUT) :: ret
+  INTEGER :: tmp, jk
+  
+  ret = 0
+  DO jk=1,10
+    tmp = jk
+    ret = ret + tmp
+  END DO
+END SUBROUTINE transform_promote_variable_scalar
@@ -0,0 +1,27 @@
+SUBROUTINE transform_promote_variables (scalar, vector, n)
+  IMPLICIT NONE
+  INTEGER, INTENT(IN) :: n
+  INTEGER, INTENT(INOUT) :: scalar, vector(n)
+  INTEGER :: tmp_scalar, tmp_vector(n), tmp_matrix(n, n)
+  INTEGER :: jl, jk
+  
+  DO jl=1,n
+    ! a bit of a hack to create initialized meaningful output
+    tmp_vector(:) = 0
+  END DO
+  
+  DO jl=1,n
+    tmp_scalar = jl
+    tmp_vector(jl) = jl
+    
+    DO jk=1,n
+      tmp_matrix(jk, jl) = jl + jk
+    END DO
+  END DO
+  
+  scalar = 0
+  DO jl=1,n
+    scalar = scalar + tmp_scalar
+    vector = tmp_matrix(:, jl) + tmp_vector(:)
+  END DO
+END SUBROUTINE transform_promote_variables
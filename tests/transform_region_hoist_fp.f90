@@ -0,0 +1,15 @@
+SUBROUTINE transform_region_hoist (a, b, c)
+  INTEGER, INTENT(OUT) :: a, b, c
+  
+  a = 5
+  
+!$loki region-hoist target
+  
+  a = 1
+  
+!$loki region-hoist
+  b = a
+!$loki end region-hoist
+  
+  c = a + b
+END SUBROUTINE transform_region_hoist
@@ -0,0 +1,29 @@
+SUBROUTINE transform_region_hoist_inlined_pragma (a, b, klon, klev)
+  INTEGER, INTENT(INOUT) :: a(klon, klev), b(klon, klev)
+  INTEGER, INTENT(IN) :: klon, klev
+  INTEGER :: jk, jl
+  
+!$loki region-hoist target
+  
+  DO jl=1,klon
+    a(jl, 1) = jl
+  END DO
+  
+  DO jk=2,klev
+    DO jl=1,klon
+      a(jl, jk) = a(jl, jk - 1)
+    END DO
+  END DO
+  
+!$loki region-hoist
+  DO jk=1,klev
+    b(1, jk) = jk
+  END DO
+!$loki end region-hoist
+  
+  DO jk=1,klev
+    DO jl=2,klon
+      b(jl, jk) = b(jl - 1, jk)
+    END DO
+  END DO
+END SUBROUTINE transform_region_hoist_inlined_pragma
@@ -0,0 +1,23 @@
+SUBROUTINE transform_region_hoist_multiple (a, b, c)
+  INTEGER, INTENT(OUT) :: a, b, c
+  
+  a = 1
+  
+!$loki region-hoist target
+!$loki region-hoist target group( some-group )
+  
+  a = a + 1
+  a = a + 1
+!$loki region-hoist group( some-group )
+  a = a + 1
+!$loki end region-hoist
+  a = a + 1
+  
+!$loki region-hoist
+  b = a
+!$loki end region-hoist
+  
+!$loki region-hoist group( some-group )
+  c = a + b
+!$loki end region-hoist
+END SUBROUTINE transform_region_hoist_multiple
@@ -0,0 +1,34 @@
+SUBROUTINE transform_region_hoist_promote (a, b, klon, klev)
+  INTEGER, INTENT(INOUT) :: a(klon, klev), b(klon, klev)
+  INTEGER, INTENT(IN) :: klon, klev
+  INTEGER :: jk, jl, b_tmp
+  
+!$loki region-hoist target
+  
+  DO jl=1,klon
+    a(jl, 1) = jl
+  END DO
+  
+  DO jk=2,klev
+    DO jl=1,klon
+      a(jl, jk) = a(jl, jk - 1)
+    END DO
+  END DO
+  
+  DO jk=1,4
+    b(1, jk) = jk
+  END DO
+  
+  DO jk=5,klev
+!$loki region-hoist collapse( 1 ) promote( b_tmp )
+    b_tmp = jk + 1
+!$loki end region-hoist
+    b(1, jk) = b_tmp - 1
+  END DO
+  
+  DO jk=1,klev
+    DO jl=2,klon
+      b(jl, jk) = b(jl - 1, jk)
+    END DO
+  END DO
+END SUBROUTINE transform_region_hoist_promote
@@ -0,0 +1,20 @@
+SUBROUTINE transform_region_to_call_arguments (a, b, c)
+  INTEGER, INTENT(OUT) :: a, b, c
+  
+  a = 1
+  a = a + 1
+  a = a + 1
+!$loki region-to-call name( func_a )
+  a = a + 1
+!$loki end region-to-call
+  a = a + 1
+  
+!$loki region-to-call name( func_b )
+  b = a
+!$loki end region-to-call
+  
+  ! partially override arguments
+!$loki region-to-call name( func_c ) inout( b )
+  c = a + b
+!$loki end region-to-call
+END SUBROUTINE transform_region_to_call_arguments
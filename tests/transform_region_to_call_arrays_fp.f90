@@ -0,0 +1,24 @@
+SUBROUTINE transform_region_to_call_arrays (a, b, n)
+  INTEGER, INTENT(OUT) :: a(n), b(n)
+  INTEGER, INTENT(IN) :: n
+  INTEGER :: j
+  
+!$loki region-to-call
+  DO j=1,n
+    a(j) = j
+  END DO
+!$loki end region-to-call
+  
+!$loki region-to-call
+  DO j=1,n
+    b(j) = j
+  END DO
+!$loki end region-to-call
+  
+!$loki region-to-call
+  DO j=1,n - 1
+    b(j) = b(j + 1) - a(j)
+  END DO
+  b(n) = 1
+!$loki end region-to-call
+END SUBROUTINE transform_region_to_call_arrays
@@ -0,0 +1,12 @@
+SUBROUTINE transform_region_to_call (a, b, c)
+  INTEGER, INTENT(OUT) :: a, b, c
+  
+  a = 5
+  a = 1
+  
+!$loki region-to-call in( a ) out( b )
+  b = a
+!$loki end region-to-call
+  
+  c = a + b
+END SUBROUTINE transform_region_to_call
@@ -0,0 +1,19 @@
+SUBROUTINE transform_region_to_call_multiple (a, b, c)
+  INTEGER, INTENT(OUT) :: a, b, c
+  
+  a = 1
+  a = a + 1
+  a = a + 1
+!$loki region-to-call name( oiwjfklsf ) inout( a )
+  a = a + 1
+!$loki end region-to-call
+  a = a + 1
+  
+!$loki region-to-call in( a ) out( b )
+  b = a
+!$loki end region-to-call
+  
+!$loki region-to-call in( a,b ) out( c )
+  c = a + b
+!$loki end region-to-call
+END SUBROUTINE transform_region_to_call_multiple
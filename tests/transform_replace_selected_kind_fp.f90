@@ -0,0 +1,14 @@
+SUBROUTINE transform_replace_selected_kind (i, a)
+  USE iso_fortran_env, ONLY: int8
+  IMPLICIT NONE
+  INTEGER, PARAMETER :: jprm = SELECTED_REAL_KIND(6, 37)
+  INTEGER(KIND=SELECTED_INT_KIND(9)), INTENT(OUT) :: i
+  REAL(KIND=SELECTED_REAL_KIND(13, 300)), INTENT(OUT) :: a
+  INTEGER(KIND=int8) :: j = 1
+  INTEGER(KIND=SELECTED_INT_KIND(1)) :: k = 9
+  REAL(KIND=SELECTED_REAL_KIND(7)) :: b = 5._jprm
+  REAL(KIND=SELECTED_REAL_KIND(r=2, p=4)) :: c = 1.
+  
+  i = j + k
+  a = b + c + REAL(4, kind=SELECTED_REAL_KIND(6, r=37))
+END SUBROUTINE transform_replace_selected_kind
@@ -0,0 +1,9 @@
+MODULE transformation_module_post_apply
+  INTEGER :: i = 0
+  CONTAINS
+  SUBROUTINE test_post_apply (ret)
+    INTEGER, INTENT(OUT) :: ret
+    i = i + 1
+    ret = i
+  END SUBROUTINE test_post_apply
+END MODULE transformation_module_post_apply
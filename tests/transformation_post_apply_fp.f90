@@ -0,0 +1,4 @@
+SUBROUTINE transformation_post_apply (i)
+  INTEGER, INTENT(OUT) :: i
+  i = 1
+END SUBROUTINE transformation_post_apply
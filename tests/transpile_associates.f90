@@ -0,0 +1,11 @@
+SUBROUTINE transpile_associates (a_struct)
+  USE transpile_type_mod, ONLY: my_struct
+  IMPLICIT NONE
+  TYPE(my_struct), INTENT(INOUT) :: a_struct
+  
+  ASSOCIATE (a_struct_a=>a_struct%a, a_struct_b=>a_struct%b, a_struct_c=>a_struct%c)
+  a_struct%a = a_struct_a + 4.
+  a_struct_b = a_struct%b + 5.
+  a_struct_c = a_struct_a + a_struct%b + a_struct_c
+  END ASSOCIATE
+END SUBROUTINE transpile_associates
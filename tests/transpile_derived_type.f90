@@ -0,0 +1,9 @@
+SUBROUTINE transpile_derived_type (a_struct)
+  USE transpile_type_mod, ONLY: my_struct
+  IMPLICIT NONE
+  TYPE(my_struct), INTENT(INOUT) :: a_struct
+  
+  a_struct%a = a_struct%a + 4
+  a_struct%b = a_struct%b + 5.
+  a_struct%c = a_struct%c + 6.
+END SUBROUTINE transpile_derived_type
@@ -0,0 +1,14 @@
+SUBROUTINE transpile_expressions (n, scalar, vector)
+  USE iso_fortran_env, ONLY: real64
+  IMPLICIT NONE
+  INTEGER, INTENT(IN) :: n
+  REAL(KIND=real64), INTENT(IN) :: scalar
+  REAL(KIND=real64), INTENT(INOUT) :: vector(n)
+  
+  INTEGER :: i
+  
+  vector(1) = scalar
+  DO i=2,n
+    vector(i) = vector(i - 1) - (-scalar)
+  END DO
+END SUBROUTINE transpile_expressions
@@ -0,0 +1,9 @@
+SUBROUTINE transpile_inline_elementals_recursive (v1, v2, v3)
+  USE iso_fortran_env, ONLY: real64
+  USE multiply_plus_one_mod, ONLY: multiply_plus_one
+  REAL(KIND=real64), INTENT(IN) :: v1
+  REAL(KIND=real64), INTENT(OUT) :: v2, v3
+  
+  v2 = multiply_plus_one(v1, 6._real64)
+  v3 = 600. + multiply_plus_one(5._real64, 11._real64)
+END SUBROUTINE transpile_inline_elementals_recursive
@@ -0,0 +1,12 @@
+SUBROUTINE transpile_intrinsics (v1, v2, v3, v4, vmin, vmax, vabs, vmin_nested, vmax_nested)
+  ! Test supported intrinsic functions
+  USE iso_fortran_env, ONLY: real64
+  REAL(KIND=real64), INTENT(IN) :: v1, v2, v3, v4
+  REAL(KIND=real64), INTENT(OUT) :: vmin, vmax, vabs, vmin_nested, vmax_nested
+  
+  vmin = MIN(v1, v2)
+  vmax = MAX(v1, v2)
+  vabs = ABS(v1 - v2)
+  vmin_nested = MIN(MIN(v1, v2), MIN(v3, v4))
+  vmax_nested = MAX(MAX(v1, v2), MAX(v3, v4))
+END SUBROUTINE transpile_intrinsics
@@ -0,0 +1,12 @@
+SUBROUTINE transpile_logical_statements (v1, v2, v_xor, v_xnor, v_nand, v_neqv, v_val)
+  LOGICAL, INTENT(IN) :: v1, v2
+  LOGICAL, INTENT(OUT) :: v_xor, v_nand, v_xnor, v_neqv, v_val(2)
+  
+  v_xor = v1 .and. .not.v2 .or. .not.v1 .and. v2
+  v_xnor = v1 .and. v2 .or. .not.(v1 .or. v2)
+  v_nand = .not.(v1 .and. v2)
+  v_neqv = .not.(v1 .and. v2) .and. (v1 .or. v2)
+  v_val(1) = .true.
+  v_val(2) = .false.
+  
+END SUBROUTINE transpile_logical_statements
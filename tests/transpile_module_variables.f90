@@ -0,0 +1,12 @@
+SUBROUTINE transpile_module_variables (a, b, c)
+  USE iso_fortran_env, ONLY: real32, real64
+  USE transpile_type_mod, ONLY: PARAM1, param2, param3
+  
+  INTEGER, INTENT(OUT) :: a
+  REAL(KIND=real32), INTENT(OUT) :: b
+  REAL(KIND=real64), INTENT(OUT) :: c
+  
+  a = 1 + PARAM1    ! Ensure downcasing is done right
+  b = 1. + param2
+  c = 1. + param3
+END SUBROUTINE transpile_module_variables
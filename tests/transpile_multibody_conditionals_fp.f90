@@ -0,0 +1,21 @@
+SUBROUTINE transpile_multibody_conditionals (in1, out1, out2)
+  INTEGER, INTENT(IN) :: in1
+  INTEGER, INTENT(OUT) :: out1, out2
+  
+  IF (in1 > 5) THEN
+    out1 = 5
+  ELSE
+    out1 = 1
+  END IF
+  
+  IF (in1 < 0) THEN
+    out2 = 0
+  ELSE IF (in1 > 5) THEN
+    out2 = 6
+    out2 = out2 - 1
+  ELSE IF (3 < in1 .and. in1 <= 5) THEN
+    out2 = 4
+  ELSE
+    out2 = in1
+  END IF
+END SUBROUTINE transpile_multibody_conditionals
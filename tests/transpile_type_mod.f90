@@ -0,0 +1,10 @@
+MODULE transpile_type_mod
+  USE iso_fortran_env, ONLY: real32, real64
+  IMPLICIT NONE
+  
+  TYPE my_struct
+    INTEGER :: a
+    REAL(KIND=real32) :: b
+    REAL(KIND=real64) :: c
+  END TYPE my_struct
+END MODULE transpile_type_mod